@@ -4,17 +4,27 @@ Detects groups of images taken in rapid succession (bursts) based on
 timestamps and camera metadata. No ML required - pure algorithmic approach.
 """
 
+import heapq
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from itertools import groupby
+from operator import attrgetter
+from typing import Iterable, Iterator, List, Optional
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageInfo:
-    """Information about an image for burst detection."""
+    """Information about an image for burst detection.
+
+    Field order matches the burst candidate query's column order, so rows
+    can be passed positionally. Slots keep per-image memory small since
+    whole catalogs are loaded at once.
+    """
 
     image_id: str
     timestamp: datetime
@@ -50,7 +60,7 @@ class ImageInfo:
         return self.latitude is not None and self.longitude is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class BurstGroup:
     """A group of images forming a burst sequence."""
 
@@ -142,11 +152,16 @@ class BurstDetector:
         self.min_duration_seconds = min_duration_seconds
         self.visual_similarity_threshold = visual_similarity_threshold
 
-    def detect_bursts(self, images: List[ImageInfo]) -> List[BurstGroup]:
+    def detect_bursts(
+        self, images: List[ImageInfo], presorted: bool = False
+    ) -> List[BurstGroup]:
         """Detect burst sequences in a list of images.
 
         Args:
             images: List of ImageInfo objects (will be sorted internally)
+            presorted: Images are already grouped by camera and ordered by
+                       timestamp within each camera (e.g. by the SQL query),
+                       so skip the per-camera grouping and sort
 
         Returns:
             List of detected BurstGroups
@@ -154,6 +169,43 @@ class BurstDetector:
         if len(images) < self.min_burst_size:
             return []
 
+        # Merge the already-ordered per-camera lists by start time
+        all_bursts = list(
+            heapq.merge(
+                *self.iter_camera_bursts(images, presorted),
+                key=lambda b: b.start_time or datetime.min,
+            )
+        )
+
+        logger.info(f"Detected {len(all_bursts)} bursts from {len(images)} images")
+        return all_bursts
+
+    def iter_camera_bursts(
+        self, images: Iterable[ImageInfo], presorted: bool = False
+    ) -> Iterator[List[BurstGroup]]:
+        """Detect bursts one camera at a time.
+
+        Lets callers start persisting one camera's bursts while the next
+        camera is still being analyzed.
+
+        Args:
+            images: ImageInfo objects (will be sorted internally)
+            presorted: Images are already grouped by camera and ordered by
+                       timestamp within each camera, so skip the per-camera
+                       grouping and sort (the input is then only streamed)
+
+        Yields:
+            Each camera's BurstGroups, in time order
+        """
+        if presorted:
+            # Each camera's images are contiguous, so stream the groups
+            # rather than bucketing the whole input first
+            for _camera_key, camera_images in groupby(
+                images, key=attrgetter("camera_key")
+            ):
+                yield self._find_sequences(list(camera_images))
+            return
+
         # Group by camera first
         by_camera: dict = {}
         for img in images:
@@ -162,22 +214,12 @@ class BurstDetector:
                 by_camera[key] = []
             by_camera[key].append(img)
 
-        all_bursts: List[BurstGroup] = []
-
         # Process each camera's images
         for _camera_key, camera_images in by_camera.items():
-            # Sort by timestamp
             sorted_images = sorted(camera_images, key=lambda x: x.timestamp)
 
             # Find burst sequences
-            bursts = self._find_sequences(sorted_images)
-            all_bursts.extend(bursts)
-
-        # Sort bursts by start time
-        all_bursts.sort(key=lambda b: b.start_time or datetime.min)
-
-        logger.info(f"Detected {len(all_bursts)} bursts from {len(images)} images")
-        return all_bursts
+            yield self._find_sequences(sorted_images)
 
     def _is_same_location(self, img1: ImageInfo, img2: ImageInfo) -> bool:
         """Check if two images are from the same location.
@@ -326,6 +368,31 @@ class BurstDetector:
         except ValueError:
             return True  # Can't parse numbers - allow it
 
+    def _within_gap_threshold(self, sorted_images: List[ImageInfo]) -> List[bool]:
+        """Check every consecutive time gap against the threshold at once.
+
+        Args:
+            sorted_images: Images sorted by timestamp
+
+        Returns:
+            Flags where entry i is True if images i and i+1 are close enough
+        """
+        # numpy datetime64 has no timezone support, so normalize aware
+        # timestamps to naive UTC (naive ones are used as-is)
+        timestamps = np.array(
+            [
+                (
+                    img.timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+                    if img.timestamp.tzinfo is not None
+                    else img.timestamp
+                )
+                for img in sorted_images
+            ],
+            dtype="datetime64[us]",
+        )
+        gaps = np.diff(timestamps) / np.timedelta64(1, "s")
+        return (gaps <= self.gap_threshold_seconds).tolist()
+
     def _find_sequences(self, sorted_images: List[ImageInfo]) -> List[BurstGroup]:
         """Find burst sequences in time-sorted images from same camera.
 
@@ -347,32 +414,33 @@ class BurstDetector:
 
         bursts: List[BurstGroup] = []
         current_sequence: List[ImageInfo] = [sorted_images[0]]
-
-        for i in range(1, len(sorted_images)):
-            current_img = sorted_images[i]
-            prev_img = sorted_images[i - 1]
-
-            # Check all burst criteria
-            time_gap = (current_img.timestamp - prev_img.timestamp).total_seconds()
-            same_location = self._is_same_location(prev_img, current_img)
-            sequential_files = self._is_sequential_filename(prev_img, current_img)
-            matching_metadata = self._has_matching_metadata(prev_img, current_img)
-            visually_similar = self._is_visually_similar(prev_img, current_img)
-
-            # All criteria must be met
+        within_gap = self._within_gap_threshold(sorted_images)
+
+        # Bind the per-pair checks once; this loop runs for every image
+        same_location = self._is_same_location
+        sequential_filename = self._is_sequential_filename
+        matching_metadata = self._has_matching_metadata
+        visually_similar = self._is_visually_similar
+        add_to_sequence = current_sequence.append
+
+        for prev_img, current_img, close_in_time in zip(
+            sorted_images, sorted_images[1:], within_gap
+        ):
+            # All criteria must be met; the precomputed time gap goes first so
+            # the costlier checks only run for images close together in time
             if (
-                time_gap <= self.gap_threshold_seconds
-                and same_location
-                and sequential_files
-                and matching_metadata
-                and visually_similar
+                close_in_time
+                and same_location(prev_img, current_img)
+                and sequential_filename(prev_img, current_img)
+                and matching_metadata(prev_img, current_img)
+                and visually_similar(prev_img, current_img)
             ):
                 # Continue current sequence
-                current_sequence.append(current_img)
+                add_to_sequence(current_img)
             else:
                 # Criteria not met - check if current sequence is a burst
                 if len(current_sequence) >= self.min_burst_size:
-                    burst = BurstGroup(images=list(current_sequence))
+                    burst = BurstGroup(images=current_sequence)
                     # Only include bursts with sufficient duration
                     # (filters out groups with identical timestamps)
                     if burst.duration_seconds >= self.min_duration_seconds:
@@ -381,10 +449,11 @@ class BurstDetector:
 
                 # Start new sequence
                 current_sequence = [current_img]
+                add_to_sequence = current_sequence.append
 
         # Don't forget the last sequence
         if len(current_sequence) >= self.min_burst_size:
-            burst = BurstGroup(images=list(current_sequence))
+            burst = BurstGroup(images=current_sequence)
             # Only include bursts with sufficient duration
             if burst.duration_seconds >= self.min_duration_seconds:
                 burst.best_image_id = self.select_best_image(burst).image_id
@@ -414,4 +483,4 @@ class BurstDetector:
         elif method == "middle":
             return group.images[len(group.images) // 2]
         else:  # quality (default)
-            return max(group.images, key=lambda img: img.quality_score)
+            return max(group.images, key=attrgetter("quality_score"))
@@ -4,9 +4,12 @@ Detects groups of images taken in rapid succession (bursts) based on
 timestamps and camera metadata. Pure algorithmic approach - no ML.
 """
 
-from datetime import datetime
+import math
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 
 def detect_bursts(
     images: List[Dict[str, Any]],
@@ -45,14 +48,21 @@ def detect_bursts(
     all_bursts = []
 
     for _camera, camera_images in by_camera.items():
-        # Sort by timestamp
-        sorted_imgs = sorted(
-            camera_images,
-            key=lambda x: x.get("timestamp") or datetime.min,
+        if len(camera_images) < min_size:
+            continue
+
+        # Sort by timestamp (missing timestamps first), converting each once
+        keyed = sorted(
+            ((_epoch_seconds(img.get("timestamp")), img) for img in camera_images),
+            key=lambda pair: -math.inf if math.isnan(pair[0]) else pair[0],
         )
+        seconds = np.fromiter((t for t, _ in keyed), dtype=np.float64, count=len(keyed))
+        sorted_imgs = [img for _, img in keyed]
 
         # Find sequences
-        bursts = _find_sequences(sorted_imgs, gap_threshold, min_size, min_duration)
+        bursts = _find_sequences(
+            sorted_imgs, seconds, gap_threshold, min_size, min_duration
+        )
         all_bursts.extend(bursts)
 
     return all_bursts
@@ -79,46 +89,50 @@ def _metadata_matches(img1: Dict[str, Any], img2: Dict[str, Any]) -> bool:
     return True
 
 
+def _epoch_seconds(ts: Optional[datetime]) -> float:
+    """Convert a timestamp to POSIX seconds, NaN when missing.
+
+    Naive timestamps are read as UTC so gaps match plain datetime
+    subtraction (no local-time DST shifts).
+    """
+    if not ts:
+        return math.nan
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.timestamp()
+
+
 def _find_sequences(
     sorted_images: List[Dict[str, Any]],
+    seconds: np.ndarray,
     gap_threshold: float,
     min_size: int,
     min_duration: float,
 ) -> List[Dict[str, Any]]:
-    """Find burst sequences in time-sorted images."""
-    if len(sorted_images) < min_size:
+    """Find burst sequences in time-sorted images.
+
+    All consecutive gaps are computed from the images' float seconds (see
+    _epoch_seconds) in a single vectorized diff. Missing timestamps are
+    NaN, which never passes the threshold. Shooting metadata is only
+    compared for pairs that are close enough in time.
+    """
+    n = len(sorted_images)
+    if n < min_size:
         return []
 
+    close = np.diff(seconds) <= gap_threshold
+    for i in np.flatnonzero(close).tolist():
+        if not _metadata_matches(sorted_images[i], sorted_images[i + 1]):
+            close[i] = False
+
+    bounds = [0, *(np.flatnonzero(~close) + 1).tolist(), n]
+
     bursts = []
-    current: List[Dict[str, Any]] = [sorted_images[0]]
-
-    for i in range(1, len(sorted_images)):
-        curr_img = sorted_images[i]
-        prev_img = sorted_images[i - 1]
-
-        curr_ts = curr_img.get("timestamp")
-        prev_ts = prev_img.get("timestamp")
-
-        if curr_ts and prev_ts:
-            gap = (curr_ts - prev_ts).total_seconds()
-        else:
-            gap = float("inf")
-
-        if gap <= gap_threshold and _metadata_matches(prev_img, curr_img):
-            current.append(curr_img)
-        else:
-            # End of sequence - check if it's a valid burst
-            if len(current) >= min_size:
-                burst = _make_burst(current, min_duration)
-                if burst:
-                    bursts.append(burst)
-            current = [curr_img]
-
-    # Check final sequence
-    if len(current) >= min_size:
-        burst = _make_burst(current, min_duration)
-        if burst:
-            bursts.append(burst)
+    for left, right in zip(bounds, bounds[1:]):
+        if right - left >= min_size:
+            burst = _make_burst(sorted_images[left:right], min_duration)
+            if burst:
+                bursts.append(burst)
 
     return bursts
 
@@ -127,18 +141,17 @@ def _make_burst(
     images: List[Dict[str, Any]],
     min_duration: float,
 ) -> Optional[Dict[str, Any]]:
-    """Create a burst dict if it meets duration requirement."""
-    if len(images) < 2:
-        return None
+    """Create a burst dict if it meets duration requirement.
 
-    timestamps: List[datetime] = [
-        img["timestamp"] for img in images if img.get("timestamp") is not None
-    ]
-    if len(timestamps) < 2:
+    Images must be a time-sorted run in which every consecutive pair has
+    timestamps (as built by _find_sequences), so the first and last
+    images bound the burst.
+    """
+    if len(images) < 2:
         return None
 
-    start = min(timestamps)
-    end = max(timestamps)
+    start: datetime = images[0]["timestamp"]
+    end: datetime = images[-1]["timestamp"]
     duration = (end - start).total_seconds()
 
     if duration < min_duration:
@@ -174,5 +187,6 @@ def select_best_in_burst(
     elif method == "middle":
         return images[len(images) // 2]["id"]
     else:  # quality
+        # One O(N) pass; scores may be missing or None, so no itemgetter
         best = max(images, key=lambda x: x.get("quality_score") or 0)
         return best["id"]
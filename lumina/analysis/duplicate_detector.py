@@ -33,6 +33,7 @@ from ..core.types import (
     SimilarityMetrics,
 )
 from ..db import CatalogDB as CatalogDatabase
+from ..shared.parallel import pool_chunksize
 from .perceptual_hash import (
     HashMethod,
     combined_hash,
@@ -438,7 +439,7 @@ class DuplicateDetector:
                 else:
                     # Parallel processing using multiprocessing pool
                     pool = mp.Pool(processes=num_workers)
-                    chunk_size = max(1, len(images_to_process) // (num_workers * 4))
+                    chunk_size = pool_chunksize(len(images_to_process), num_workers)
                     results_iter = pool.imap_unordered(
                         _compute_hash_worker, worker_args, chunk_size
                     )
@@ -581,7 +582,7 @@ class DuplicateDetector:
             else:
                 # Parallel processing using multiprocessing pool
                 pool = mp.Pool(processes=num_workers)
-                chunk_size = max(1, len(videos_to_process) // (num_workers * 4))
+                chunk_size = pool_chunksize(len(videos_to_process), num_workers)
                 results_iter = pool.imap_unordered(
                     _compute_video_hash_worker, worker_args, chunk_size
                 )
@@ -6,9 +6,54 @@ without database access or progress tracking.
 """
 
 from collections import defaultdict
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-from .hashing import hamming_distance
+import numpy as np
+
+from .hashing import HashValue, _hash_int, hamming_distance
+
+# Widest hash (in hex characters) that fits a uint64 lane
+_MAX_PACKED_HEX = 16
+
+# Largest bucket compared as a full distance matrix in one step
+_MATRIX_BUCKET_SIZE = 256
+
+# SWAR popcount masks
+_M1 = np.uint64(0x5555555555555555)
+_M2 = np.uint64(0x3333333333333333)
+_M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+
+# Compiled pair kernel: None until first use, False if numba is unavailable
+_pairs_kernel: Any = None
+
+
+def _pack_hashes(hashes: Iterable[HashValue]) -> Optional[np.ndarray]:
+    """Parse hashes once into a uint64 array.
+
+    Args:
+        hashes: Hex hash strings of the same length, or 64-bit integer
+            hashes (signed BIGINT values are reinterpreted as unsigned)
+
+    Returns:
+        Array of hash values, or None if the hashes are wider than 64 bits
+
+    Raises:
+        ValueError: If hex hash lengths don't match
+    """
+    values = list(hashes)
+    lengths = {len(h) for h in values if isinstance(h, str)}
+    if len(lengths) > 1:
+        raise ValueError(f"Hash length mismatch: {sorted(lengths)}")
+    if lengths and lengths.pop() > _MAX_PACKED_HEX:
+        return None
+    return np.fromiter(
+        (_hash_int(h) for h in values), dtype=np.uint64, count=len(values)
+    )
+
+
+def _hash_width(value: HashValue) -> int:
+    """Return the width in bits of a hex or integer hash."""
+    return len(value) * 4 if isinstance(value, str) else 64
 
 
 def group_by_exact_match(
@@ -17,12 +62,14 @@ def group_by_exact_match(
 ) -> List[Dict[str, Any]]:
     """Group images by exact checksum match.
 
+    Single pass over the images; groups come out in first-seen order.
+
     Args:
         images: List of image dicts with checksum field
         checksum_key: Key for checksum in image dict
 
     Returns:
-        List of group dicts with image_ids and similarity_type
+        List of group dicts with image_ids, checksum and similarity_type
     """
     by_checksum: Dict[str, List[str]] = defaultdict(list)
 
@@ -31,104 +78,295 @@ def group_by_exact_match(
         if checksum:
             by_checksum[checksum].append(img["id"])
 
-    groups = []
-    for _checksum, ids in by_checksum.items():
-        if len(ids) > 1:
-            groups.append(
-                {
-                    "image_ids": ids,
-                    "similarity_type": "exact",
-                    "confidence": 100,
-                }
+    return [
+        {
+            "image_ids": ids,
+            "checksum": checksum,
+            "similarity_type": "exact",
+            "confidence": 100,
+        }
+        for checksum, ids in by_checksum.items()
+        if len(ids) > 1
+    ]
+
+
+def _candidate_buckets(
+    packed: np.ndarray, threshold: int, hash_bits: int
+) -> List[np.ndarray]:
+    """Bucket hashes so every pair within threshold shares a bucket.
+
+    Multi-index hashing: each hash is split into threshold + 1 disjoint
+    bit ranges. Two hashes that differ in at most threshold bits must agree
+    exactly on at least one range (pigeonhole), so only hashes sharing a
+    range value need to be compared.
+
+    Args:
+        packed: Hash values from _pack_hashes()
+        threshold: Maximum Hamming distance to consider similar
+        hash_bits: Width of the hashes in bits
+
+    Returns:
+        Arrays of hash indices (ascending) that need pairwise comparison
+    """
+    chunks = threshold + 1
+    if threshold < 0 or chunks > hash_bits:
+        return [np.arange(len(packed))]
+
+    bounds = [k * hash_bits // chunks for k in range(chunks + 1)]
+    buckets: List[np.ndarray] = []
+    for shift, end in zip(bounds, bounds[1:]):
+        mask = np.uint64((1 << (end - shift)) - 1)
+        keys = (packed >> np.uint64(shift)) & mask
+        order = np.argsort(keys, kind="stable")
+        splits = np.flatnonzero(np.diff(keys[order])) + 1
+        buckets.extend(b for b in np.split(order, splits) if len(b) > 1)
+    return buckets
+
+
+def _popcount64(x: np.uint64) -> np.uint64:
+    """Count set bits with shifts and masks (no overflowing multiply).
+
+    Written with plain integer ops so numba can compile it; LLVM turns
+    the pattern into a single POPCNT instruction.
+    """
+    x = x - ((x >> np.uint64(1)) & _M1)
+    x = (x & _M2) + ((x >> np.uint64(2)) & _M2)
+    x = (x + (x >> np.uint64(4))) & _M4
+    x = x + (x >> np.uint64(8))
+    x = x + (x >> np.uint64(16))
+    x = x + (x >> np.uint64(32))
+    return x & np.uint64(0x7F)
+
+
+def _make_pairs_kernel(prange: Any, popcount: Any) -> Any:
+    """Build the all-pairs kernel over a uint64 array.
+
+    Rows are scanned twice: once to count matches, then again to write
+    them at offsets from a prefix sum, so parallel rows never share output
+    slots. With numba, ``prange`` is numba.prange and the outer loop runs
+    on all cores.
+    """
+
+    def pairs_within(values: np.ndarray, threshold: np.uint64) -> Any:
+        n = values.shape[0]
+        counts = np.zeros(n + 1, dtype=np.int64)
+        for i in prange(n):
+            a = values[i]
+            c = 0
+            for j in range(i + 1, n):
+                if popcount(a ^ values[j]) <= threshold:
+                    c += 1
+            counts[i + 1] = c
+        offsets = np.cumsum(counts)
+        rows = np.empty(offsets[n], dtype=np.int64)
+        cols = np.empty(offsets[n], dtype=np.int64)
+        for i in prange(n):
+            a = values[i]
+            k = offsets[i]
+            for j in range(i + 1, n):
+                if popcount(a ^ values[j]) <= threshold:
+                    rows[k] = i
+                    cols[k] = j
+                    k += 1
+        return rows, cols
+
+    return pairs_within
+
+
+def _get_pairs_kernel() -> Any:
+    """Return the numba-compiled pair kernel, or None without numba."""
+    global _pairs_kernel
+    if _pairs_kernel is None:
+        try:
+            import numba
+        except ImportError:
+            _pairs_kernel = False
+        else:
+            popcount = numba.njit(inline="always")(_popcount64)
+            _pairs_kernel = numba.njit(parallel=True)(
+                _make_pairs_kernel(numba.prange, popcount)
             )
+    return _pairs_kernel or None
 
-    return groups
+
+def _matching_pairs(
+    packed: np.ndarray, bucket: np.ndarray, threshold: int
+) -> List[Tuple[int, int]]:
+    """Find the index pairs in a bucket within threshold of each other.
+
+    Args:
+        packed: Hash values from _pack_hashes()
+        bucket: Ascending indices into packed
+        threshold: Maximum Hamming distance to consider similar
+
+    Returns:
+        List of (i, j) index pairs with i < j
+
+    Buckets too large for a distance matrix use a compiled parallel kernel
+    when numba is installed (the ``accel`` extra), else a row-wise scan.
+    """
+    values = packed[bucket]
+    if len(bucket) <= _MATRIX_BUCKET_SIZE:
+        distances = np.bitwise_count(values[:, None] ^ values[None, :])
+        rows, cols = np.nonzero(np.triu(distances <= threshold, 1))
+        return list(zip(bucket[rows].tolist(), bucket[cols].tolist()))
+
+    kernel = _get_pairs_kernel()
+    if kernel:
+        rows, cols = kernel(values, np.uint64(threshold))
+        return list(zip(bucket[rows].tolist(), bucket[cols].tolist()))
+
+    # Large buckets: one row at a time to keep memory linear
+    pairs = []
+    for r in range(len(bucket) - 1):
+        distances = np.bitwise_count(values[r] ^ values[r + 1 :])
+        for c in np.flatnonzero(distances <= threshold).tolist():
+            pairs.append((int(bucket[r]), int(bucket[r + 1 + c])))
+    return pairs
 
 
 def find_similar_hashes(
-    hashes: Dict[str, str],
+    hashes: Dict[str, HashValue],
     threshold: int = 5,
 ) -> List[Set[str]]:
     """Find groups of similar hashes using union-find.
 
+    Candidate pairs come from multi-index hashing (see _candidate_buckets),
+    so the work grows with the number of near matches instead of N^2.
+
     Args:
-        hashes: Dict mapping image_id -> hash string
+        hashes: Dict mapping image_id -> hex string or 64-bit integer hash
         threshold: Maximum Hamming distance to consider similar
 
     Returns:
         List of sets, each containing similar image IDs
     """
-    # Union-find for efficient grouping
-    parent: Dict[str, str] = {id: id for id in hashes}
+    # Union-find over positions: path halving plus union by size
+    ids = list(hashes.keys())
+    parent = list(range(len(ids)))
+    size = [1] * len(ids)
 
-    def find(x: str) -> str:
-        if parent[x] != x:
-            parent[x] = find(parent[x])
-        return parent[x]
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
 
-    def union(x: str, y: str) -> None:
+    def union(x: int, y: int) -> None:
         px, py = find(x), find(y)
-        if px != py:
-            parent[px] = py
+        if px == py:
+            return
+        if size[px] < size[py]:
+            px, py = py, px
+        parent[py] = px
+        size[px] += size[py]
+
+    packed = _pack_hashes(hashes.values())
+    if packed is not None:
+        hash_bits = _hash_width(next(iter(hashes.values()), ""))
+        for bucket in _candidate_buckets(packed, threshold, hash_bits):
+            for i, j in _matching_pairs(packed, bucket, threshold):
+                union(i, j)
+    else:
+        for i in range(len(ids)):
+            for j in range(i + 1, len(ids)):
+                if hamming_distance(hashes[ids[i]], hashes[ids[j]]) <= threshold:
+                    union(i, j)
 
-    # Compare all pairs
-    ids = list(hashes.keys())
-    for i in range(len(ids)):
-        for j in range(i + 1, len(ids)):
-            id1, id2 = ids[i], ids[j]
-            distance = hamming_distance(hashes[id1], hashes[id2])
-            if distance <= threshold:
-                union(id1, id2)
+    # Collect groups in one pass, skipping singletons
+    groups: Dict[int, Set[str]] = defaultdict(set)
+    for i, image_id in enumerate(ids):
+        root = find(i)
+        if size[root] > 1:
+            groups[root].add(image_id)
+
+    return list(groups.values())
 
-    # Collect groups
-    groups: Dict[str, Set[str]] = defaultdict(set)
-    for id in ids:
-        root = find(id)
-        groups[root].add(id)
 
-    # Return only groups with multiple members
-    return [g for g in groups.values() if len(g) > 1]
+def _pairwise_distance_sum(hashes: List[HashValue]) -> Tuple[int, int]:
+    """Sum the Hamming distances over every pair of hashes.
+
+    Args:
+        hashes: Hex hash strings of the same length, or 64-bit integers
+
+    Returns:
+        Tuple of (total distance, number of pairs compared)
+    """
+    n = len(hashes)
+    packed = _pack_hashes(hashes)
+    if packed is not None:
+        total = sum(
+            int(np.bitwise_count(packed[i] ^ packed[i + 1 :]).sum())
+            for i in range(n - 1)
+        )
+    else:
+        total = sum(
+            hamming_distance(hashes[i], hashes[j])
+            for i in range(n)
+            for j in range(i + 1, n)
+        )
+    return total, n * (n - 1) // 2
 
 
 def group_by_similarity(
     images: List[Dict[str, Any]],
     hash_key: str = "dhash",
     threshold: int = 5,
+    checksum_key: str = "checksum",
 ) -> List[Dict[str, Any]]:
     """Group images by perceptual hash similarity.
 
+    Images sharing both a checksum and a hash are byte-identical copies,
+    so only one representative of each is compared; the copies are added
+    back to whatever group it lands in. A set of copies with no other
+    near match still forms a group on its own (distance 0).
+
     Args:
         images: List of image dicts with hash field
         hash_key: Key for hash in image dict (dhash, ahash, whash)
         threshold: Maximum Hamming distance
+        checksum_key: Key for checksum in image dict
 
     Returns:
         List of group dicts with image_ids, similarity_type, confidence
     """
-    # Build hash lookup
-    hashes = {}
+    # Build hash lookup of representatives and their identical copies
+    hashes: Dict[str, HashValue] = {}
+    copies: Dict[str, List[str]] = {}
+    representative: Dict[Tuple[str, HashValue], str] = {}
     for img in images:
         hash_val = img.get(hash_key)
-        if hash_val:
-            hashes[img["id"]] = hash_val
+        # 0 is a valid integer hash (a flat image), so test for absence
+        if hash_val is None or hash_val == "":
+            continue
+        checksum = img.get(checksum_key)
+        rep = representative.get((checksum, hash_val)) if checksum else None
+        if rep is not None:
+            copies[rep].append(img["id"])
+            continue
+        if checksum:
+            representative[(checksum, hash_val)] = img["id"]
+        hashes[img["id"]] = hash_val
+        copies[img["id"]] = [img["id"]]
 
     if not hashes:
         return []
 
-    # Find similar groups
+    # Find similar groups among representatives
     similar_sets = find_similar_hashes(hashes, threshold)
+    grouped = set().union(*similar_sets)
+    similar_sets.extend(
+        {rep} for rep, ids in copies.items() if len(ids) > 1 and rep not in grouped
+    )
 
     # Convert to output format
     groups = []
     for id_set in similar_sets:
         # Calculate average similarity within group
-        ids = list(id_set)
-        total_dist = 0
-        comparisons = 0
-        for i in range(len(ids)):
-            for j in range(i + 1, len(ids)):
-                total_dist += hamming_distance(hashes[ids[i]], hashes[ids[j]])
-                comparisons += 1
+        ids = [image_id for rep in id_set for image_id in copies[rep]]
+        total_dist, comparisons = _pairwise_distance_sum(
+            [hashes[rep] for rep in id_set for _ in copies[rep]]
+        )
 
         avg_dist = total_dist / comparisons if comparisons else 0
         # Convert distance to confidence (lower distance = higher confidence)
@@ -167,7 +405,9 @@ def select_primary_image(
     if not images:
         raise ValueError("Cannot select from empty list")
 
-    def sort_key(img: Dict[str, Any]) -> Tuple[int, int, str]:
+    # Single max() pass over a tuple key. Scores and sizes may be missing
+    # or None, so itemgetter() can't be used directly.
+    def sort_key(img: Dict[str, Any]) -> Tuple[float, int, str]:
         return (
             img.get(quality_key) or 0,
             img.get("size_bytes") or 0,
@@ -10,33 +10,149 @@ Hash types:
 - wHash (wavelet hash): DWT-based, most robust to transformations
 """
 
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Union
+from typing import Callable, Dict, Optional, Tuple, Union
 
 import numpy as np
 import pywt
 from PIL import Image
 
+# A perceptual hash as a hex string, or a 64-bit hash as stored in BIGINT
+HashValue = Union[str, int]
+_UINT64_MASK = (1 << 64) - 1
 
-def hamming_distance(hash1: str, hash2: str) -> int:
-    """Compute Hamming distance between two hex hashes.
+# Process-local memo of hash results keyed on (kind, path, mtime_ns, size).
+# A rewritten file changes mtime or size, so stale entries are never hit;
+# they simply age out of the LRU.
+HASH_CACHE_SIZE = 50_000
+_hash_cache: "OrderedDict[Tuple, Dict[str, str]]" = OrderedDict()
+_hash_cache_lock = threading.Lock()
+
+
+def _hash_int(value: HashValue) -> int:
+    """Return a hash as an unsigned integer.
+
+    Integer hashes may come from a signed BIGINT column, so they are
+    reinterpreted as unsigned 64-bit values.
+    """
+    if isinstance(value, int):
+        return value & _UINT64_MASK
+    return int(value, 16)
+
+
+def hamming_distance(hash1: HashValue, hash2: HashValue) -> int:
+    """Compute Hamming distance between two hashes.
 
     Args:
-        hash1: First hash as hex string
-        hash2: Second hash as hex string
+        hash1: First hash as hex string or 64-bit integer
+        hash2: Second hash as hex string or 64-bit integer
 
     Returns:
         Number of differing bits
 
     Raises:
-        ValueError: If hash lengths don't match
+        ValueError: If two hex hash lengths don't match
     """
-    if len(hash1) != len(hash2):
+    if isinstance(hash1, str) and isinstance(hash2, str) and len(hash1) != len(hash2):
         raise ValueError(f"Hash length mismatch: {len(hash1)} vs {len(hash2)}")
 
-    # Convert hex to int and XOR
-    diff = int(hash1, 16) ^ int(hash2, 16)
-    return bin(diff).count("1")
+    # XOR the integer values and popcount the differing bits
+    return (_hash_int(hash1) ^ _hash_int(hash2)).bit_count()
+
+
+def clear_hash_cache() -> None:
+    """Forget all memoized hash results."""
+    with _hash_cache_lock:
+        _hash_cache.clear()
+
+
+def _memoized_hashes(
+    kind: Tuple, image_path: Union[Path, str], compute: Callable[[], Dict[str, str]]
+) -> Dict[str, str]:
+    """Return hashes for a file from the memo, computing them on a miss."""
+    try:
+        st = os.stat(image_path)
+    except OSError:
+        return compute()  # Let the decoder raise its usual error
+
+    key = (*kind, os.fspath(image_path), st.st_mtime_ns, st.st_size)
+    with _hash_cache_lock:
+        cached = _hash_cache.get(key)
+        if cached is not None:
+            _hash_cache.move_to_end(key)
+            return dict(cached)
+
+    hashes = compute()
+    with _hash_cache_lock:
+        _hash_cache[key] = hashes
+        if len(_hash_cache) > HASH_CACHE_SIZE:
+            _hash_cache.popitem(last=False)
+    return dict(hashes)
+
+
+def _bits_to_hex(bits: np.ndarray) -> str:
+    """Pack a boolean hash grid (row-major, MSB first) into a hex string."""
+    flat = bits.ravel()
+    # Left-pad to whole bytes so the value matches reading the bits as one
+    # big-endian integer
+    pad = -flat.size % 8
+    if pad:
+        flat = np.concatenate([np.zeros(pad, dtype=bool), flat])
+    hash_int = int.from_bytes(np.packbits(flat).tobytes(), "big")
+    return format(hash_int, f"0{bits.size // 4}x")
+
+
+def _load_grayscale(image_path: Union[Path, str]) -> Image.Image:
+    """Decode an image once and convert it to grayscale.
+
+    The hash functions below all start from this image, so computing
+    several hashes for one file only pays for a single decode.
+    """
+    with Image.open(image_path) as img:
+        return img.convert("L")
+
+
+def _dhash_from_gray(gray: Image.Image, hash_size: int) -> str:
+    """Compute a difference hash from a grayscale image."""
+    img = gray.resize((hash_size + 1, hash_size), Image.Resampling.LANCZOS)
+
+    pixels = np.asarray(img)
+
+    # Each bit is 1 if left pixel > right pixel
+    return _bits_to_hex(pixels[:, :-1] > pixels[:, 1:])
+
+
+def _ahash_from_gray(gray: Image.Image, hash_size: int) -> str:
+    """Compute an average hash from a grayscale image."""
+    img = gray.resize((hash_size, hash_size), Image.Resampling.LANCZOS)
+
+    pixels = np.asarray(img)
+    return _bits_to_hex(pixels > pixels.mean())
+
+
+def _whash_from_gray(gray: Image.Image, hash_size: int) -> str:
+    """Compute a wavelet hash from a grayscale image."""
+    # Resize to power of 2 for DWT
+    img = gray.resize((hash_size * 4, hash_size * 4), Image.Resampling.LANCZOS)
+
+    pixels = np.array(img, dtype=np.float64)
+
+    # Apply 2D DWT with Haar wavelet
+    coeffs = pywt.dwt2(pixels, "haar")
+    cA, (cH, cV, cD) = coeffs
+
+    # Resize approximation coefficients to hash_size
+    cA_resized = Image.fromarray(cA).resize(
+        (hash_size, hash_size), Image.Resampling.LANCZOS
+    )
+    cA_array = np.array(cA_resized)
+
+    # Threshold by median
+    median = np.median(cA_array)
+    return _bits_to_hex(cA_array > median)
 
 
 def compute_dhash(image_path: Union[Path, str], hash_size: int = 8) -> str:
@@ -52,24 +168,7 @@ def compute_dhash(image_path: Union[Path, str], hash_size: int = 8) -> str:
     Returns:
         Hash as hex string (16 characters for 64-bit hash)
     """
-    with Image.open(image_path) as img:
-        # Convert to grayscale and resize
-        img = img.convert("L")
-        img = img.resize((hash_size + 1, hash_size), Image.Resampling.LANCZOS)
-
-        pixels = list(img.getdata())
-
-        # Compute differences - each bit is 1 if left pixel > right pixel
-        bits = []
-        for row in range(hash_size):
-            for col in range(hash_size):
-                left = pixels[row * (hash_size + 1) + col]
-                right = pixels[row * (hash_size + 1) + col + 1]
-                bits.append(1 if left > right else 0)
-
-        # Convert to hex
-        hash_int = int("".join(str(b) for b in bits), 2)
-        return format(hash_int, f"0{hash_size * hash_size // 4}x")
+    return _dhash_from_gray(_load_grayscale(image_path), hash_size)
 
 
 def compute_ahash(image_path: Union[Path, str], hash_size: int = 8) -> str:
@@ -85,16 +184,7 @@ def compute_ahash(image_path: Union[Path, str], hash_size: int = 8) -> str:
     Returns:
         Hash as hex string (16 characters for 64-bit hash)
     """
-    with Image.open(image_path) as img:
-        img = img.convert("L")
-        img = img.resize((hash_size, hash_size), Image.Resampling.LANCZOS)
-
-        pixels = list(img.getdata())
-        avg = sum(pixels) / len(pixels)
-
-        bits = [1 if p > avg else 0 for p in pixels]
-        hash_int = int("".join(str(b) for b in bits), 2)
-        return format(hash_int, f"0{hash_size * hash_size // 4}x")
+    return _ahash_from_gray(_load_grayscale(image_path), hash_size)
 
 
 def compute_whash(image_path: Union[Path, str], hash_size: int = 8) -> str:
@@ -110,29 +200,7 @@ def compute_whash(image_path: Union[Path, str], hash_size: int = 8) -> str:
     Returns:
         Hash as hex string (16 characters for 64-bit hash)
     """
-    with Image.open(image_path) as img:
-        img = img.convert("L")
-        # Resize to power of 2 for DWT
-        img = img.resize((hash_size * 4, hash_size * 4), Image.Resampling.LANCZOS)
-
-        pixels = np.array(img, dtype=np.float64)
-
-        # Apply 2D DWT with Haar wavelet
-        coeffs = pywt.dwt2(pixels, "haar")
-        cA, (cH, cV, cD) = coeffs
-
-        # Resize approximation coefficients to hash_size
-        cA_resized = Image.fromarray(cA).resize(
-            (hash_size, hash_size), Image.Resampling.LANCZOS
-        )
-        cA_array = np.array(cA_resized)
-
-        # Threshold by median
-        median = np.median(cA_array)
-        bits = (cA_array > median).flatten().astype(int)
-
-        hash_int = int("".join(str(b) for b in bits), 2)
-        return format(hash_int, f"0{hash_size * hash_size // 4}x")
+    return _whash_from_gray(_load_grayscale(image_path), hash_size)
 
 
 def compute_all_hashes(
@@ -141,6 +209,10 @@ def compute_all_hashes(
 ) -> Dict[str, str]:
     """Compute all three hash types for an image.
 
+    The image is decoded and converted to grayscale once and shared by
+    all three hashes. Results are memoized per (path, mtime, size), so
+    re-hashing an unchanged file is a dictionary lookup.
+
     Args:
         image_path: Path to image file
         hash_size: Size of hash grid (default 8 = 64-bit hashes)
@@ -148,11 +220,16 @@ def compute_all_hashes(
     Returns:
         Dict with keys: dhash, ahash, whash
     """
-    return {
-        "dhash": compute_dhash(image_path, hash_size),
-        "ahash": compute_ahash(image_path, hash_size),
-        "whash": compute_whash(image_path, hash_size),
-    }
+
+    def compute() -> Dict[str, str]:
+        gray = _load_grayscale(image_path)
+        return {
+            "dhash": _dhash_from_gray(gray, hash_size),
+            "ahash": _ahash_from_gray(gray, hash_size),
+            "whash": _whash_from_gray(gray, hash_size),
+        }
+
+    return _memoized_hashes(("all", hash_size), image_path, compute)
 
 
 def compute_all_hashes_v2(
@@ -166,26 +243,38 @@ def compute_all_hashes_v2(
     - dhash_32: 1024-bit (for L4 preview, scale > 0.25 — 256 hex chars)
 
     Also returns ahash and whash at size 8 for backwards compatibility.
+    The image is decoded once for all five hashes, and results are
+    memoized like compute_all_hashes().
     """
-    return {
-        "dhash_8": compute_dhash(image_path, hash_size=8),
-        "dhash_16": compute_dhash(image_path, hash_size=16),
-        "dhash_32": compute_dhash(image_path, hash_size=32),
-        "ahash": compute_ahash(image_path, hash_size=8),
-        "whash": compute_whash(image_path, hash_size=8),
-    }
+
+    def compute() -> Dict[str, str]:
+        gray = _load_grayscale(image_path)
+        return {
+            "dhash_8": _dhash_from_gray(gray, hash_size=8),
+            "dhash_16": _dhash_from_gray(gray, hash_size=16),
+            "dhash_32": _dhash_from_gray(gray, hash_size=32),
+            "ahash": _ahash_from_gray(gray, hash_size=8),
+            "whash": _whash_from_gray(gray, hash_size=8),
+        }
+
+    return _memoized_hashes(("v2",), image_path, compute)
 
 
-def similarity_score(hash1: str, hash2: str, hash_bits: int = 64) -> int:
+def similarity_score(
+    hash1: HashValue, hash2: HashValue, hash_bits: Optional[int] = None
+) -> int:
     """Compute similarity percentage between two hashes.
 
     Args:
-        hash1: First hash as hex string
-        hash2: Second hash as hex string
-        hash_bits: Total bits in hash (default 64 for 8x8 grid)
+        hash1: First hash as hex string or 64-bit integer
+        hash2: Second hash as hex string or 64-bit integer
+        hash_bits: Total bits in hash (default: 4 per hex character, or 64
+            for integer hashes)
 
     Returns:
         Similarity as percentage 0-100 (100 = identical)
     """
     distance = hamming_distance(hash1, hash2)
+    if hash_bits is None:
+        hash_bits = len(hash1) * 4 if isinstance(hash1, str) else 64
     return int(100 * (1 - distance / hash_bits))
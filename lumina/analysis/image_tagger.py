@@ -20,10 +20,12 @@ Example:
         >>> tags = tagger.tag_image("/path/to/image.jpg")
 """
 
+import contextlib
 import json
 import logging
 import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
@@ -132,6 +134,9 @@ class OpenCLIPBackend(TaggerBackend):
         self._tokenizer: Any = None
         self._text_embeddings: Any = None
         self._tag_names: Optional[List[str]] = None
+        # Taggers are used from one thread each; a private CUDA stream lets
+        # taggers sharing a GPU overlap copies and kernels
+        self._stream: Any = None
 
         # Determine device
         if device is None:
@@ -288,6 +293,7 @@ class OpenCLIPBackend(TaggerBackend):
             self._tokenizer = None
             self._text_embeddings = None
             self._tag_names = None
+            self._stream = None
 
             # Clear CUDA cache if using GPU
             if self._device == "cuda":
@@ -370,6 +376,65 @@ class OpenCLIPBackend(TaggerBackend):
         results.sort(key=lambda x: x[1], reverse=True)
         return results[:max_tags]
 
+    def _stream_context(self) -> Any:
+        """Context that runs CUDA work on this tagger's own stream.
+
+        Returns:
+            torch.cuda.stream context on CUDA, a no-op context otherwise
+        """
+        if self._device != "cuda":
+            return contextlib.nullcontext()
+
+        import torch
+
+        if self._stream is None:
+            self._stream = torch.cuda.Stream()
+        # Text embeddings were computed on the default stream
+        self._stream.wait_stream(torch.cuda.current_stream())
+        return torch.cuda.stream(self._stream)
+
+    def _prepare_batch(
+        self, batch_paths: List[Path]
+    ) -> Tuple[Any, List[Path], List[Path]]:
+        """Decode and preprocess a chunk of images into one CPU tensor.
+
+        On CUDA the tensor is placed in pinned memory so the copy to the GPU
+        can run asynchronously.
+
+        Args:
+            batch_paths: Paths to load
+
+        Returns:
+            (stacked tensor or None if nothing loaded, loaded paths, failed paths)
+        """
+        import torch
+
+        batch_images = []
+        valid_paths: List[Path] = []
+        failed_paths: List[Path] = []
+
+        # Load images (with RAW format support)
+        for path in batch_paths:
+            try:
+                image = self._load_image(path)
+                if image:
+                    batch_images.append(self._preprocess(image))
+                    valid_paths.append(path)
+                else:
+                    logger.warning(f"Failed to load {path}: unsupported format")
+                    failed_paths.append(path)
+            except Exception as e:
+                logger.warning(f"Failed to load {path}: {e}")
+                failed_paths.append(path)
+
+        if not batch_images:
+            return None, valid_paths, failed_paths
+
+        batch_tensor = torch.stack(batch_images)
+        if self._device == "cuda":
+            batch_tensor = batch_tensor.pin_memory()
+        return batch_tensor, valid_paths, failed_paths
+
     def tag_batch(
         self,
         image_paths: List[Path],
@@ -385,54 +450,56 @@ class OpenCLIPBackend(TaggerBackend):
         self._encode_tags(tag_names)
 
         results: Dict[Path, List[Tuple[str, float]]] = {}
-
-        # Process in batches
-        for batch_start in range(0, len(image_paths), batch_size):
-            batch_paths = image_paths[batch_start : batch_start + batch_size]
-            batch_images = []
-            valid_paths = []
-
-            # Load images (with RAW format support)
-            for path in batch_paths:
-                try:
-                    image = self._load_image(path)
-                    if image:
-                        batch_images.append(self._preprocess(image))
-                        valid_paths.append(path)
-                    else:
-                        logger.warning(f"Failed to load {path}: unsupported format")
-                        results[path] = []
-                except Exception as e:
-                    logger.warning(f"Failed to load {path}: {e}")
+        chunks = [
+            image_paths[i : i + batch_size]
+            for i in range(0, len(image_paths), batch_size)
+        ]
+        if not chunks:
+            return results
+
+        # Decode and preprocess the next chunk on a helper thread while the
+        # model runs on the current one
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="openclip-preprocess"
+        ) as loader:
+            pending = loader.submit(self._prepare_batch, chunks[0])
+            for next_chunk in chunks[1:] + [None]:
+                batch_tensor, valid_paths, failed_paths = pending.result()
+                if next_chunk is not None:
+                    pending = loader.submit(self._prepare_batch, next_chunk)
+
+                for path in failed_paths:
                     results[path] = []
-
-            if not batch_images:
-                continue
-
-            # Stack and process batch
-            batch_tensor = torch.stack(batch_images).to(self._device)
-
-            # Use autocast only on CUDA (bfloat16 not supported on CPU)
-            with torch.no_grad():
-                if self._device == "cuda":
-                    with torch.amp.autocast(self._device):
-                        image_embeddings = self._model.encode_image(batch_tensor)
-                else:
-                    image_embeddings = self._model.encode_image(batch_tensor)
-                image_embeddings /= image_embeddings.norm(dim=-1, keepdim=True)
-                similarities = image_embeddings @ self._text_embeddings.T
-                similarities = similarities.cpu().numpy()
-
-            # Extract results for each image
-            for i, path in enumerate(valid_paths):
-                image_results = []
-                for j, tag_name in enumerate(tag_names):
-                    score = float(similarities[i, j])
-                    if score >= threshold:
-                        image_results.append((tag_name, score))
-
-                image_results.sort(key=lambda x: x[1], reverse=True)
-                results[path] = image_results[:max_tags]
+                if batch_tensor is None:
+                    continue
+
+                # similarities.cpu() waits for this stream's work to finish
+                with self._stream_context():
+                    batch_tensor = batch_tensor.to(self._device, non_blocking=True)
+
+                    # Use autocast only on CUDA (bfloat16 not supported on CPU)
+                    with torch.no_grad():
+                        if self._device == "cuda":
+                            with torch.amp.autocast(self._device):
+                                image_embeddings = self._model.encode_image(
+                                    batch_tensor
+                                )
+                        else:
+                            image_embeddings = self._model.encode_image(batch_tensor)
+                        image_embeddings /= image_embeddings.norm(dim=-1, keepdim=True)
+                        similarities = image_embeddings @ self._text_embeddings.T
+                        similarities = similarities.cpu().numpy()
+
+                # Extract results for each image
+                for i, path in enumerate(valid_paths):
+                    image_results = []
+                    for j, tag_name in enumerate(tag_names):
+                        score = float(similarities[i, j])
+                        if score >= threshold:
+                            image_results.append((tag_name, score))
+
+                    image_results.sort(key=lambda x: x[1], reverse=True)
+                    results[path] = image_results[:max_tags]
 
         return results
 
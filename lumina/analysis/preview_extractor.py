@@ -23,6 +23,7 @@ from rich.progress import (
 
 from ..core.types import FileType, ImageMetadata, ImageRecord, ImageStatus
 from ..db import CatalogDB as CatalogDatabase
+from ..shared.parallel import pool_chunksize
 from ..shared.preview_cache import PreviewCache
 
 logger = logging.getLogger(__name__)
@@ -232,7 +233,7 @@ class PreviewExtractor:
             else:
                 # Parallel processing (if workers > 1)
                 pool = mp.Pool(processes=self.workers)
-                chunk_size = max(1, len(images_to_process) // (self.workers * 4))
+                chunk_size = pool_chunksize(len(images_to_process), self.workers)
                 results_iter = pool.imap_unordered(
                     _extract_preview_worker, worker_args, chunk_size
                 )
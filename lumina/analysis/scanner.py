@@ -358,19 +358,23 @@ class ImageScannerORM:
         # Track checksums in this batch to avoid duplicates within the batch
         batch_checksums = set()
 
+        # Tally in locals and fold into the scanner's counters once per batch
+        added = updated = skipped = deduplicated = errors = 0
+        batch_bytes = 0
+
         # Add results to database
         for result, file_path in zip(results, file_paths):
             if result is None:
-                self.files_error += 1
+                errors += 1
                 continue
 
             image_record, file_size = result
-            self.total_bytes += file_size
+            batch_bytes += file_size
 
             # Check if image already exists by checksum (in database or in this batch)
             if image_record.checksum in batch_checksums:
                 logger.debug(f"Skipping duplicate in batch: {file_path}")
-                self.files_skipped += 1
+                skipped += 1
                 continue
 
             existing = (
@@ -389,7 +393,7 @@ class ImageScannerORM:
                 if needs_update:
                     # Update the existing record with new metadata
                     self._update_existing_image(existing, image_record, file_path)
-                    self.files_updated += 1
+                    updated += 1
                     logger.debug(f"Updated incomplete record: {file_path}")
                 else:
                     # Different path, same content — a true dedup hit at import time
@@ -421,14 +425,14 @@ class ImageScannerORM:
                                 },
                             )
                             self.session.flush()
-                            self.files_deduplicated += 1
+                            deduplicated += 1
                         except Exception as exc:
                             logger.warning(
                                 f"Failed to record skipped import for {file_path}: {exc}"
                             )
                     else:
                         logger.debug(f"Skipping complete record (re-scan): {file_path}")
-                    self.files_skipped += 1
+                    skipped += 1
                 continue
 
             # Track this checksum for the current batch
@@ -507,9 +511,16 @@ class ImageScannerORM:
             image.processing_flags = processing_flags
 
             self.session.add(image)
-            self.files_added += 1
+            added += 1
             logger.debug(f"Added: {file_path}")
 
+        self.files_added += added
+        self.files_updated += updated
+        self.files_skipped += skipped
+        self.files_deduplicated += deduplicated
+        self.files_error += errors
+        self.total_bytes += batch_bytes
+
         # Commit batch
         try:
             self.session.commit()
@@ -15,7 +15,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import FileResponse, StreamingResponse
 from PIL import Image, ImageOps
 from pydantic import BaseModel
-from sqlalchemy import text
+from sqlalchemy import select, text
 from sqlalchemy.orm import Session
 
 from ...db import get_db
@@ -249,6 +249,10 @@ def delete_catalog(catalog_id: uuid.UUID, db: Session = Depends(get_db)):
             status_code=500, detail=f"Failed to delete catalog data: {str(e)}"
         )
 
+    from ...jobs.tag_storage import clear_tag_id_cache
+
+    clear_tag_id_cache(str(catalog_id))
+
     # Delete catalog record
     db.delete(catalog)
     db.commit()
@@ -3987,11 +3991,12 @@ def preview_undo_organize(
     if not catalog:
         raise HTTPException(status_code=404, detail="Catalog not found")
 
-    images = (
-        db.query(Image)
-        .filter(Image.catalog_id == catalog_id, Image.organized_path.isnot(None))
-        .all()
-    )
+    # Only the two paths are needed; plain rows skip building ORM instances
+    images = db.execute(
+        select(Image.source_path, Image.organized_path).where(
+            Image.catalog_id == catalog_id, Image.organized_path.isnot(None)
+        )
+    ).all()
 
     copies_to_delete = 0
     moves_to_reverse = 0
@@ -4002,7 +4007,7 @@ def preview_undo_organize(
         if not organized.exists():
             missing_organized_files += 1
             continue
-        source = Path(image.path)
+        source = Path(image.source_path)
         if source.exists():
             copies_to_delete += 1
         else:
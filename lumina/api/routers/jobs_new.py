@@ -3,14 +3,20 @@
 import logging
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from ...db import get_db
 from ...db.models import Job
 from ...jobs.background_jobs import cancel_job as cancel_job_bg
-from ...jobs.background_jobs import create_job, has_active_job, run_job_in_background
+from ...jobs.background_jobs import (
+    create_job,
+    has_active_job,
+    run_job_in_background,
+    wait_for_job,
+)
 from ...jobs.job_implementations import JOB_FUNCTIONS
 
 logger = logging.getLogger(__name__)
@@ -241,12 +247,37 @@ def submit_job(
     )
 
 
-@router.get("/{job_id}", response_model=JobResponse)
-def get_job(job_id: str, db: Session = Depends(get_db)):
-    """Get job status."""
+def _find_job(db: Session, job_id: str) -> Job:
+    """Load a job or raise 404."""
     job = db.query(Job).filter(Job.id == job_id).first()
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: str,
+    wait: bool = False,
+    timeout: float = Query(10.0, gt=0, le=60),
+    db: Session = Depends(get_db),
+):
+    """Get job status.
+
+    With ``wait=true``, an unfinished job is held until it completes or
+    ``timeout`` seconds pass, so clients need one request per wait instead
+    of polling. The wait happens on the event loop, not in a threadpool
+    worker; database calls still run in the threadpool. Only jobs running
+    in this server process can be waited on; others are returned
+    immediately.
+    """
+    job = await run_in_threadpool(_find_job, db, job_id)
+
+    if wait and job.status not in ("SUCCESS", "FAILURE"):
+        # End the read transaction so the pooled connection is free meanwhile
+        await run_in_threadpool(db.rollback)
+        await wait_for_job(job_id, timeout)
+        await run_in_threadpool(db.refresh, job)
 
     return JobResponse(
         id=job.id,
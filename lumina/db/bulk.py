@@ -0,0 +1,59 @@
+"""Bulk-loading helpers built on PostgreSQL COPY.
+
+COPY is the fastest way to move many rows into PostgreSQL: it avoids
+per-statement parse/plan overhead and parameter-count limits. The helpers
+here run COPY on the connection behind a SQLAlchemy session so the rows
+join the session's current transaction, and work with either psycopg 3 or
+psycopg2 as the driver.
+"""
+
+import io
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy.orm import Session
+
+
+def _format_copy_value(value: Any) -> str:
+    """Format a value for COPY text format."""
+    if value is None:
+        return "\\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_rows(
+    session: Session,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+) -> None:
+    """Load rows into a table with COPY FROM STDIN.
+
+    Args:
+        session: Session whose connection (and transaction) to use
+        table: Target table name
+        columns: Column names, in the order values appear in each row
+        rows: Row tuples to load
+    """
+    sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+    dbapi_conn = session.connection().connection.driver_connection
+
+    with dbapi_conn.cursor() as cursor:
+        if hasattr(cursor, "copy"):
+            # psycopg 3: stream rows, the driver handles the encoding
+            with cursor.copy(sql) as copy:
+                for row in rows:
+                    copy.write_row(row)
+        else:
+            # psycopg2: build the COPY text-format payload ourselves
+            buffer = io.StringIO()
+            for row in rows:
+                buffer.write("\t".join(_format_copy_value(v) for v in row))
+                buffer.write("\n")
+            buffer.seek(0)
+            cursor.copy_expert(sql, buffer)
@@ -78,6 +78,20 @@ class CatalogDB:
             self._context_manager.__exit__(exc_type, exc_val, exc_tb)
             self.session = None
 
+    def require_session(self) -> Session:
+        """
+        Return the open session, for binding once at the top of a block.
+
+        Returns:
+            The active SQLAlchemy session
+
+        Raises:
+            RuntimeError: If the database is not open
+        """
+        if self.session is None:
+            raise RuntimeError("CatalogDB session is not open")
+        return self.session
+
     def _map_status_to_db(self, status) -> str:
         """
         Map ImageStatus enum values to database status_id values.
@@ -194,6 +194,22 @@ def init_db() -> None:
     upgrade_backup_dest(engine)
     logger.info("backup_destinations migration applied")
 
+    # Add indexes for finding untagged images (idempotent)
+    from .migrations.tagging_indexes import upgrade as upgrade_tagging_indexes
+
+    upgrade_tagging_indexes(engine)
+
+    # Skip WAL for the transient job_progress table (idempotent)
+    from .migrations.job_progress_unlogged import upgrade as upgrade_job_progress
+
+    upgrade_job_progress(engine)
+    logger.info("job_progress UNLOGGED migration applied")
+
+    # Integer copy of the 64-bit dhash for duplicate grouping (idempotent)
+    from .migrations.dhash_bits import upgrade as upgrade_dhash_bits
+
+    upgrade_dhash_bits(engine)
+
     # Populate reference tables
     db = SessionLocal()
     try:
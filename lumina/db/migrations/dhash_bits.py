@@ -0,0 +1,29 @@
+"""Migration: store 64-bit dhashes as BIGINT alongside the hex text."""
+
+import logging
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+# Keep in sync with Image.dhash_bits in lumina/db/models.py
+DHASH_BITS_EXPR = (
+    "CASE WHEN dhash ~ '^[0-9a-fA-F]{16}$' " "THEN ('x' || dhash)::bit(64)::bigint END"
+)
+
+_STATEMENTS = [
+    # Generated from dhash, so every writer of the hex column fills it in
+    "ALTER TABLE images ADD COLUMN IF NOT EXISTS dhash_bits BIGINT "
+    f"GENERATED ALWAYS AS ({DHASH_BITS_EXPR}) STORED",
+]
+
+
+def upgrade(engine) -> None:
+    with engine.connect() as conn:
+        for stmt in _STATEMENTS:
+            try:
+                conn.execute(text(stmt))
+                conn.commit()
+            except Exception as e:
+                logger.warning(f"Migration stmt skipped ({e}): {stmt[:60].strip()}")
+                conn.rollback()
@@ -0,0 +1,43 @@
+"""Migration: make job_progress an UNLOGGED table.
+
+job_progress only holds the latest progress payload of running jobs for
+pollers. Skipping WAL for it removes most of the I/O on the publish path.
+PostgreSQL truncates UNLOGGED tables during crash recovery, which is fine
+here: live jobs republish on their next update and completed rows are
+pruned by cleanup_old_progress() anyway.
+"""
+
+from sqlalchemy import text
+
+# SET UNLOGGED rewrites the table, so only run it while still logged
+_SET_UNLOGGED = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_class
+        WHERE oid = to_regclass('job_progress') AND relpersistence = 'p'
+    ) THEN
+        ALTER TABLE job_progress SET UNLOGGED;
+    END IF;
+END
+$$
+"""
+
+# Every publish is an upsert, so vacuum the (small) table early
+_SET_AUTOVACUUM = """
+ALTER TABLE IF EXISTS job_progress
+SET (autovacuum_vacuum_scale_factor = 0.01, autovacuum_analyze_scale_factor = 0.05)
+"""
+
+
+def upgrade(engine):
+    """Switch job_progress to UNLOGGED — idempotent, skipped if already done."""
+    with engine.begin() as conn:
+        conn.execute(text(_SET_UNLOGGED))
+        conn.execute(text(_SET_AUTOVACUUM))
+
+
+def downgrade(engine):
+    """Make job_progress a regular logged table again."""
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE IF EXISTS job_progress SET LOGGED"))
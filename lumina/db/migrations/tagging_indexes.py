@@ -0,0 +1,28 @@
+"""Migration: add indexes used to find images that still need tagging."""
+
+import logging
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+_STATEMENTS = [
+    # Anti-join probe from images to their tags
+    "CREATE INDEX IF NOT EXISTS idx_image_tags_image_id ON image_tags(image_id)",
+    # Auto-tag only scans a catalog's still images
+    "CREATE INDEX IF NOT EXISTS idx_images_catalog_image ON images(catalog_id) "
+    "WHERE file_type = 'image'",
+]
+
+
+def upgrade(engine) -> None:
+    with engine.connect() as conn:
+        for stmt in _STATEMENTS:
+            try:
+                conn.execute(text(stmt))
+                conn.commit()
+            except Exception as e:
+                logger.warning(f"Migration stmt skipped ({e}): {stmt[:60].strip()}")
+                conn.rollback()
+
+    logger.info("tagging_indexes migration applied")
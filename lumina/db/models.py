@@ -11,6 +11,7 @@ from sqlalchemy import (
     Boolean,
     CheckConstraint,
     Column,
+    Computed,
     DateTime,
     Float,
     ForeignKey,
@@ -23,6 +24,8 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, declarative_base, mapped_column, relationship
 
+from .migrations.dhash_bits import DHASH_BITS_EXPR
+
 Base = declarative_base()
 
 VALID_LAYERS = {"exact", "reimport", "format_variant", "preview", "near_duplicate"}
@@ -148,6 +151,8 @@ class Image(Base):
 
     # Perceptual hashes for duplicate detection
     dhash = Column(Text)
+    # dhash as a signed 64-bit integer, generated by the database
+    dhash_bits = Column(BigInteger, Computed(DHASH_BITS_EXPR, persisted=True))
     ahash = Column(Text)
     whash = Column(Text)  # Wavelet hash - most robust to transformations
     dhash_16 = Column(Text)  # 256-bit hash for L4 preview detection (scale > 0.5)
@@ -65,6 +65,10 @@ CREATE TABLE IF NOT EXISTS images (
 
     -- Perceptual hashes
     dhash TEXT,                             -- Difference hash (for duplicates)
+    dhash_bits BIGINT GENERATED ALWAYS AS ( -- 64-bit dhash as an integer
+        CASE WHEN dhash ~ '^[0-9a-fA-F]{16}$'
+        THEN ('x' || dhash)::bit(64)::bigint END
+    ) STORED,
     ahash TEXT,                             -- Average hash (for duplicates)
     whash TEXT,                             -- Wavelet hash (for duplicates)
 
@@ -110,6 +114,7 @@ CREATE INDEX IF NOT EXISTS idx_images_ahash ON images(ahash);
 CREATE INDEX IF NOT EXISTS idx_images_whash ON images(whash);
 CREATE INDEX IF NOT EXISTS idx_images_status ON images(status);
 CREATE INDEX IF NOT EXISTS idx_images_burst_id ON images(burst_id);
+CREATE INDEX IF NOT EXISTS idx_images_catalog_image ON images(catalog_id) WHERE file_type = 'image';
 CREATE INDEX IF NOT EXISTS idx_images_dates ON images USING GIN (dates);
 CREATE INDEX IF NOT EXISTS idx_images_metadata ON images USING GIN (metadata);
 
@@ -298,11 +303,12 @@ CREATE INDEX IF NOT EXISTS idx_performance_snapshots_created_at ON performance_s
 -- ============================================================================
 -- JOB_PROGRESS TABLE (real-time job progress tracking)
 -- ============================================================================
-CREATE TABLE IF NOT EXISTS job_progress (
+-- UNLOGGED: transient state, truncated on crash recovery and republished
+CREATE UNLOGGED TABLE IF NOT EXISTS job_progress (
     job_id TEXT PRIMARY KEY,                -- Celery task ID
     progress_data JSONB NOT NULL,           -- Progress payload with status, current, total, etc.
     updated_at TIMESTAMP DEFAULT NOW()
-);
+) WITH (autovacuum_vacuum_scale_factor = 0.01, autovacuum_analyze_scale_factor = 0.05);
 
 CREATE INDEX IF NOT EXISTS idx_job_progress_updated_at ON job_progress(updated_at);
 
@@ -1,11 +1,13 @@
 """Background job execution without Celery - using threading and database tracking."""
 
+import asyncio
 import logging
+import multiprocessing
 import os
 import threading
 import time
 import uuid
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, Optional
 
@@ -22,6 +24,11 @@ MAX_RETRIES = int(os.getenv("LUMINA_JOB_MAX_RETRIES", "3"))
 RETRY_DELAY_SECONDS = 5
 ORPHANED_JOB_TIMEOUT_MINUTES = 60  # Jobs stuck in PROGRESS for 60+ min are orphaned
 
+# Let PyTorch's CUDA allocator grow segments in place rather than fragmenting
+# over long GPU jobs. Read when CUDA initializes, so it must be set before any
+# job imports torch (spawned GPU workers import this module first as well).
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
+
 # Priority levels for job scheduling
 PRIORITY_USER_IMMEDIATE = 100  # User clicked button, blocking UI
 PRIORITY_USER_BATCH = 80  # Bulk operations
@@ -36,6 +43,12 @@ _active_jobs: Dict[str, Future[Any]] = {}
 _job_stop_flags: Dict[str, threading.Event] = {}  # Cooperative cancellation
 _initialized = False
 
+# Process pool for GPU inference, one worker per device (multi-GPU hosts only)
+_gpu_executor: Optional[ProcessPoolExecutor] = None
+_gpu_worker_count = 0
+_gpu_executor_checked = False
+_gpu_executor_lock = threading.Lock()
+
 
 def get_executor() -> ThreadPoolExecutor:
     """Get or create the global thread pool executor."""
@@ -55,6 +68,56 @@ def get_executor() -> ThreadPoolExecutor:
     return _executor
 
 
+def _init_gpu_worker(devices: Any) -> None:
+    """Pin a GPU worker process to one device before CUDA is initialized."""
+    os.environ["CUDA_VISIBLE_DEVICES"] = str(devices.get())
+
+
+def get_gpu_executor() -> Optional[ProcessPoolExecutor]:
+    """Get or create the GPU process pool.
+
+    Each worker process is pinned to its own CUDA device, so batches run on
+    every GPU at once instead of sharing one CUDA context under the GIL.
+
+    Returns:
+        The pool, or None on hosts with fewer than two GPUs, where in-process
+        inference is just as fast
+    """
+    global _gpu_executor, _gpu_executor_checked, _gpu_worker_count
+    with _gpu_executor_lock:
+        if not _gpu_executor_checked:
+            _gpu_executor_checked = True
+            try:
+                import torch
+
+                device_count = torch.cuda.device_count()
+            except ImportError:
+                device_count = 0
+
+            if device_count > 1:
+                # CUDA cannot be used in forked children
+                mp_context = multiprocessing.get_context("spawn")
+                devices = mp_context.Queue()
+                for index in range(device_count):
+                    devices.put(index)
+                _gpu_executor = ProcessPoolExecutor(
+                    max_workers=device_count,
+                    mp_context=mp_context,
+                    initializer=_init_gpu_worker,
+                    initargs=(devices,),
+                )
+                _gpu_worker_count = device_count
+                logger.info(f"Created GPU executor with {device_count} workers")
+
+    return _gpu_executor
+
+
+def get_gpu_worker_count() -> int:
+    """Get the number of workers in the GPU process pool (0 without one)."""
+    get_gpu_executor()
+    return _gpu_worker_count
+
+
 def _recover_orphaned_jobs() -> None:
     """Find and fail jobs that were left in PROGRESS state (orphaned by restart)."""
     try:
@@ -478,6 +541,36 @@ def cancel_job(job_id: str) -> bool:
     return True
 
 
+async def wait_for_job(job_id: str, timeout: float) -> bool:
+    """Wait until a job running in this process finishes.
+
+    Waits on the event loop rather than in a worker thread, so idle waiters
+    do not tie up the threadpool that serves sync endpoints. The job's
+    terminal status is written to the database before its future completes,
+    so callers can re-read the job once this returns.
+
+    Args:
+        job_id: Job ID to wait for
+        timeout: Max seconds to wait
+
+    Returns:
+        True if the job is no longer running here (finished, or never
+        submitted by this process), False if the timeout passed first
+    """
+    future = _active_jobs.get(job_id)
+    if future is None:
+        return True
+
+    loop = asyncio.get_running_loop()
+    finished = asyncio.Event()
+    future.add_done_callback(lambda _: loop.call_soon_threadsafe(finished.set))
+    try:
+        await asyncio.wait_for(finished.wait(), timeout)
+    except asyncio.TimeoutError:
+        return False
+    return True
+
+
 def get_active_jobs() -> Dict[str, Future[Any]]:
     """Get all currently active jobs.
 
@@ -24,6 +24,8 @@ from __future__ import annotations
 import json
 import logging
 import math
+import threading
+import time
 import uuid
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, TypeVar
@@ -31,12 +33,36 @@ from typing import Any, Callable, Dict, List, Optional, TypeVar
 from sqlalchemy import text
 
 from ..db import CatalogDB as CatalogDatabase
+from ..db.bulk import copy_rows
+from .background_jobs import should_stop_job
 from .progress_publisher import publish_progress
 
 logger = logging.getLogger(__name__)
 
 # Type variable for work items (file paths, image IDs, etc.)
 T = TypeVar("T")
+R = TypeVar("R")
+
+# Minimum time between database reads of the parent job's status
+CANCEL_POLL_INTERVAL_SECONDS = 1.0
+
+# How long an aggregated progress read is reused by get_progress()
+PROGRESS_CACHE_SECONDS = 0.5
+
+# Batch payloads are machine-read JSONB; drop json.dumps' default padding
+_JSON_SEPARATORS = (",", ":")
+
+_BATCH_COPY_COLUMNS = (
+    "id",
+    "parent_job_id",
+    "catalog_id",
+    "batch_number",
+    "total_batches",
+    "job_type",
+    "work_items",
+    "items_count",
+    "status",
+)
 
 
 class JobCancelledException(Exception):
@@ -93,7 +119,13 @@ class BatchManager:
     This class handles all database operations for the job_batches table.
     """
 
-    def __init__(self, catalog_id: str, parent_job_id: str, job_type: str):
+    def __init__(
+        self,
+        catalog_id: str,
+        parent_job_id: str,
+        job_type: str,
+        db: Optional[CatalogDatabase] = None,
+    ):
         """
         Initialize the batch manager.
 
@@ -101,10 +133,33 @@ class BatchManager:
             catalog_id: The catalog UUID
             parent_job_id: The coordinator job ID
             job_type: Type of job (scan, tag, duplicates, etc.)
+            db: Optional open database connection reused by calls on the
+                creating thread that aren't given their own, so a worker
+                checks out one session for claim, progress and complete
+                instead of one per call. Sessions are not thread-safe, so
+                other threads sharing the manager open their own connection.
         """
         self.catalog_id = catalog_id
         self.parent_job_id = parent_job_id
         self.job_type = job_type
+        self._bound = threading.local()
+        self._bound.db = db
+        # Work items of batches created by this manager, so in-process workers
+        # can claim them without reading the JSON payload back from the DB
+        self._local_cache: Dict[str, List[Any]] = {}
+        self._cancelled = False
+        self._parent_checked_at = -math.inf
+        self._progress: Optional[JobProgress] = None
+        self._progress_read_at = -math.inf
+        self._progress_lock = threading.Lock()
+
+    def _run(self, func: Callable[[Any], R], db: Optional[CatalogDatabase]) -> R:
+        """Run func with a session from db, this thread's bound db, or a new one."""
+        db = db or getattr(self._bound, "db", None)
+        if db:
+            return func(db.session)
+        with CatalogDatabase(self.catalog_id) as db_conn:
+            return func(db_conn.session)
 
     def create_batches(
         self,
@@ -130,50 +185,37 @@ class BatchManager:
             logger.info(f"No work items to batch for job {self.parent_job_id}")
             return []
 
-        batch_ids = []
-
         def _create(session: Any) -> List[str]:
             ids = []
+            rows = []
             for batch_num in range(total_batches):
                 start_idx = batch_num * batch_size
                 end_idx = min(start_idx + batch_size, total_items)
                 batch_items = work_items[start_idx:end_idx]
 
                 batch_id = str(uuid.uuid4())
-
-                session.execute(
-                    text(
-                        """
-                        INSERT INTO job_batches (
-                            id, parent_job_id, catalog_id, batch_number, total_batches,
-                            job_type, work_items, items_count, status
-                        ) VALUES (
-                            :id, :parent_job_id, :catalog_id, :batch_number, :total_batches,
-                            :job_type, :work_items, :items_count, 'PENDING'
-                        )
-                    """
-                    ),
-                    {
-                        "id": batch_id,
-                        "parent_job_id": self.parent_job_id,
-                        "catalog_id": self.catalog_id,
-                        "batch_number": batch_num,
-                        "total_batches": total_batches,
-                        "job_type": self.job_type,
-                        "work_items": json.dumps(batch_items),
-                        "items_count": len(batch_items),
-                    },
+                rows.append(
+                    (
+                        batch_id,
+                        self.parent_job_id,
+                        self.catalog_id,
+                        batch_num,
+                        total_batches,
+                        self.job_type,
+                        json.dumps(batch_items, separators=_JSON_SEPARATORS),
+                        len(batch_items),
+                        "PENDING",
+                    )
                 )
                 ids.append(batch_id)
+                self._local_cache[batch_id] = batch_items
 
+            # One COPY instead of an INSERT round-trip per batch
+            copy_rows(session, "job_batches", _BATCH_COPY_COLUMNS, rows)
             session.commit()
             return ids
 
-        if db:
-            batch_ids = _create(db.session)
-        else:
-            with CatalogDatabase(self.catalog_id) as db_conn:
-                batch_ids = _create(db_conn.session)
+        batch_ids = self._run(_create, db)
 
         logger.info(
             f"Created {len(batch_ids)} batches for job {self.parent_job_id} "
@@ -188,7 +230,10 @@ class BatchManager:
         """
         Claim a batch for processing.
 
-        Uses optimistic locking - only claims if status is PENDING.
+        Uses optimistic locking - only claims if status is PENDING. Batches
+        created by this manager are served from its local cache, so only the
+        claim itself goes to the database. The cache entry is dropped whether
+        or not the claim succeeds.
 
         Args:
             batch_id: The batch UUID to claim
@@ -199,18 +244,23 @@ class BatchManager:
             Batch data if claimed, None if already claimed/processed
         """
 
+        cached_items = self._local_cache.pop(batch_id, None)
+        returning = "id, batch_number, total_batches, items_count"
+        if cached_items is None:
+            returning += ", work_items"
+
         def _claim(session: Any) -> Optional[Dict[str, Any]]:
             # Try to claim the batch (only if PENDING)
             result = session.execute(
                 text(
-                    """
+                    f"""
                     UPDATE job_batches
                     SET status = 'RUNNING',
                         worker_id = :worker_id,
                         started_at = NOW(),
                         updated_at = NOW()
                     WHERE id = :batch_id AND status = 'PENDING'
-                    RETURNING id, batch_number, total_batches, work_items, items_count
+                    RETURNING {returning}
                 """
                 ),
                 {"batch_id": batch_id, "worker_id": worker_id},
@@ -219,24 +269,22 @@ class BatchManager:
             session.commit()
 
             if row:
-                # work_items is stored as JSONB so SQLAlchemy auto-deserializes it
-                work_items = row[3]
-                if isinstance(work_items, str):
-                    work_items = json.loads(work_items)
+                work_items = cached_items
+                if work_items is None:
+                    # work_items is stored as JSONB so SQLAlchemy auto-deserializes it
+                    work_items = row[4]
+                    if isinstance(work_items, str):
+                        work_items = json.loads(work_items)
                 return {
                     "id": str(row[0]),
                     "batch_number": row[1],
                     "total_batches": row[2],
                     "work_items": work_items,
-                    "items_count": row[4],
+                    "items_count": row[3],
                 }
             return None
 
-        if db:
-            return _claim(db.session)
-        else:
-            with CatalogDatabase(self.catalog_id) as db_conn:
-                return _claim(db_conn.session)
+        return self._run(_claim, db)
 
     def complete_batch(
         self,
@@ -273,16 +321,12 @@ class BatchManager:
                     "processed_count": result.processed_count,
                     "success_count": result.success_count,
                     "error_count": result.error_count,
-                    "results": json.dumps(result.results),
+                    "results": json.dumps(result.results, separators=_JSON_SEPARATORS),
                 },
             )
             session.commit()
 
-        if db:
-            _complete(db.session)
-        else:
-            with CatalogDatabase(self.catalog_id) as db_conn:
-                _complete(db_conn.session)
+        self._run(_complete, db)
 
         logger.debug(
             f"Batch {batch_id} completed: {result.success_count} success, "
@@ -320,11 +364,7 @@ class BatchManager:
             )
             session.commit()
 
-        if db:
-            _fail(db.session)
-        else:
-            with CatalogDatabase(self.catalog_id) as db_conn:
-                _fail(db_conn.session)
+        self._run(_fail, db)
 
         logger.warning(f"Batch {batch_id} failed: {error_message}")
 
@@ -335,6 +375,9 @@ class BatchManager:
         Check if a batch or the parent job has been cancelled.
 
         Workers should call this periodically to check if they should stop processing.
+        The in-process stop flag is checked first, the parent job's status is read
+        from the database at most once per CANCEL_POLL_INTERVAL_SECONDS, and a
+        positive result is remembered since cancellation is final.
 
         Args:
             batch_id: Optional batch UUID to check. If None, checks parent job.
@@ -343,6 +386,14 @@ class BatchManager:
         Returns:
             True if cancelled, False otherwise
         """
+        if self._cancelled or should_stop_job(self.parent_job_id):
+            self._cancelled = True
+            return True
+
+        now = time.monotonic()
+        check_parent = now - self._parent_checked_at >= CANCEL_POLL_INTERVAL_SECONDS
+        if not batch_id and not check_parent:
+            return False
 
         def _check(session: Any) -> bool:
             if batch_id:
@@ -360,7 +411,11 @@ class BatchManager:
                 if row and row[0] == "CANCELLED":
                     return True
 
+            if not check_parent:
+                return False
+
             # Check parent job status
+            self._parent_checked_at = now
             result = session.execute(
                 text(
                     """
@@ -372,26 +427,39 @@ class BatchManager:
             )
             row = result.fetchone()
             if row and row[0] in ("REVOKED", "CANCELLED"):
+                self._cancelled = True
                 return True
 
             return False
 
-        if db:
-            return _check(db.session)
-        else:
-            with CatalogDatabase(self.catalog_id) as db_conn:
-                return _check(db_conn.session)
+        return self._run(_check, db)
 
-    def get_progress(self, db: Optional[CatalogDatabase] = None) -> JobProgress:
+    def get_progress(
+        self,
+        db: Optional[CatalogDatabase] = None,
+        max_age: float = PROGRESS_CACHE_SECONDS,
+    ) -> JobProgress:
         """
         Get aggregated progress for the parent job.
 
+        Workers sharing this manager reuse one aggregate read for up to
+        max_age seconds instead of each scanning job_batches after every
+        batch. Pass max_age=0 when the answer must be current, e.g. to
+        decide whether the last batch has finished.
+
         Args:
             db: Optional database connection
+            max_age: Seconds a previous read may be reused for
 
         Returns:
             JobProgress with aggregated statistics
         """
+        with self._progress_lock:
+            if (
+                self._progress is not None
+                and time.monotonic() - self._progress_read_at < max_age
+            ):
+                return self._progress
 
         def _get_progress(session: Any) -> JobProgress:
             result = session.execute(
@@ -428,11 +496,11 @@ class BatchManager:
                 error_items=row[8] or 0,
             )
 
-        if db:
-            return _get_progress(db.session)
-        else:
-            with CatalogDatabase(self.catalog_id) as db_conn:
-                return _get_progress(db_conn.session)
+        progress = self._run(_get_progress, db)
+        with self._progress_lock:
+            self._progress = progress
+            self._progress_read_at = time.monotonic()
+        return progress
 
     def get_batch_ids(self, db: Optional[CatalogDatabase] = None) -> List[str]:
         """
@@ -458,11 +526,7 @@ class BatchManager:
             )
             return [str(row[0]) for row in result.fetchall()]
 
-        if db:
-            return _get_ids(db.session)
-        else:
-            with CatalogDatabase(self.catalog_id) as db_conn:
-                return _get_ids(db_conn.session)
+        return self._run(_get_ids, db)
 
     def get_stale_batches(
         self, stale_minutes: int = 30, db: Optional[CatalogDatabase] = None
@@ -494,11 +558,7 @@ class BatchManager:
             )
             return [str(row[0]) for row in result.fetchall()]
 
-        if db:
-            return _get_stale(db.session)
-        else:
-            with CatalogDatabase(self.catalog_id) as db_conn:
-                return _get_stale(db_conn.session)
+        return self._run(_get_stale, db)
 
     def reset_batch(self, batch_id: str, db: Optional[CatalogDatabase] = None) -> None:
         """
@@ -531,11 +591,7 @@ class BatchManager:
             )
             session.commit()
 
-        if db:
-            _reset(db.session)
-        else:
-            with CatalogDatabase(self.catalog_id) as db_conn:
-                _reset(db_conn.session)
+        self._run(_reset, db)
 
         logger.info(f"Reset batch {batch_id} to PENDING")
 
@@ -565,11 +621,9 @@ class BatchManager:
             session.commit()
             return count
 
-        if db:
-            return _cleanup(db.session)
-        else:
-            with CatalogDatabase(self.catalog_id) as db_conn:
-                return _cleanup(db_conn.session)
+        count = self._run(_cleanup, db)
+        self._local_cache.clear()
+        return count
 
 
 def publish_job_progress(
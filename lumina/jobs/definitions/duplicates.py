@@ -114,21 +114,20 @@ def finalize_duplicates(
         from lumina.db.session import get_db_session
 
         with get_db_session() as session:
-            db_images = (
-                session.query(Image)
+            rows = (
+                session.query(Image.id, Image.checksum, Image.dhash, Image.dhash_bits)
                 .filter(Image.catalog_id == catalog_id)
                 .filter(Image.dhash.isnot(None))
                 .all()
             )
+            # Prefer the integer dhash; fall back to hex for other widths
             images = [
                 {
-                    "id": str(img.id),
-                    "checksum": img.checksum,
-                    "dhash": img.dhash,
-                    "ahash": img.ahash,
-                    "whash": img.whash,
+                    "id": str(image_id),
+                    "checksum": checksum,
+                    "dhash": dhash if dhash_bits is None else dhash_bits,
                 }
-                for img in db_images
+                for image_id, checksum, dhash, dhash_bits in rows
             ]
 
     # Find exact duplicates
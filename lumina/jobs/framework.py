@@ -202,7 +202,9 @@ class JobExecutor(Generic[T]):
         batches = self._create_batches(items)
         logger.info(f"Created {len(batches)} batches for job {job_id}")
 
-        # Phase 3: Process sequentially (no parallelism)
+        # Phase 3: Process sequentially (no parallelism). Counts are kept as
+        # running totals; per-item results are only retained for finalize()
+        keep_results = self.job.finalize is not None
         all_results: List[Dict[str, Any]] = []
         all_errors: List[Dict[str, Any]] = []
         success_count = 0
@@ -213,7 +215,9 @@ class JobExecutor(Generic[T]):
         # Process each batch sequentially
         for i, batch in enumerate(batches):
             logger.debug(f"Processing batch {i+1}/{len(batches)} ({len(batch)} items)")
-            batch_result = self._process_batch(batch, catalog_id, kwargs)
+            batch_result = self._process_batch(
+                batch, catalog_id, kwargs, keep_results=keep_results
+            )
             all_results.extend(batch_result["results"])
             all_errors.extend(batch_result["errors"])
             success_count += batch_result["success_count"]
@@ -264,7 +268,11 @@ class JobExecutor(Generic[T]):
         return [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
 
     def _process_batch(
-        self, batch: List[T], catalog_id: str, kwargs: Dict[str, Any]
+        self,
+        batch: List[T],
+        catalog_id: str,
+        kwargs: Dict[str, Any],
+        keep_results: bool = True,
     ) -> Dict[str, Any]:
         """
         Process a single batch of items.
@@ -273,6 +281,8 @@ class JobExecutor(Generic[T]):
             batch: List of items to process
             catalog_id: The catalog being processed
             kwargs: Additional arguments for process function
+            keep_results: Whether to return per-item results (only needed
+                when the job has a finalize step)
 
         Returns:
             Dict with results, errors, success_count, error_count
@@ -285,7 +295,8 @@ class JobExecutor(Generic[T]):
         for item in batch:
             try:
                 result = self.job.process(item, catalog_id=catalog_id, **kwargs)
-                results.append(result)
+                if keep_results:
+                    results.append(result)
                 success_count += 1
             except Exception as e:
                 logger.warning(f"Error processing item {item}: {e}")
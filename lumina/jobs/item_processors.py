@@ -21,6 +21,19 @@ from .coordinator import register_item_processor
 
 logger = logging.getLogger(__name__)
 
+_INSERT_TAG_SQL = text(
+    """
+    INSERT INTO tags (catalog_id, name, category, created_at)
+    VALUES (:catalog_id, :name, :category, NOW())
+    ON CONFLICT (catalog_id, name) DO NOTHING
+    RETURNING id
+"""
+)
+
+_SELECT_TAG_SQL = text(
+    "SELECT id FROM tags WHERE catalog_id = :catalog_id AND name = :name"
+)
+
 
 @register_item_processor("analyze")
 def process_analyze_item(
@@ -358,23 +371,18 @@ def process_auto_tag_item(
                     if category is not None and hasattr(category, "value"):
                         category = category.value  # Convert enum to string
 
-                    # Get or create tag
-                    result = db_conn.session.execute(
-                        text(
-                            """
-                            INSERT INTO tags (catalog_id, name, category, created_at)
-                            VALUES (:catalog_id, :name, :category, NOW())
-                            ON CONFLICT (catalog_id, name) DO UPDATE SET catalog_id = tags.catalog_id
-                            RETURNING id
-                        """
-                        ),
-                        {
-                            "catalog_id": catalog_id,
-                            "name": tag.tag_name,
-                            "category": category,
-                        },
-                    )
-                    tag_id = result.scalar()
+                    # Get or create tag; DO NOTHING avoids rewriting rows
+                    # that already exist, so fall back to a plain lookup
+                    params = {
+                        "catalog_id": catalog_id,
+                        "name": tag.tag_name,
+                        "category": category,
+                    }
+                    tag_id = db_conn.session.execute(_INSERT_TAG_SQL, params).scalar()
+                    if tag_id is None:
+                        tag_id = db_conn.session.execute(
+                            _SELECT_TAG_SQL, params
+                        ).scalar()
 
                     # Create image_tag relationship
                     db_conn.session.execute(
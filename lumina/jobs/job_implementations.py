@@ -1,12 +1,25 @@
 """Job implementations using the new background job system."""
 
+import atexit
 import logging
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import text
 
 from ..analysis.scanner import ImageScanner
 from ..db import CatalogDB as CatalogDatabase
-from .background_jobs import should_stop_job, update_job_status
+from .background_jobs import (
+    get_gpu_executor,
+    get_gpu_worker_count,
+    should_stop_job,
+    update_job_status,
+)
 from .definitions import hash_v2  # noqa: F401  - registers hash_images_v2 job
 from .definitions import (  # noqa: F401  - registers detect_duplicates_v2 job
     detect_duplicates_v2,
@@ -17,6 +30,114 @@ from .types import JobContext
 
 logger = logging.getLogger(__name__)
 
+# Burst detection statements, built once at import rather than per run
+_METADATA_POPULATED_COUNT_SQL = text(
+    """
+    SELECT COUNT(*) FROM images
+    WHERE catalog_id = :catalog_id
+    AND COALESCE(processing_flags->>'metadata_columns_populated', 'false') = 'true'
+    """
+)
+
+_CATALOG_IMAGE_COUNT_SQL = text(
+    "SELECT COUNT(*) FROM images WHERE catalog_id = :catalog_id"
+)
+
+# Runs on a raw DB-API cursor, so it uses the driver's pyformat parameters
+_BURST_CANDIDATES_SQL = """
+    WITH ordered AS (
+        SELECT id, capture_time, camera_make, camera_model,
+               COALESCE(quality_score, 0)::float8 AS quality_score,
+               source_path, latitude, longitude,
+               COALESCE(geohash_6, '') as geohash,
+               focal_length, aperture, iso, dhash,
+               COALESCE(NULLIF(camera_make, ''), 'unknown')
+                   AS make_key,
+               COALESCE(NULLIF(camera_model, ''), 'unknown')
+                   AS model_key,
+               LAG(capture_time) OVER (
+                   PARTITION BY
+                       COALESCE(NULLIF(camera_make, ''), 'unknown'),
+                       COALESCE(NULLIF(camera_model, ''), 'unknown')
+                   ORDER BY capture_time, id
+               ) AS prev_time
+        FROM images
+        WHERE catalog_id = %(catalog_id)s
+        AND capture_time IS NOT NULL
+    ), runs AS (
+        SELECT *,
+               SUM(
+                   CASE WHEN capture_time - prev_time
+                             <= make_interval(secs => %(gap_threshold)s)
+                        THEN 0 ELSE 1 END
+               ) OVER (
+                   PARTITION BY make_key, model_key
+                   ORDER BY capture_time, id
+                   ROWS UNBOUNDED PRECEDING
+               ) AS run_id
+        FROM ordered
+    ), sized AS (
+        SELECT *,
+               COUNT(*) OVER (
+                   PARTITION BY make_key, model_key, run_id
+               ) AS run_size
+        FROM runs
+    )
+    SELECT id, capture_time, camera_make, camera_model,
+           quality_score, source_path, latitude, longitude,
+           geohash, focal_length, aperture, iso, dhash
+    FROM sized
+    WHERE run_size >= %(min_burst_size)s
+    ORDER BY make_key, model_key, capture_time, id
+"""
+
+_CLEAR_BURSTS_SQL = text(
+    """
+    WITH deleted AS (
+        DELETE FROM bursts WHERE catalog_id = :catalog_id RETURNING id
+    )
+    UPDATE images
+    SET burst_id = NULL, burst_sequence = NULL
+    WHERE burst_id IN (SELECT id FROM deleted)
+    """
+)
+
+_INSERT_BURST_SQL = text(
+    """
+    INSERT INTO bursts (
+        id, catalog_id, image_count, start_time, end_time,
+        duration_seconds, camera_make, camera_model,
+        best_image_id, selection_method, created_at
+    ) VALUES (
+        :id, :catalog_id, :image_count, :start_time, :end_time,
+        :duration, :make, :model, :best_image, :method, NOW()
+    )
+    """
+)
+
+_CREATE_BURST_ASSIGN_SQL = text(
+    """
+    CREATE TEMP TABLE tmp_burst_assign (
+        image_id TEXT, burst_id UUID, burst_sequence INTEGER
+    ) ON COMMIT DROP
+    """
+)
+
+_ANALYZE_BURST_ASSIGN_SQL = text("ANALYZE tmp_burst_assign")
+
+_APPLY_BURST_ASSIGN_SQL = text(
+    """
+    UPDATE images
+    SET burst_id = t.burst_id, burst_sequence = t.burst_sequence
+    FROM tmp_burst_assign t
+    WHERE images.id = t.image_id
+    """
+)
+
+_SET_CLIP_EMBEDDING_SQL = text(
+    "UPDATE images SET clip_embedding = :embedding WHERE id = :image_id"
+)
+
 
 def scan_analyze_job(ctx: JobContext) -> Dict[str, Any]:
     """Run catalog scan and analysis with cooperative cancellation support.
@@ -299,12 +420,105 @@ def generate_thumbnails_job(ctx: JobContext) -> Dict[str, Any]:
         raise
 
 
-def detect_bursts_job(ctx: JobContext) -> Dict[str, Any]:
-    """Detect burst photo sequences using timestamp clustering algorithm."""
+def _write_bursts(
+    catalog_id: str,
+    burst_batches: "queue.Queue[Optional[List[Any]]]",
+    result: Dict[str, Any],
+) -> None:
+    """Persist detected bursts as they arrive, in a single transaction.
+
+    Runs on its own thread and connection so database writes overlap with
+    burst detection. Replaces the catalog's existing bursts, then consumes
+    lists of BurstGroups from the queue until a None sentinel, and commits.
+    If the producer sets result["abort"], the transaction is rolled back.
+
+    Args:
+        catalog_id: Catalog whose bursts are being replaced
+        burst_batches: Queue of BurstGroup lists, terminated by None
+        result: Shared dict receiving "bursts" and "images" counts, or
+            "error" if writing failed
+    """
     import uuid
 
-    from sqlalchemy import text
+    from ..db.bulk import copy_rows
+
+    try:
+        with CatalogDatabase(catalog_id) as catalog_db:
+            session = catalog_db.session
+            assert session is not None
+
+            # Clear old bursts and their image assignments in one statement
+            session.execute(_CLEAR_BURSTS_SQL, {"catalog_id": catalog_id})
+            session.execute(_CREATE_BURST_ASSIGN_SQL)
+
+            burst_count = 0
+            image_count = 0
+            new_uuid = uuid.uuid4
+            while True:
+                bursts = burst_batches.get()
+                if bursts is None:
+                    break
+                if not bursts:
+                    continue
+
+                # Build this batch's burst rows and image assignments, then
+                # write each in a single statement
+                burst_rows = []
+                assignments = []
+                add_burst_row = burst_rows.append
+                add_assignments = assignments.extend
+                for burst in bursts:
+                    burst_id = str(new_uuid())
+                    add_burst_row(
+                        {
+                            "id": burst_id,
+                            "catalog_id": catalog_id,
+                            "image_count": burst.image_count,
+                            "start_time": burst.start_time,
+                            "end_time": burst.end_time,
+                            "duration": burst.duration_seconds,
+                            "make": burst.camera_make,
+                            "model": burst.camera_model,
+                            "best_image": burst.best_image_id,
+                            "method": burst.selection_method,
+                        }
+                    )
+                    add_assignments(
+                        (img.image_id, burst_id, idx)
+                        for idx, img in enumerate(burst.images)
+                    )
 
+                session.execute(_INSERT_BURST_SQL, burst_rows)
+                # COPY the assignments into a temp table; they are applied
+                # with a single join once every batch has arrived
+                copy_rows(
+                    session,
+                    "tmp_burst_assign",
+                    ("image_id", "burst_id", "burst_sequence"),
+                    assignments,
+                )
+                burst_count += len(burst_rows)
+                image_count += len(assignments)
+
+            if result.get("abort"):
+                session.rollback()
+                return
+
+            if burst_count:
+                session.execute(_ANALYZE_BURST_ASSIGN_SQL)
+                session.execute(_APPLY_BURST_ASSIGN_SQL)
+            session.commit()
+            result["bursts"] = burst_count
+            result["images"] = image_count
+    except Exception as e:
+        result["error"] = e
+        # Keep draining so the producer never blocks on a dead writer
+        while burst_batches.get() is not None:
+            pass
+
+
+def detect_bursts_job(ctx: JobContext) -> Dict[str, Any]:
+    """Detect burst photo sequences using timestamp clustering algorithm."""
     from ..analysis.burst_detector import BurstDetector, ImageInfo
 
     try:
@@ -336,20 +550,12 @@ def detect_bursts_job(ctx: JobContext) -> Dict[str, Any]:
             # Pre-flight check: ensure metadata columns are populated
             assert catalog_db.session is not None
             populated_check = catalog_db.session.execute(
-                text(
-                    """
-                    SELECT COUNT(*) FROM images
-                    WHERE catalog_id = :catalog_id
-                    AND COALESCE(processing_flags->>'metadata_columns_populated', 'false') = 'true'
-                """
-                ),
-                {"catalog_id": ctx.catalog_id},
+                _METADATA_POPULATED_COUNT_SQL, {"catalog_id": ctx.catalog_id}
             )
             populated_count = populated_check.scalar() or 0
             if populated_count == 0:
                 total_check = catalog_db.session.execute(
-                    text("SELECT COUNT(*) FROM images WHERE catalog_id = :catalog_id"),
-                    {"catalog_id": ctx.catalog_id},
+                    _CATALOG_IMAGE_COUNT_SQL, {"catalog_id": ctx.catalog_id}
                 )
                 total_count = total_check.scalar() or 0
                 if total_count > 0:
@@ -358,41 +564,26 @@ def detect_bursts_job(ctx: JobContext) -> Dict[str, Any]:
                         "Run the 'extract_metadata_columns' job first."
                     )
 
-            # Load images with metadata
-            result = catalog_db.session.execute(
-                text(
-                    """
-                    SELECT id, capture_time, camera_make, camera_model,
-                           quality_score, source_path, latitude, longitude,
-                           COALESCE(geohash_6, '') as geohash,
-                           focal_length, aperture, iso, dhash
-                    FROM images
-                    WHERE catalog_id = :catalog_id
-                    AND capture_time IS NOT NULL
-                    ORDER BY capture_time
-                """
-                ),
-                {"catalog_id": ctx.catalog_id},
-            )
-
-            images = [
-                ImageInfo(
-                    image_id=str(row[0]),
-                    timestamp=row[1],
-                    camera_make=row[2],
-                    camera_model=row[3],
-                    quality_score=row[4] or 0.0,
-                    source_path=row[5],
-                    latitude=row[6],
-                    longitude=row[7],
-                    geohash=row[8],
-                    focal_length=row[9],
-                    aperture=row[10],
-                    iso=row[11],
-                    dhash=row[12],
+            # Load images with metadata through a server-side DB-API cursor:
+            # rows stream in chunks and skip SQLAlchemy Row post-processing,
+            # which dominates for this simple but potentially huge query.
+            # Window functions split each camera's timeline into runs of
+            # shots within the gap threshold (LAG + running SUM), and only
+            # runs with at least min_burst_size images are loaded; a burst
+            # can never span a run boundary.
+            dbapi_conn = catalog_db.session.connection().connection.driver_connection
+            with dbapi_conn.cursor(name="burst_images") as cursor:
+                cursor.itersize = 10000
+                cursor.execute(
+                    _BURST_CANDIDATES_SQL,
+                    {
+                        "catalog_id": ctx.catalog_id,
+                        "gap_threshold": float(gap_threshold),
+                        "min_burst_size": int(min_burst_size),
+                    },
                 )
-                for row in result.fetchall()
-            ]
+
+                images = [ImageInfo(*row) for row in cursor]
 
             update_progress("detecting", 40, f"Analyzing {len(images)} images")
 
@@ -400,83 +591,48 @@ def detect_bursts_job(ctx: JobContext) -> Dict[str, Any]:
             if should_stop_job(ctx.job_id):
                 return {"cancelled": True}
 
-            # Detect bursts
+            # Detect bursts one camera at a time, handing each camera's
+            # bursts to a writer thread so saving overlaps with detection
             detector = BurstDetector(
                 gap_threshold_seconds=gap_threshold,
                 min_burst_size=min_burst_size,
             )
-            bursts = detector.detect_bursts(images)
-
-            update_progress("saving", 70, f"Saving {len(bursts)} bursts")
-
-            # Clear old bursts
-            assert catalog_db.session is not None
-            catalog_db.session.execute(
-                text("DELETE FROM bursts WHERE catalog_id = :catalog_id"),
-                {"catalog_id": ctx.catalog_id},
+            burst_batches: "queue.Queue[Optional[List[Any]]]" = queue.Queue()
+            written: Dict[str, Any] = {}
+            writer = threading.Thread(
+                target=_write_bursts,
+                args=(ctx.catalog_id, burst_batches, written),
+                name=f"burst-writer-{ctx.job_id}",
             )
+            writer.start()
+            try:
+                # The query already orders images by camera, then capture time
+                for camera_bursts in detector.iter_camera_bursts(
+                    images, presorted=True
+                ):
+                    if should_stop_job(ctx.job_id):
+                        written["abort"] = True
+                        break
+                    burst_batches.put(camera_bursts)
+                else:
+                    update_progress("saving", 70, "Saving bursts")
+            except BaseException:
+                written["abort"] = True
+                raise
+            finally:
+                burst_batches.put(None)
+                writer.join()
+
+            if "error" in written:
+                raise written["error"]
+            if written.get("abort"):
+                return {"cancelled": True}
 
-            # Save bursts
-            total_images_in_bursts = 0
-            for burst in bursts:
-                burst_id = str(uuid.uuid4())
-
-                # Insert burst record
-                assert catalog_db.session is not None
-                catalog_db.session.execute(
-                    text(
-                        """
-                        INSERT INTO bursts (
-                            id, catalog_id, image_count, start_time, end_time,
-                            duration_seconds, camera_make, camera_model,
-                            best_image_id, selection_method, created_at
-                        ) VALUES (
-                            :id, :catalog_id, :image_count, :start_time, :end_time,
-                            :duration, :make, :model, :best_image, :method, NOW()
-                        )
-                    """
-                    ),
-                    {
-                        "id": burst_id,
-                        "catalog_id": ctx.catalog_id,
-                        "image_count": burst.image_count,
-                        "start_time": burst.start_time,
-                        "end_time": burst.end_time,
-                        "duration": burst.duration_seconds,
-                        "make": burst.camera_make,
-                        "model": burst.camera_model,
-                        "best_image": burst.best_image_id,
-                        "method": burst.selection_method,
-                    },
-                )
-
-                # Update images with burst_id
-                for idx, img in enumerate(burst.images):
-                    assert catalog_db.session is not None
-                    catalog_db.session.execute(
-                        text(
-                            """
-                            UPDATE images
-                            SET burst_id = :burst_id, burst_sequence = :sequence
-                            WHERE id = :image_id
-                        """
-                        ),
-                        {
-                            "burst_id": burst_id,
-                            "sequence": idx,
-                            "image_id": img.image_id,
-                        },
-                    )
-
-                total_images_in_bursts += burst.image_count
-
-            assert catalog_db.session is not None
-            catalog_db.session.commit()
             update_progress("complete", 100, "Done")
 
             return {
-                "bursts_detected": len(bursts),
-                "images_in_bursts": total_images_in_bursts,
+                "bursts_detected": written["bursts"],
+                "images_in_bursts": written["images"],
                 "catalog_id": ctx.catalog_id,
             }
 
@@ -485,6 +641,192 @@ def detect_bursts_job(ctx: JobContext) -> Dict[str, Any]:
         raise
 
 
+def _stream_rows(
+    bind: Any, statement: Any, params: Dict[str, Any], batch_size: int = 1000
+) -> Iterator[Any]:
+    """Stream a query's rows from a dedicated connection.
+
+    Rows are fetched batch_size at a time through a server-side cursor. The
+    cursor lives on its own connection so the caller's session can keep
+    committing while the rows are consumed.
+
+    Args:
+        bind: Engine to open the connection on
+        statement: Query to run
+        params: Bind parameters for the query
+        batch_size: Rows fetched per round trip
+
+    Yields:
+        Result rows
+    """
+    with bind.connect() as conn:
+        yield from conn.execution_options(yield_per=batch_size).execute(
+            statement, params
+        )
+
+
+# Taggers kept warm across auto-tag jobs, one set per executor thread so a
+# model instance is never shared between concurrently running jobs
+_tagger_local = threading.local()
+_cached_taggers: List[Any] = []
+_cached_taggers_lock = threading.Lock()
+
+
+def _get_or_create_tagger(
+    backend: str,
+    model: Optional[str],
+    device: str,
+    ollama_host: Optional[str] = None,
+) -> Any:
+    """Return this thread's tagger for a configuration, creating it on first use.
+
+    Loading a model (and initializing CUDA) dominates small tagging jobs, so
+    taggers are reused by later jobs on the same thread and only released at
+    interpreter exit.
+
+    Args:
+        backend: "openclip", "ollama" or "combined"
+        model: Model name, or None for the backend default
+        device: Device for OpenCLIP (cuda, cpu, mps)
+        ollama_host: Ollama server URL, used by the combined backend
+
+    Returns:
+        A CombinedTagger or ImageTagger
+    """
+    from ..analysis.image_tagger import CombinedTagger, ImageTagger
+
+    cache = getattr(_tagger_local, "taggers", None)
+    if cache is None:
+        cache = _tagger_local.taggers = {}
+
+    key = (backend, model, device, ollama_host)
+    tagger = cache.get(key)
+    if tagger is None:
+        if backend == "combined":
+            tagger = CombinedTagger(
+                openclip_model=model or "ViT-B-32",
+                ollama_model="llava",
+                device=device,
+                ollama_host=ollama_host,
+            )
+        else:
+            tagger = ImageTagger(
+                backend=backend,
+                model=model,
+                device=device if backend == "openclip" else None,
+            )
+        cache[key] = tagger
+        with _cached_taggers_lock:
+            _cached_taggers.append(tagger)
+    return tagger
+
+
+@atexit.register
+def _cleanup_cached_taggers() -> None:
+    """Release GPU resources held by cached taggers."""
+    with _cached_taggers_lock:
+        taggers = list(_cached_taggers)
+        _cached_taggers.clear()
+    for tagger in taggers:
+        if hasattr(tagger, "cleanup"):
+            tagger.cleanup()
+
+
+def _tag_batch_in_process(
+    backend: str,
+    model: Optional[str],
+    paths: List[str],
+    threshold: float,
+    max_tags: int,
+) -> Tuple[List[Any], List[Optional[List[float]]]]:
+    """Tag a batch and compute its CLIP embeddings in a GPU worker process.
+
+    Args:
+        backend: Tagging backend ("openclip")
+        model: Model name, or None for the backend default
+        paths: Image paths as strings
+        threshold: Minimum tag confidence
+        max_tags: Maximum tags per image
+
+    Returns:
+        Tags and embeddings, each in the order of paths (None for images
+        whose embedding failed)
+    """
+    tagger = _get_or_create_tagger(backend, model, "cuda")
+    results = tagger.tag_batch(paths, threshold=threshold, max_tags=max_tags)
+    embeddings: List[Optional[List[float]]] = []
+    for path in paths:
+        try:
+            embeddings.append(tagger.get_embedding(path))
+        except Exception as e:
+            logger.warning(f"Failed to compute embedding for {path}: {e}")
+            embeddings.append(None)
+    return [results.get(Path(p), []) for p in paths], embeddings
+
+
+def _iter_tag_batches(
+    rows: Iterator[Any],
+    start_offset: int,
+    batch_size: int,
+    gpu_executor: Optional[Any] = None,
+    tag_args: Tuple[Any, ...] = (),
+    gpu_workers: int = 1,
+) -> Iterator[Tuple[int, List[Any], Optional["Future[Any]"]]]:
+    """Split streamed (id, path) rows into tagging batches.
+
+    With a GPU executor, each batch is submitted to it ahead of time, keeping
+    one batch per GPU worker in flight beyond the one being stored, and
+    batches are still yielded in order so checkpoints stay monotonic.
+
+    Args:
+        rows: (image_id, source_path) rows, already past start_offset
+        start_offset: Position of the first row in the full result
+        batch_size: Images per batch
+        gpu_executor: Optional process pool to tag batches on
+        tag_args: (backend, model, threshold, max_tags) for the pool
+        gpu_workers: Number of workers in the pool
+
+    Yields:
+        (batch_start, batch_rows, future) where future is None without a pool
+    """
+    batches = iter(lambda: list(islice(rows, batch_size)), [])
+    if gpu_executor is None:
+        for batch in batches:
+            yield start_offset, batch, None
+            start_offset += len(batch)
+        return
+
+    backend, model, threshold, max_tags = tag_args
+    window = 2 * gpu_workers
+    pending: Deque[Tuple[List[Any], "Future[Any]"]] = deque()
+    try:
+        for batch in batches:
+            pending.append(
+                (
+                    batch,
+                    gpu_executor.submit(
+                        _tag_batch_in_process,
+                        backend,
+                        model,
+                        [str(row[1]) for row in batch],
+                        threshold,
+                        max_tags,
+                    ),
+                )
+            )
+            if len(pending) >= window:
+                batch, future = pending.popleft()
+                yield start_offset, batch, future
+                start_offset += len(batch)
+        while pending:
+            batch, future = pending.popleft()
+            yield start_offset, batch, future
+            start_offset += len(batch)
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+
 def auto_tag_job(ctx: JobContext) -> Dict[str, Any]:
     """Auto-tag images using AI backends with GPU batch processing."""
     import json
@@ -499,7 +841,14 @@ def auto_tag_job(ctx: JobContext) -> Dict[str, Any]:
         ImageTagger,
         check_backends_available,
     )
-    from .tag_storage import store_image_tags
+    from .job_metrics import check_gpu_available
+    from .progress_publisher import ProgressAggregator
+    from .tag_storage import store_image_tags_bulk
+
+    # Per-batch/per-image progress is coalesced to limit job-row writes
+    progress_writer = ProgressAggregator(
+        lambda progress: update_job_status(ctx.job_id, "PROGRESS", progress=progress)
+    )
 
     try:
         # Parameters
@@ -545,6 +894,7 @@ def auto_tag_job(ctx: JobContext) -> Dict[str, Any]:
                 )
 
         with CatalogDatabase(ctx.catalog_id) as catalog_db:
+            session = catalog_db.require_session()
             # Progress update helper
             update_job_status(
                 ctx.job_id,
@@ -565,41 +915,34 @@ def auto_tag_job(ctx: JobContext) -> Dict[str, Any]:
             # Get images based on tag_mode
             if tag_mode == "untagged_only":
                 # Only images without any tags
-                assert catalog_db.session is not None
-                result = catalog_db.session.execute(
-                    text(
-                        """
-                        SELECT i.id, i.source_path FROM images i
-                        WHERE i.catalog_id = :catalog_id
-                        AND i.file_type = 'image'
-                        AND NOT EXISTS (
-                            SELECT 1 FROM image_tags it WHERE it.image_id = i.id
-                        )
-                    """
-                    ),
-                    {"catalog_id": ctx.catalog_id},
-                )
+                images_sql = """
+                    SELECT i.id, i.source_path FROM images i
+                    LEFT JOIN image_tags it ON it.image_id = i.id
+                    WHERE i.catalog_id = :catalog_id
+                    AND i.file_type = 'image'
+                    AND it.image_id IS NULL
+                """
             else:
                 # All images - for retagging
-                assert catalog_db.session is not None
-                result = catalog_db.session.execute(
-                    text(
-                        """
-                        SELECT i.id, i.source_path FROM images i
-                        WHERE i.catalog_id = :catalog_id
-                        AND i.file_type = 'image'
-                    """
-                    ),
-                    {"catalog_id": ctx.catalog_id},
-                )
+                images_sql = """
+                    SELECT i.id, i.source_path FROM images i
+                    WHERE i.catalog_id = :catalog_id
+                    AND i.file_type = 'image'
+                """
 
-            images_to_tag = result.fetchall()
-            total_images = len(images_to_tag)
+            # Count up front, then stream the rows while tagging instead of
+            # holding the whole list in memory
+            total_images = (
+                session.execute(
+                    text(f"SELECT COUNT(*) FROM ({images_sql}) to_tag"),
+                    {"catalog_id": ctx.catalog_id},
+                ).scalar()
+                or 0
+            )
 
             if total_images == 0:
                 # Check if all images are already tagged
-                assert catalog_db.session is not None
-                result = catalog_db.session.execute(
+                result = session.execute(
                     text("SELECT COUNT(*) FROM images WHERE catalog_id = :catalog_id"),
                     {"catalog_id": ctx.catalog_id},
                 )
@@ -622,38 +965,31 @@ def auto_tag_job(ctx: JobContext) -> Dict[str, Any]:
                         "catalog_id": ctx.catalog_id,
                     }
 
-            # GPU detection
-            device = "cpu"
-            try:
-                import torch
-
-                if torch.cuda.is_available():
-                    device = "cuda"
-                    logger.info("GPU acceleration enabled")
-            except ImportError:
-                pass
-
-            # Initialize tagger
-            tagger: Union[CombinedTagger, ImageTagger]
-            if backend == "combined":
-                tagger = CombinedTagger(
-                    openclip_model=model or "ViT-B-32",
-                    ollama_model="llava",
-                    device=device,
-                    ollama_host=os.environ.get("OLLAMA_HOST"),
-                )
-            else:
-                tagger = ImageTagger(
-                    backend=backend,
-                    model=model,
-                    device=device if backend == "openclip" else None,
+            # GPU detection (probed once per process)
+            device = "cuda" if check_gpu_available() else "cpu"
+            if device == "cuda":
+                logger.info("GPU acceleration enabled")
+
+            # On multi-GPU hosts OpenCLIP batches run in per-GPU processes;
+            # otherwise reuse this thread's tagger (and loaded model)
+            gpu_executor = (
+                get_gpu_executor()
+                if backend == "openclip" and device == "cuda"
+                else None
+            )
+            tagger: Optional[Union[CombinedTagger, ImageTagger]] = None
+            if gpu_executor is None:
+                tagger = _get_or_create_tagger(
+                    backend,
+                    model,
+                    device,
+                    os.environ.get("OLLAMA_HOST") if backend == "combined" else None,
                 )
 
             # Check for checkpoint to resume
             def get_checkpoint() -> Optional[int]:
                 """Get the last checkpoint offset."""
-                assert catalog_db.session is not None
-                result = catalog_db.session.execute(
+                result = session.execute(
                     text(
                         """
                         SELECT value FROM config
@@ -672,8 +1008,7 @@ def auto_tag_job(ctx: JobContext) -> Dict[str, Any]:
 
             def save_checkpoint(offset: int) -> None:
                 """Save checkpoint for resuming."""
-                assert catalog_db.session is not None
-                catalog_db.session.execute(
+                session.execute(
                     text(
                         """
                         INSERT INTO config (catalog_id, key, value, updated_at)
@@ -689,20 +1024,39 @@ def auto_tag_job(ctx: JobContext) -> Dict[str, Any]:
                         "value": json.dumps(offset),
                     },
                 )
-                assert catalog_db.session is not None
-                catalog_db.session.commit()
+                session.commit()
 
             start_offset = get_checkpoint() or 0
             if start_offset > 0:
                 logger.info(f"Resuming from checkpoint: {start_offset}/{total_images}")
 
+            # Path order keeps each batch's files clustered by directory so
+            # decoding benefits from readahead and the page cache; it also
+            # makes checkpoint offsets refer to a stable sequence
+            images_to_tag = islice(
+                _stream_rows(
+                    session.get_bind(),
+                    text(images_sql + " ORDER BY i.source_path, i.id"),
+                    {"catalog_id": ctx.catalog_id},
+                ),
+                start_offset,
+                None,
+            )
+
             tagged_count = 0
             failed_count = 0
 
             # Process images
             if backend in ("openclip", "combined"):
                 # Batch processing for OpenCLIP
-                for batch_start in range(start_offset, total_images, batch_size):
+                for batch_start, batch, tag_future in _iter_tag_batches(
+                    images_to_tag,
+                    start_offset,
+                    batch_size,
+                    gpu_executor,
+                    (backend, model, threshold, max_tags),
+                    get_gpu_worker_count(),
+                ):
                     if should_stop_job(ctx.job_id):
                         return {
                             "cancelled": True,
@@ -712,12 +1066,9 @@ def auto_tag_job(ctx: JobContext) -> Dict[str, Any]:
                             "catalog_id": ctx.catalog_id,
                         }
 
-                    batch_end = min(batch_start + batch_size, total_images)
-                    batch = images_to_tag[batch_start:batch_end]
-                    batch_paths: list[Union[str, Path]] = [
-                        Path(row[1]) for row in batch
-                    ]
-                    batch_ids = [row[0] for row in batch]
+                    batch_end = batch_start + len(batch)
+                    ids, batch_paths = zip(*batch)
+                    batch_ids = [str(img_id) for img_id in ids]
 
                     # Update progress
                     percent = (
@@ -725,10 +1076,8 @@ def auto_tag_job(ctx: JobContext) -> Dict[str, Any]:
                         if total_images > 0
                         else 0
                     )
-                    update_job_status(
-                        ctx.job_id,
-                        "PROGRESS",
-                        progress={
+                    progress_writer.submit(
+                        {
                             "current": batch_start,
                             "total": total_images,
                             "percent": percent,
@@ -738,8 +1087,13 @@ def auto_tag_job(ctx: JobContext) -> Dict[str, Any]:
                     )
 
                     try:
-                        # Tag batch
-                        if backend == "combined" and isinstance(tagger, CombinedTagger):
+                        # Tag batch; tags (and pool embeddings) in batch order
+                        embeddings: Optional[List[Any]] = None
+                        if tag_future is not None:
+                            batch_tags, embeddings = tag_future.result()
+                        elif backend == "combined" and isinstance(
+                            tagger, CombinedTagger
+                        ):
                             # Combined backend with progress callback
                             # Capture loop variable to avoid B023 closure issue
                             _batch_start = batch_start
@@ -750,10 +1104,8 @@ def auto_tag_job(ctx: JobContext) -> Dict[str, Any]:
                                 phase: str,
                                 _bs: int = _batch_start,
                             ) -> None:
-                                update_job_status(
-                                    ctx.job_id,
-                                    "PROGRESS",
-                                    progress={
+                                progress_writer.submit(
+                                    {
                                         "current": _bs + current,
                                         "total": total_images,
                                         "percent": int(
@@ -765,57 +1117,53 @@ def auto_tag_job(ctx: JobContext) -> Dict[str, Any]:
                                 )
 
                             results = tagger.tag_batch(
-                                batch_paths,
+                                list(batch_paths),
                                 threshold=threshold,
                                 max_tags=max_tags,
                                 progress_callback=progress_cb,
                             )
                         else:
+                            assert tagger is not None
                             results = tagger.tag_batch(
-                                batch_paths,
+                                list(batch_paths),
                                 threshold=threshold,
                                 max_tags=max_tags,
                             )
-
-                        # Store tags and embeddings
-                        for img_id, img_path in zip(batch_ids, batch_paths):
-                            # img_path is always Path, but annotated as Union for batch_paths
-                            tags = results.get(
-                                (
-                                    img_path
-                                    if isinstance(img_path, Path)
-                                    else Path(img_path)
-                                ),
-                                [],
+                        if tag_future is None:
+                            batch_tags = [results.get(Path(p), []) for p in batch_paths]
+
+                        # Store all of the batch's tags in one go
+                        image_tags = [
+                            (img_id, tags)
+                            for img_id, tags in zip(batch_ids, batch_tags)
+                            if tags
+                        ]
+                        tagged_count += len(
+                            store_image_tags_bulk(
+                                catalog_db, ctx.catalog_id, image_tags, backend
                             )
-                            if tags:
-                                stored = store_image_tags(
-                                    catalog_db,
-                                    ctx.catalog_id,
-                                    str(img_id),
-                                    tags,
-                                    backend,
-                                )
-                                if stored > 0:
-                                    tagged_count += 1
+                        )
 
-                            # Save CLIP embedding for semantic search
-                            if backend in ("openclip", "combined") and hasattr(
-                                tagger, "get_embedding"
-                            ):
+                        # Save CLIP embeddings for semantic search
+                        save_embeddings = embeddings is not None or hasattr(
+                            tagger, "get_embedding"
+                        )
+                        for i, (img_id, img_path) in enumerate(
+                            zip(batch_ids, batch_paths)
+                        ):
+                            if save_embeddings:
                                 try:
-                                    embedding = tagger.get_embedding(img_path)
-                                    assert catalog_db.session is not None
-                                    catalog_db.session.execute(
-                                        text(
-                                            """
-                                            UPDATE images
-                                            SET clip_embedding = :embedding
-                                            WHERE id = :image_id
-                                        """
-                                        ),
+                                    if embeddings is not None:
+                                        embedding = embeddings[i]
+                                        if embedding is None:
+                                            continue  # logged by the worker
+                                    else:
+                                        assert tagger is not None
+                                        embedding = tagger.get_embedding(img_path)
+                                    session.execute(
+                                        _SET_CLIP_EMBEDDING_SQL,
                                         {
-                                            "image_id": str(img_id),
+                                            "image_id": img_id,
                                             "embedding": embedding,
                                         },
                                     )
@@ -824,8 +1172,7 @@ def auto_tag_job(ctx: JobContext) -> Dict[str, Any]:
                                         f"Failed to save embedding for {img_id}: {e}"
                                     )
 
-                        assert catalog_db.session is not None
-                        catalog_db.session.commit()
+                        session.commit()
 
                         # Save checkpoint after each batch
                         save_checkpoint(batch_end)
@@ -837,67 +1184,75 @@ def auto_tag_job(ctx: JobContext) -> Dict[str, Any]:
                         save_checkpoint(batch_end)
 
             else:  # ollama
-                # Sequential processing for Ollama
-                for i, (img_id, source_path) in enumerate(images_to_tag):
-                    if i < start_offset:
-                        continue
-
-                    if should_stop_job(ctx.job_id):
-                        return {
-                            "cancelled": True,
-                            "images_tagged": tagged_count,
-                            "images_failed": failed_count,
-                            "total_images": total_images,
-                            "catalog_id": ctx.catalog_id,
-                        }
-
-                    # Update progress
-                    percent = int((i / total_images) * 100) if total_images > 0 else 0
-                    update_job_status(
-                        ctx.job_id,
-                        "PROGRESS",
-                        progress={
-                            "current": i,
-                            "total": total_images,
-                            "percent": percent,
-                            "phase": "tagging",
-                            "current_file": Path(source_path).name,
-                        },
+                # Ollama calls are HTTP-bound: tag a chunk of images
+                # concurrently, then store the chunk's tags on this thread
+                assert tagger is not None
+                ollama_tagger = tagger
+                concurrency = max(1, int(os.environ.get("OLLAMA_CONCURRENCY", "8")))
+
+                def tag_one(source_path: str) -> List[Any]:
+                    return ollama_tagger.tag_image(
+                        source_path, threshold=threshold, max_tags=max_tags
                     )
 
-                    try:
-                        tags = tagger.tag_image(
-                            source_path,
-                            threshold=threshold,
-                            max_tags=max_tags,
+                with ThreadPoolExecutor(
+                    max_workers=concurrency, thread_name_prefix="ollama-tag"
+                ) as ollama_pool:
+                    for chunk_start, chunk, _ in _iter_tag_batches(
+                        images_to_tag, start_offset, concurrency
+                    ):
+                        if should_stop_job(ctx.job_id):
+                            return {
+                                "cancelled": True,
+                                "images_tagged": tagged_count,
+                                "images_failed": failed_count,
+                                "total_images": total_images,
+                                "catalog_id": ctx.catalog_id,
+                            }
+
+                        # Update progress
+                        percent = (
+                            int((chunk_start / total_images) * 100)
+                            if total_images > 0
+                            else 0
+                        )
+                        progress_writer.submit(
+                            {
+                                "current": chunk_start,
+                                "total": total_images,
+                                "percent": percent,
+                                "phase": "tagging",
+                                "current_file": Path(chunk[0][1]).name,
+                            },
                         )
 
-                        if tags:
-                            stored = store_image_tags(
-                                catalog_db, ctx.catalog_id, str(img_id), tags, "ollama"
-                            )
-                            if stored > 0:
-                                tagged_count += 1
-
-                        # Commit and checkpoint every 10 images
-                        if (i + 1) % 10 == 0:
-                            assert catalog_db.session is not None
-                            catalog_db.session.commit()
-                            save_checkpoint(i + 1)
-
-                    except Exception as img_e:
-                        logger.warning(f"Failed to tag {source_path}: {img_e}")
-                        failed_count += 1
+                        futures = [
+                            ollama_pool.submit(tag_one, source_path)
+                            for _, source_path in chunk
+                        ]
+                        image_tags = []
+                        for (img_id, source_path), future in zip(chunk, futures):
+                            try:
+                                tags = future.result()
+                            except Exception as img_e:
+                                logger.warning(f"Failed to tag {source_path}: {img_e}")
+                                failed_count += 1
+                                continue
+                            if tags:
+                                image_tags.append((str(img_id), tags))
 
-                # Final commit
-                assert catalog_db.session is not None
-                catalog_db.session.commit()
+                        tagged_count += len(
+                            store_image_tags_bulk(
+                                catalog_db, ctx.catalog_id, image_tags, "ollama"
+                            )
+                        )
 
-            # Cleanup
-            if hasattr(tagger, "cleanup"):
-                tagger.cleanup()
+                        # Commit and checkpoint after each chunk
+                        session.commit()
+                        save_checkpoint(chunk_start + len(chunk))
 
             # Final progress
+            progress_writer.close()
             update_job_status(
                 ctx.job_id,
                 "PROGRESS",
@@ -920,6 +1275,8 @@ def auto_tag_job(ctx: JobContext) -> Dict[str, Any]:
     except Exception:
         logger.exception(f"Auto-tagging job {ctx.job_id} failed")
         raise
+    finally:
+        progress_writer.close()
 
 
 def extract_metadata_columns_job(ctx: JobContext) -> Dict[str, Any]:
@@ -1314,13 +1671,16 @@ def organize_job(ctx: JobContext) -> Dict[str, Any]:
     dry_run = ctx.get("dry_run", False)
     scope = ctx.get("scope", "new")
 
+    # One status write covers loading, discovery and planning; the phases
+    # in between are only logged
     update_job_status(
         ctx.job_id,
         "PROGRESS",
-        progress={"current": 0, "total": 100, "percent": 0, "phase": "loading"},
+        progress={"current": 0, "total": 100, "percent": 0, "phase": "planning"},
     )
 
     # Load catalog and validate organized_directory
+    logger.info(f"[{ctx.job_id}] Loading catalog {ctx.catalog_id}")
     with get_db_context() as db:
         catalog = db.query(Catalog).filter(Catalog.id == ctx.catalog_id).first()
         if not catalog:
@@ -1333,12 +1693,7 @@ def organize_job(ctx: JobContext) -> Dict[str, Any]:
         output_dir = Path(catalog.organized_directory)
 
     # Query images based on scope
-    update_job_status(
-        ctx.job_id,
-        "PROGRESS",
-        progress={"current": 5, "total": 100, "percent": 5, "phase": "discovering"},
-    )
-
+    logger.info(f"[{ctx.job_id}] Discovering images")
     with get_db_context() as db:
         query = db.query(Image).filter(Image.catalog_id == ctx.catalog_id)
         images = query.all()
@@ -1347,12 +1702,7 @@ def organize_job(ctx: JobContext) -> Dict[str, Any]:
     checksum_map: Dict[str, str] = {str(img.id): (img.checksum or "") for img in images}
 
     # Build organization plan
-    update_job_status(
-        ctx.job_id,
-        "PROGRESS",
-        progress={"current": 10, "total": 100, "percent": 10, "phase": "planning"},
-    )
-
+    logger.info(f"[{ctx.job_id}] Planning organization of {len(images)} images")
     plan = _plan_organization(images, output_dir, scope)
 
     if dry_run:
@@ -1875,9 +2225,9 @@ def classify_images_job(ctx: Any) -> Dict[str, Any]:
     classifier = ImageClassifier(model=model) if use_vlm else None
 
     with CatalogDatabase(ctx.catalog_id) as catalog_db:
-        assert catalog_db.session is not None
+        session = catalog_db.require_session()
         where_clause = "" if reclassify else "AND content_class IS NULL"
-        rows = catalog_db.session.execute(
+        rows = session.execute(
             sa_text(
                 f"""
                 SELECT id, source_path, thumbnail_path
@@ -1891,91 +2241,91 @@ def classify_images_job(ctx: Any) -> Dict[str, Any]:
             {"cid": str(ctx.catalog_id)},
         ).fetchall()
 
-    total = len(rows)
-    if total == 0:
-        return {"classified": 0, "total": 0, "skipped": 0, "by_class": {}}
-
-    classified = 0
-    failed = 0
-    by_class: Dict[str, int] = {}
-    pending_updates: list = []
-
-    def flush(force: bool = False):
-        nonlocal classified
-        if not pending_updates or (not force and len(pending_updates) < batch_size):
-            return
-        with CatalogDatabase(ctx.catalog_id) as db2:
-            assert db2.session is not None
-            for img_id, label in pending_updates:
-                db2.session.execute(
-                    sa_text("UPDATE images SET content_class = :cls WHERE id = :id"),
-                    {"cls": label, "id": str(img_id)},
-                )
-            db2.session.commit()
-        classified += len(pending_updates)
-        pending_updates.clear()
-
-    for i, row in enumerate(rows):
-        img_id, source_path, thumbnail_path = row
+        total = len(rows)
+        if total == 0:
+            return {"classified": 0, "total": 0, "skipped": 0, "by_class": {}}
+
+        classified = 0
+        failed = 0
+        by_class: Dict[str, int] = {}
+        pending_updates: list = []
+
+        def flush(force: bool = False):
+            nonlocal classified
+            if not pending_updates or (not force and len(pending_updates) < batch_size):
+                return
+            session.execute(
+                sa_text("UPDATE images SET content_class = :cls WHERE id = :id"),
+                [
+                    {"cls": label, "id": str(img_id)}
+                    for img_id, label in pending_updates
+                ],
+            )
+            session.commit()
+            classified += len(pending_updates)
+            pending_updates.clear()
 
-        if should_stop_job(ctx.job_id):
-            break
+        for i, row in enumerate(rows):
+            img_id, source_path, thumbnail_path = row
 
-        # Resolve paths: thumbnails are relative to catalog_root
-        path_to_use = None
-        if thumbnail_path:
-            p = catalog_root / thumbnail_path
-            if p.exists():
-                path_to_use = p
-        if path_to_use is None:
-            p = Path(source_path)
-            if p.exists():
-                path_to_use = p
-
-        if path_to_use is None:
-            failed += 1
-        else:
-            try:
-                label, _ = heuristic_classify(path_to_use)
-                if label == "unknown" and use_vlm and classifier:
-                    label = classifier.classify_with_vlm(path_to_use)
-                elif label == "unknown":
-                    # Heuristics undecided and no VLM — skip rather than write a
-                    # misleading 'other' label; image stays NULL for a future VLM pass
-                    by_class["_skipped_unknown"] = (
-                        by_class.get("_skipped_unknown", 0) + 1
-                    )
-                    continue
-                by_class[label] = by_class.get(label, 0) + 1
-                pending_updates.append((img_id, label))
-                flush()
-            except Exception as e:
-                logger.warning(f"Classification failed for {img_id}: {e}")
+            if should_stop_job(ctx.job_id):
+                break
+
+            # Resolve paths: thumbnails are relative to catalog_root
+            path_to_use = None
+            if thumbnail_path:
+                p = catalog_root / thumbnail_path
+                if p.exists():
+                    path_to_use = p
+            if path_to_use is None:
+                p = Path(source_path)
+                if p.exists():
+                    path_to_use = p
+
+            if path_to_use is None:
                 failed += 1
+            else:
+                try:
+                    label, _ = heuristic_classify(path_to_use)
+                    if label == "unknown" and use_vlm and classifier:
+                        label = classifier.classify_with_vlm(path_to_use)
+                    elif label == "unknown":
+                        # Heuristics undecided and no VLM — skip rather than write a
+                        # misleading 'other' label; image stays NULL for a future VLM pass
+                        by_class["_skipped_unknown"] = (
+                            by_class.get("_skipped_unknown", 0) + 1
+                        )
+                        continue
+                    by_class[label] = by_class.get(label, 0) + 1
+                    pending_updates.append((img_id, label))
+                    flush()
+                except Exception as e:
+                    logger.warning(f"Classification failed for {img_id}: {e}")
+                    failed += 1
+
+            if (i + 1) % batch_size == 0 or i == total - 1:
+                flush(force=True)
+                pct = int((i + 1) / total * 100)
+                update_job_status(
+                    ctx.job_id,
+                    "PROGRESS",
+                    progress={
+                        "current": i + 1,
+                        "total": total,
+                        "percent": pct,
+                        "message": f"Classified {classified + len(pending_updates)}/{total}",
+                    },
+                )
 
-        if (i + 1) % batch_size == 0 or i == total - 1:
-            flush(force=True)
-            pct = int((i + 1) / total * 100)
-            update_job_status(
-                ctx.job_id,
-                "PROGRESS",
-                progress={
-                    "current": i + 1,
-                    "total": total,
-                    "percent": pct,
-                    "message": f"Classified {classified + len(pending_updates)}/{total}",
-                },
-            )
-
-    flush(force=True)
+        flush(force=True)
 
-    return {
-        "classified": classified,
-        "failed": failed,
-        "total": total,
-        "use_vlm": use_vlm,
-        "by_class": by_class,
-    }
+        return {
+            "classified": classified,
+            "failed": failed,
+            "total": total,
+            "use_vlm": use_vlm,
+            "by_class": by_class,
+        }
 
 
 # Job registry
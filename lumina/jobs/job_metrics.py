@@ -5,6 +5,7 @@ Tracks per-operation timing data to estimate job durations and
 automatically size batches to complete within reasonable timeouts.
 """
 
+import functools
 import json
 import logging
 import time
@@ -311,12 +312,16 @@ class TimedOperationContext:
             self.tracker.record_timing(metric)
 
 
+@functools.lru_cache(maxsize=1)
 def check_gpu_available() -> bool:
     """Check if GPU acceleration is available and functional.
 
     This tests actual CUDA operation, not just detection, to handle cases
     where CUDA is detected but the GPU architecture isn't supported by
     the installed PyTorch version (e.g., RTX 5060 Ti Blackwell sm_120).
+
+    The answer cannot change within a process, so it is computed once;
+    call check_gpu_available.cache_clear() to force a re-check.
     """
     try:
         import torch
@@ -13,24 +13,102 @@ The design prioritizes:
 5. Clean separation of concerns
 """
 
+import heapq
+import itertools
 import logging
 import threading
+import time
 from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
-# In-memory progress storage
-_progress_storage: Dict[str, Dict[str, Any]] = {}
-_progress_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+
+@dataclass(slots=True)
+class ProgressEntry:
+    """Progress and job metadata for a single job tracked in memory."""
+
+    job_id: str
+    status: str = "PENDING"
+    current: int = 0
+    total: int = 0
+    percent: int = 0
+    message: str = ""
+    timestamp: str = ""
+    extra: Optional[Dict[str, Any]] = None
+    job_type: Optional[str] = None
+    params: Optional[Dict[str, Any]] = None
+    catalog_id: Optional[str] = None
+    created_ts: float = 0.0
+    _snapshot: Optional[Mapping[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def snapshot(self) -> Mapping[str, Any]:
+        """Get a read-only view of this entry, cached until the next update."""
+        if self._snapshot is None:
+            data = self.as_dict()
+            data["progress"] = MappingProxyType(data["progress"])
+            self._snapshot = MappingProxyType(data)
+        return self._snapshot
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Build the dictionary form of this entry for API consumers."""
+        progress: Dict[str, Any] = {
+            "current": self.current,
+            "total": self.total,
+            "percent": self.percent,
+            "message": self.message,
+        }
+        if self.extra:
+            progress.update(self.extra)
+
+        created_at = datetime.utcfromtimestamp(self.created_ts).isoformat()
+        return {
+            "job_id": self.job_id,
+            "type": self.job_type,
+            "params": self.params,
+            "catalog_id": self.catalog_id,
+            "status": self.status,
+            "progress": progress,
+            "timestamp": self.timestamp,
+            "created_at": created_at,
+            "updated_at": self.timestamp or created_at,
+        }
+
+
+# In-memory progress storage, sharded by job ID so writers to different
+# shards (and cleanup scanning one shard) don't contend on a single dict.
+_STORAGE_SHARDS = 16  # Must be a power of two
+_shards: List[Dict[str, ProgressEntry]] = [{} for _ in range(_STORAGE_SHARDS)]
+_shard_locks: List[threading.Lock] = [threading.Lock() for _ in range(_STORAGE_SHARDS)]
+
+
+def _shard_index(job_id: str) -> int:
+    """Get the shard index holding a job's progress."""
+    return hash(job_id) & (_STORAGE_SHARDS - 1)
+
+
+def _shard_of(job_id: str) -> Dict[str, ProgressEntry]:
+    """Get the shard dict holding a job's progress."""
+    return _shards[_shard_index(job_id)]
+
+
+def _iter_entries() -> Iterator[ProgressEntry]:
+    """Iterate over a snapshot of the entries of every shard.
+
+    Each shard's values are copied (list() of a dict is atomic under the
+    GIL) so concurrent track/update calls cannot change a dict mid-loop.
+    """
+    return itertools.chain.from_iterable(list(shard.values()) for shard in _shards)
 
 
 def get_progress_lock(job_id: str) -> threading.Lock:
-    """Get or create a lock for job-specific progress."""
-    if job_id not in _progress_locks:
-        _progress_locks[job_id] = threading.Lock()
-    return _progress_locks[job_id]
+    """Get the lock guarding the shard that holds a job's progress."""
+    return _shard_locks[_shard_index(job_id)]
 
 
 def update_progress(
@@ -45,7 +123,7 @@ def update_progress(
     """
     Update job progress in memory.
 
-    Thread-safe implementation using per-job locks.
+    Thread-safe implementation using per-shard locks.
 
     Args:
         job_id: The Celery task ID
@@ -57,51 +135,62 @@ def update_progress(
         timestamp: Timestamp of update
 
     Returns:
-        True if updated successfully, False otherwise
+        True if updated successfully, False if current/total are not integers
     """
-    try:
-        with get_progress_lock(job_id):
-            # Build progress data
-            progress_data: Dict[str, Any] = {
-                "current": current,
-                "total": total,
-                "percent": int((current / total) * 100) if total > 0 else 0,
-                "message": message,
-            }
-
-            if extra:
-                progress_data.update(extra)
-
-            progress_entry: Dict[str, Any] = {
-                "status": state,
-                "progress": progress_data,
-                "timestamp": timestamp or datetime.utcnow().isoformat(),
-            }
-
-            _progress_storage[job_id] = progress_entry
+    if not isinstance(current, int) or not isinstance(total, int):
+        logger.warning(
+            "Invalid progress counts for job %s: current=%r total=%r",
+            job_id,
+            current,
+            total,
+        )
+        return False
 
+    shard = _shard_of(job_id)
+    with get_progress_lock(job_id):
+        entry = shard.get(job_id)
+        if entry is None:
+            entry = ProgressEntry(job_id=job_id, created_ts=time.time())
+            shard[job_id] = entry
+
+        entry.status = state
+        entry.current = current
+        entry.total = total
+        entry.percent = (current * 100) // total if total > 0 else 0
+        entry.message = message
+        entry.extra = extra
+        entry.timestamp = (
+            timestamp.isoformat() if timestamp else datetime.utcnow().isoformat()
+        )
+        entry._snapshot = None
+
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"Updated progress for job {job_id}: {state} {current}/{total}"
+                "Updated progress for job %s: %s %d/%d",
+                job_id,
+                state,
+                current,
+                total,
             )
-            return True
-
-    except Exception as e:
-        logger.warning(f"Failed to update progress for job {job_id}: {e}")
-        return False
+        return True
 
 
-def get_last_progress(job_id: str) -> Optional[Dict[str, Any]]:
+def get_last_progress(job_id: str) -> Optional[Mapping[str, Any]]:
     """
     Get the last progress update for a job from memory.
 
+    The result is a read-only view shared between callers until the job's
+    next update, so callers must not (and cannot) mutate it.
+
     Args:
         job_id: The Celery task ID
 
     Returns:
-        Progress dict if available, None otherwise
+        Read-only progress mapping if available, None otherwise
     """
     with get_progress_lock(job_id):
-        return _progress_storage.get(job_id)
+        entry = _shard_of(job_id).get(job_id)
+        return entry.snapshot() if entry is not None else None
 
 
 def track_job_in_memory(
@@ -120,28 +209,21 @@ def track_job_in_memory(
         catalog_id: Optional catalog ID
 
     Returns:
-        True if tracked successfully, False otherwise
+        True once the job is tracked
     """
-    try:
-        with get_progress_lock(job_id):
-            job_data = {
-                "job_id": job_id,
-                "type": job_type,
-                "params": params,
-                "catalog_id": catalog_id,
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat(),
-            }
-
-            # Store in global in-memory tracker
-            _progress_storage[job_id] = job_data
-
-            logger.debug(f"Tracked job {job_id} of type {job_type} in memory")
-            return True
-
-    except Exception as e:
-        logger.warning(f"Failed to track job {job_id} in memory: {e}")
-        return False
+    with get_progress_lock(job_id):
+        # Store in global in-memory tracker
+        _shard_of(job_id)[job_id] = ProgressEntry(
+            job_id=job_id,
+            job_type=job_type,
+            params=params,
+            catalog_id=catalog_id,
+            created_ts=time.time(),
+        )
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Tracked job %s of type %s in memory", job_id, job_type)
+        return True
 
 
 def get_recent_jobs_in_memory(limit: int = 50) -> list:
@@ -154,19 +236,9 @@ def get_recent_jobs_in_memory(limit: int = 50) -> list:
     Returns:
         List of recent job dictionaries
     """
-    try:
-        # Get all jobs and sort by creation time
-        all_jobs = [job_data for job_data in _progress_storage.values()]
-
-        # Sort by created_at (newest first)
-        all_jobs.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-
-        # Return limited list
-        return all_jobs[:limit]
-
-    except Exception as e:
-        logger.warning(f"Failed to get recent jobs from memory: {e}")
-        return []
+    # Newest first across all shards
+    recent = heapq.nlargest(limit, _iter_entries(), key=lambda x: x.created_ts)
+    return [entry.as_dict() for entry in recent]
 
 
 def cleanup_old_in_memory(max_age_hours: int = 24) -> int:
@@ -179,41 +251,103 @@ def cleanup_old_in_memory(max_age_hours: int = 24) -> int:
     Returns:
         Number of jobs cleaned up
     """
-    try:
-        cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
-        cleaned_count = 0
-
-        with get_progress_lock("cleanup"):
-            jobs_to_remove = []
-            for job_id, job_data in list(_progress_storage.items()):
-                if job_id == "cleanup":
-                    continue
-                created_at = datetime.fromisoformat(job_data.get("created_at", ""))
-                if created_at and created_at < cutoff_time:
-                    jobs_to_remove.append(job_id)
-                    del _progress_storage[job_id]
+    cutoff_ts = time.time() - timedelta(hours=max_age_hours).total_seconds()
+    cleaned_count = 0
+
+    for shard, lock in zip(_shards, _shard_locks):
+        # Scan a snapshot of the keys without the lock (list(dict) is
+        # atomic under the GIL), then lock only to pop the expired ones
+        expired = []
+        for job_id in list(shard):
+            entry = shard.get(job_id)
+            if entry is not None and entry.created_ts < cutoff_ts:
+                expired.append(job_id)
+
+        if not expired:
+            continue
+
+        with lock:
+            for job_id in expired:
+                # Re-check: the job may have been re-tracked since the scan
+                entry = shard.get(job_id)
+                if entry is not None and entry.created_ts < cutoff_ts:
+                    del shard[job_id]
                     cleaned_count += 1
 
-            logger.info(f"Cleaned up {cleaned_count} old jobs from memory")
-            return cleaned_count
-
-    except Exception as e:
-        logger.warning(f"Failed to cleanup old jobs from memory: {e}")
-        return 0
+    logger.info("Cleaned up %d old jobs from memory", cleaned_count)
+    return cleaned_count
 
 
 def get_in_memory_stats() -> Dict[str, int]:
     """Get statistics about in-memory job tracking."""
     stats: Dict[str, int] = defaultdict(int)
-    for job_data in _progress_storage.values():
-        if job_data.get("type"):
-            stats[job_data["type"]] += 1
+    for entry in _iter_entries():
+        if entry.job_type:
+            stats[entry.job_type] += 1
     return dict(stats)
 
 
+def _db_update_progress(
+    job_id: str,
+    state: str,
+    current: int = 0,
+    total: int = 0,
+    message: str = "",
+    extra: Optional[Dict[str, Any]] = None,
+    timestamp: Optional[datetime] = None,
+) -> bool:
+    """Publish progress to the database (the publisher stamps its own time)."""
+    from lumina.jobs.progress_publisher import publish_progress
+
+    return publish_progress(job_id, state, current, total, message, extra)
+
+
+def _db_get_last_progress(job_id: str) -> Optional[Dict[str, Any]]:
+    """Get last progress from the database."""
+    from lumina.jobs.progress_publisher import get_last_progress as db_get
+
+    return db_get(job_id)
+
+
+def _db_track_job(
+    job_id: str,
+    job_type: str,
+    params: Dict[str, Any],
+    catalog_id: Optional[str] = None,
+) -> None:
+    """Track a job in the database job history."""
+    from lumina.jobs.job_history import track_job as db_track
+
+    db_track(job_id, job_type, params)
+
+
+def _db_get_recent_jobs(limit: int = 50) -> List[Dict[str, Any]]:
+    """Get recent jobs from the database job history."""
+    from lumina.jobs.job_history import get_recent_jobs as db_get
+
+    return db_get(limit)
+
+
+def _db_get_stats() -> Dict[str, int]:
+    """Get job history statistics from the database."""
+    from lumina.jobs.job_history import get_job_history_stats as db_get
+
+    return db_get()
+
+
 # Fallback manager that chooses between database and in-memory
 class ProgressManager:
-    """Manages progress updates with fallback to in-memory storage."""
+    """Manages progress updates with fallback to in-memory storage.
+
+    The backend is fixed at construction, so the dispatch methods are bound
+    once in ``__init__`` directly to the chosen backend's functions.
+    """
+
+    update_progress: Callable[..., bool]
+    get_last_progress: Callable[[str], Optional[Mapping[str, Any]]]
+    track_job: Callable[..., Any]
+    get_recent_jobs: Callable[..., List[Dict[str, Any]]]
+    get_in_memory_stats: Callable[[], Dict[str, int]]
 
     def __init__(self, use_in_memory: bool = False):
         """Initialize progress manager.
@@ -223,72 +357,18 @@ class ProgressManager:
         """
         self.use_in_memory = use_in_memory
 
-    def update_progress(
-        self,
-        job_id: str,
-        state: str,
-        current: int = 0,
-        total: int = 0,
-        message: str = "",
-        extra: Optional[Dict[str, Any]] = None,
-        timestamp: Optional[datetime] = None,
-    ) -> bool:
-        """Update progress using appropriate backend."""
-        if self.use_in_memory:
-            return update_progress(
-                job_id, state, current, total, message, extra, timestamp
-            )
-        else:
-            # Use database progress publisher
-            from lumina.jobs.db_progress_publisher import update_progress as db_update
-
-            return db_update(job_id, state, current, total, message, extra, timestamp)
-
-    def get_last_progress(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """Get last progress using appropriate backend."""
-        if self.use_in_memory:
-            return get_last_progress(job_id)
-        else:
-            # Use database progress publisher
-            from lumina.jobs.db_progress_publisher import get_last_progress as db_get
-
-            return db_get(job_id)
-
-    def track_job(
-        self,
-        job_id: str,
-        job_type: str,
-        params: Dict[str, Any],
-        catalog_id: Optional[str] = None,
-    ) -> None:
-        """Track job using appropriate backend."""
-        if self.use_in_memory:
-            track_job_in_memory(job_id, job_type, params, catalog_id)
-        else:
-            # Use database job history
-            from lumina.jobs.job_history import track_job as db_track
-
-            db_track(job_id, job_type, params)
-
-    def get_recent_jobs(self, limit: int = 50) -> list[Dict[str, Any]]:
-        """Get recent jobs using appropriate backend."""
-        if self.use_in_memory:
-            return get_recent_jobs_in_memory(limit)
+        if use_in_memory:
+            self.update_progress = update_progress
+            self.get_last_progress = get_last_progress
+            self.track_job = track_job_in_memory
+            self.get_recent_jobs = get_recent_jobs_in_memory
+            self.get_in_memory_stats = get_in_memory_stats
         else:
-            # Use database job history
-            from lumina.jobs.job_history import get_recent_jobs as db_get
-
-            return db_get(limit)
-
-    def get_in_memory_stats(self) -> Dict[str, int]:
-        """Get in-memory statistics."""
-        if self.use_in_memory:
-            return get_in_memory_stats()
-        else:
-            # Use database job history stats
-            from lumina.jobs.job_history import get_job_history_stats as db_get
-
-            return db_get()
+            self.update_progress = _db_update_progress
+            self.get_last_progress = _db_get_last_progress
+            self.track_job = _db_track_job
+            self.get_recent_jobs = _db_get_recent_jobs
+            self.get_in_memory_stats = _db_get_stats
 
 
 # Global progress manager instance
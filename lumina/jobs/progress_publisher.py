@@ -12,30 +12,345 @@ The key design goals are:
 - Simple REST polling: frontend can poll every 1-2s without hanging
 """
 
-import json
+import asyncio
 import logging
+import select
+import threading
+import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
 
+import orjson
 from sqlalchemy import text
 from sqlalchemy.engine import Connection
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from ..db.bulk import copy_rows
 from ..db.connection import SessionLocal
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize a progress payload (datetimes become ISO 8601 strings)."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+_loads = orjson.loads
+
+# NOTIFY payloads must stay under 8000 bytes, and an oversized one would
+# fail (and roll back) the whole publish. Larger payloads are replaced by a
+# stub marked "truncated"; subscribers then read the stored row instead.
+NOTIFY_PAYLOAD_LIMIT = 8000
+
+_NOTIFY_FROM_UPSERT = f"""
+    SELECT pg_notify(
+        :channel,
+        CASE WHEN octet_length(n.body) < {NOTIFY_PAYLOAD_LIMIT} THEN n.body
+        ELSE jsonb_build_object(
+            'job_id', u.progress_data->'job_id',
+            'status', u.progress_data->'status',
+            'truncated', true
+        )::text END
+    )
+    FROM upsert u, LATERAL (SELECT u.progress_data::text AS body) n
+"""
+
+# Upsert the latest payload and notify subscribers in one round-trip.
+# pg_notify() takes the channel as a bind parameter, unlike NOTIFY, so job
+# IDs and payloads never get spliced into the SQL text. The payload is
+# bound once and cast to jsonb; the notification sends the stored value
+# back as text (or a stub, see NOTIFY_PAYLOAD_LIMIT).
+_PUBLISH_SQL = text(
+    """
+    WITH upsert AS (
+        INSERT INTO job_progress (job_id, progress_data, updated_at)
+        VALUES (:job_id, CAST(:payload AS jsonb), NOW())
+        ON CONFLICT (job_id) DO UPDATE
+            SET progress_data = EXCLUDED.progress_data, updated_at = NOW()
+        RETURNING progress_data
+    )
+    """
+    + _NOTIFY_FROM_UPSERT
+)
+
+# Staging table for publish_progress_batch(); temporary tables live per
+# connection, so pooled connections reuse it and commit empties it.
+_CREATE_STAGE_SQL = text(
+    """
+    CREATE TEMPORARY TABLE IF NOT EXISTS job_progress_stage (
+        job_id TEXT, progress_data JSONB
+    ) ON COMMIT DELETE ROWS
+"""
+)
+
+_MERGE_STAGE_SQL = text(
+    """
+    WITH upsert AS (
+        INSERT INTO job_progress (job_id, progress_data, updated_at)
+        SELECT job_id, progress_data, NOW() FROM job_progress_stage
+        ON CONFLICT (job_id) DO UPDATE
+            SET progress_data = EXCLUDED.progress_data, updated_at = NOW()
+        RETURNING progress_data
+    )
+    """
+    + _NOTIFY_FROM_UPSERT
+)
+
+_GET_PROGRESS_SQL = text(
+    "SELECT progress_data FROM job_progress WHERE job_id = :job_id"
+)
+
+_CLEAR_PROGRESS_SQL = text("DELETE FROM job_progress WHERE job_id = :job_id")
+
+# Old rows are deleted in batches of this size, one commit per batch, so
+# a large backlog never holds locks or generates WAL in one transaction.
+CLEANUP_BATCH_SIZE = 5000
+
+_CLEANUP_PROGRESS_SQL = text(
+    """
+    WITH doomed AS (
+        SELECT ctid FROM job_progress
+        WHERE updated_at < NOW() - make_interval(hours => :hours)
+        LIMIT :batch_size
+    )
+    DELETE FROM job_progress WHERE ctid IN (SELECT ctid FROM doomed)
+"""
+)
+
+
+# Every job publishes on one shared channel and subscribers filter by the
+# job_id in the payload, so the server keeps a single channel no matter
+# how many jobs are running.
+PROGRESS_CHANNEL = "job_progress"
+
+
 def get_progress_channel(job_id: str) -> str:
-    """Get PostgreSQL NOTIFY channel name for a job."""
-    return f"job_progress_{job_id}"
+    """Get PostgreSQL NOTIFY channel name for a job (shared by all jobs)."""
+    return PROGRESS_CHANNEL
 
 
-def get_progress_table_name() -> str:
-    """Get table name for storing job progress."""
-    # Use a single table with job_id as key for simplicity
-    return "job_progress"
+# publish_progress() skips an update unless the job's state changed, its
+# percentage moved by at least PROGRESS_MIN_STEP points, or this many
+# seconds passed since the last write. The last skipped update is written
+# once the interval is up if nothing newer was written by then.
+PROGRESS_MIN_INTERVAL = 0.25
+PROGRESS_MIN_STEP = 1
+
+TERMINAL_STATES = frozenset({"SUCCESS", "FAILURE"})
+
+
+def _percent(current: int, total: int) -> int:
+    """Completion percentage of current out of total (0 if total is unknown)."""
+    return current * 100 // total if total > 0 else 0
+
+
+class ProgressThrottle:
+    """
+    Decide per job whether a progress update is worth writing.
+
+    Loops that report after every item would otherwise send one upsert and
+    one NOTIFY per item. Terminal states and state changes always pass.
+    The latest skipped update of a job is kept and written once the
+    interval has elapsed, so a job that goes quiet does not leave stale
+    progress behind.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = PROGRESS_MIN_INTERVAL,
+        min_step: int = PROGRESS_MIN_STEP,
+    ):
+        """
+        Initialize throttle.
+
+        Args:
+            min_interval: Seconds after which any update is written
+            min_step: Percentage points after which any update is written
+        """
+        self.min_interval = min_interval
+        self.min_step = min_step
+        self._lock = threading.Lock()
+        # job_id -> (last write time, last percent, last state)
+        self._last: Dict[str, Tuple[float, int, str]] = {}
+        # job_id -> (state, percent, write) of the latest skipped update
+        self._pending: Dict[str, Tuple[str, int, Callable[[int], Any]]] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+        # job_id -> generation of the last update that passed
+        self._generations: Dict[str, int] = {}
+        self._next_generation = 0
+        # job_id -> lock held while a skipped update is being written
+        self._write_locks: Dict[str, threading.Lock] = {}
+
+    def check(
+        self,
+        job_id: str,
+        state: str,
+        current: int,
+        total: int,
+        write: Optional[Callable[[int], Any]] = None,
+    ) -> Optional[int]:
+        """
+        Check an update against the last one written for the job.
+
+        Records the update as written when it passes. When it is skipped
+        and ``write`` is given, ``write(percent)`` is called from a timer
+        thread once the interval is up, unless a newer update passes first.
+
+        Args:
+            job_id: The job ID
+            state: State of the update
+            current: Current progress count
+            total: Total items to process (0 if unknown)
+            write: Callback that writes this update
+
+        Returns:
+            The update's completion percentage if it should be written,
+            None if it should be skipped
+        """
+        if state in TERMINAL_STATES:
+            self.forget(job_id)
+            return _percent(current, total)
+
+        now = time.monotonic()
+        percent = _percent(current, total)
+        with self._lock:
+            last = self._last.get(job_id)
+            if (
+                last is not None
+                and last[2] == state
+                and percent < 100
+                and abs(percent - last[1]) < self.min_step
+                and now - last[0] < self.min_interval
+            ):
+                if write is not None:
+                    self._pending[job_id] = (state, percent, write)
+                    if job_id not in self._timers:
+                        delay = self.min_interval - (now - last[0])
+                        self._schedule_flush(job_id, delay)
+                return None
+            self._last[job_id] = (now, percent, state)
+            self._drop_pending(job_id)
+            write_lock = self._supersede(job_id)
+        self._wait_for_flush(write_lock)
+        return percent
+
+    def forget(self, job_id: str) -> None:
+        """Drop the state kept for a job, including any skipped update."""
+        with self._lock:
+            self._last.pop(job_id, None)
+            self._drop_pending(job_id)
+            # A flush in flight sees the generation gone and is dropped
+            self._generations.pop(job_id, None)
+            write_lock = self._write_locks.pop(job_id, None)
+        self._wait_for_flush(write_lock)
+
+    def _supersede(self, job_id: str) -> Optional[threading.Lock]:
+        """Start a new generation for a job (lock held).
+
+        Returns the job's write lock, if a skipped update may be in flight.
+        """
+        self._next_generation += 1
+        self._generations[job_id] = self._next_generation
+        return self._write_locks.get(job_id)
+
+    @staticmethod
+    def _wait_for_flush(write_lock: Optional[threading.Lock]) -> None:
+        """Block until an in-flight write of a skipped update finishes.
+
+        A newer update must not land before an older one still being written.
+        """
+        if write_lock is not None:
+            with write_lock:
+                pass
+
+    def _schedule_flush(self, job_id: str, delay: float) -> None:
+        """Start a timer that writes the job's skipped update (lock held)."""
+        timer = threading.Timer(delay, self._flush, (job_id,))
+        timer.daemon = True
+        self._timers[job_id] = timer
+        timer.start()
+
+    def _drop_pending(self, job_id: str) -> None:
+        """Discard a job's skipped update and its timer (lock held)."""
+        self._pending.pop(job_id, None)
+        timer = self._timers.pop(job_id, None)
+        if timer is not None:
+            timer.cancel()
+
+    def _flush(self, job_id: str) -> None:
+        """Write a job's skipped update if nothing newer was written.
+
+        The write runs outside the shared lock so a slow database only
+        holds up this job. A newer update that passes meanwhile either
+        makes this flush stale or waits for its write to finish.
+        """
+        with self._lock:
+            self._timers.pop(job_id, None)
+            pending = self._pending.pop(job_id, None)
+            if pending is None:
+                return
+            generation = self._generations.get(job_id)
+            write_lock = self._write_locks.setdefault(job_id, threading.Lock())
+        with write_lock:
+            with self._lock:
+                if self._generations.get(job_id) != generation:
+                    return
+                state, percent, write = pending
+                self._last[job_id] = (time.monotonic(), percent, state)
+            write(percent)
+
+
+_throttle = ProgressThrottle()
+
+
+def _store_and_notify(job_id: str, payload: str) -> None:
+    """Store a progress payload and NOTIFY it with a single statement."""
+    session = SessionLocal()
+    try:
+        session.execute(
+            _PUBLISH_SQL,
+            {
+                "job_id": job_id,
+                "payload": payload,
+                "channel": get_progress_channel(job_id),
+            },
+        )
+        session.commit()
+    except SQLAlchemyError:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def _progress_payload(
+    job_id: str,
+    state: str,
+    current: int,
+    total: int,
+    message: str,
+    extra: Optional[Dict[str, Any]],
+    percent: int,
+) -> Dict[str, Any]:
+    """Build the progress payload stored and sent for a job."""
+    progress_data: Dict[str, Any] = {
+        "current": current,
+        "total": total,
+        "percent": percent,
+        "message": message,
+    }
+    if extra:
+        progress_data.update(extra)
+
+    return {
+        "job_id": job_id,
+        "status": state,
+        "progress": progress_data,
+        "timestamp": datetime.utcnow(),
+    }
 
 
 def publish_progress(
@@ -53,6 +368,10 @@ def publish_progress(
     1. Stores progress in job_progress table (for polling)
     2. Sends PostgreSQL NOTIFY (for real-time subscribers)
 
+    Both happen in one statement, so each publish is a single round-trip.
+    Updates are throttled per job (see ProgressThrottle); a skipped update
+    still returns True and is written later if it stays the latest.
+
     Args:
         job_id: The Celery task ID
         state: Current state (PENDING, PROGRESS, SUCCESS, FAILURE)
@@ -64,54 +383,86 @@ def publish_progress(
     Returns:
         True if published successfully, False otherwise
     """
-    try:
-        session = SessionLocal()
+
+    def write(percent: int) -> bool:
         try:
-            # Build progress payload
-            progress_data: Dict[str, Any] = {
-                "current": current,
-                "total": total,
-                "percent": int((current / total) * 100) if total > 0 else 0,
-                "message": message,
-            }
-            if extra:
-                progress_data.update(extra)
-
-            progress: Dict[str, Any] = {
-                "job_id": job_id,
-                "status": state,
-                "progress": progress_data,
-                "timestamp": datetime.utcnow().isoformat(),
-            }
-
-            payload = json.dumps(progress)
-
-            # Store progress in database (upsert)
-            session.execute(
-                text(
-                    "INSERT INTO job_progress (job_id, progress_data, updated_at) VALUES (:job_id, :payload, NOW()) ON CONFLICT (job_id) DO UPDATE SET progress_data = :payload, updated_at = NOW()"
-                ),
-                {"job_id": job_id, "payload": payload},
+            progress = _progress_payload(
+                job_id, state, current, total, message, extra, percent
             )
-
-            # Send NOTIFY for real-time subscribers
-            channel_name = get_progress_channel(job_id)
-            session.execute(text(f"NOTIFY {channel_name}, '{payload}'"))
-
-            session.commit()
+            _store_and_notify(job_id, _dumps(progress))
             logger.debug(
                 f"Published progress for job {job_id}: {state} {current}/{total}"
             )
             return True
 
-        except SQLAlchemyError as e:
+        except Exception as e:
+            logger.warning(f"Failed to publish progress for job {job_id}: {e}")
+            return False
+
+    percent = _throttle.check(job_id, state, current, total, write)
+    if percent is None:
+        return True
+    return write(percent)
+
+
+def publish_progress_batch(entries: Iterable[Dict[str, Any]]) -> bool:
+    """
+    Publish a burst of progress updates in one transaction.
+
+    Only the last entry per job is kept. The payloads are loaded into a
+    temporary staging table with COPY and merged into job_progress (with a
+    NOTIFY per job) by a single statement. Entries bypass the per-job
+    throttle since the caller has already batched them.
+
+    Args:
+        entries: Dicts with publish_progress() keyword arguments (job_id
+            and state required)
+
+    Returns:
+        True if published successfully, False otherwise
+    """
+    latest: Dict[str, str] = {}
+    for entry in entries:
+        current = entry.get("current", 0)
+        total = entry.get("total", 0)
+        percent = _percent(current, total)
+        latest[entry["job_id"]] = _dumps(
+            _progress_payload(
+                entry["job_id"],
+                entry["state"],
+                current,
+                total,
+                entry.get("message", ""),
+                entry.get("extra"),
+                percent,
+            )
+        )
+    if not latest:
+        return True
+
+    try:
+        session = SessionLocal()
+        try:
+            session.execute(_CREATE_STAGE_SQL)
+            copy_rows(
+                session,
+                "job_progress_stage",
+                ("job_id", "progress_data"),
+                latest.items(),
+            )
+            session.execute(_MERGE_STAGE_SQL, {"channel": PROGRESS_CHANNEL})
+            session.commit()
+        except SQLAlchemyError:
             session.rollback()
-            raise e
+            raise
         finally:
             session.close()
 
+        logger.debug(f"Published progress for {len(latest)} jobs")
+        return True
+
     except Exception as e:
-        logger.warning(f"Failed to publish progress for job {job_id}: {e}")
+        logger.warning(f"Failed to publish progress batch: {e}")
         return False
 
 
@@ -133,44 +484,23 @@ def publish_completion(
     Returns:
         True if published successfully, False otherwise
     """
+    _throttle.forget(job_id)
     try:
-        session = SessionLocal()
-        try:
-            # Build completion payload
-            completion: Dict[str, Any] = {
-                "job_id": job_id,
-                "status": state,
-                "timestamp": datetime.utcnow().isoformat(),
-            }
-
-            if state == "SUCCESS" and result:
-                completion["result"] = result
-            elif state == "FAILURE" and error:
-                completion["result"] = {"error": error}
-
-            payload = json.dumps(completion)
-
-            # Store final state
-            session.execute(
-                text(
-                    "INSERT INTO job_progress (job_id, progress_data, updated_at) VALUES (:job_id, :payload, NOW()) ON CONFLICT (job_id) DO UPDATE SET progress_data = :payload, updated_at = NOW()"
-                ),
-                {"job_id": job_id, "payload": payload},
-            )
-
-            # Send NOTIFY
-            channel_name = get_progress_channel(job_id)
-            session.execute(text(f"NOTIFY {channel_name}, '{payload}'"))
-
-            session.commit()
-            logger.debug(f"Published completion for job {job_id}: {state}")
-            return True
-
-        except SQLAlchemyError as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+        # Build completion payload
+        completion: Dict[str, Any] = {
+            "job_id": job_id,
+            "status": state,
+            "timestamp": datetime.utcnow(),
+        }
+
+        if state == "SUCCESS" and result:
+            completion["result"] = result
+        elif state == "FAILURE" and error:
+            completion["result"] = {"error": error}
+
+        _store_and_notify(job_id, _dumps(completion))
+        logger.debug(f"Published completion for job {job_id}: {state}")
+        return True
 
     except Exception as e:
         logger.warning(f"Failed to publish completion for job {job_id}: {e}")
@@ -192,20 +522,10 @@ def get_last_progress(job_id: str) -> Optional[Dict[str, Any]]:
     try:
         session = SessionLocal()
         try:
-            result = session.execute(
-                text(
-                    f"""
-                    SELECT progress_data
-                    FROM {get_progress_table_name()}
-                    WHERE job_id = :job_id
-                    """
-                ),
-                {"job_id": job_id},
-            ).fetchone()
-
-            if result and result[0]:
-                return json.loads(result[0])
-            return None
+            # progress_data is JSONB, which the driver already decodes
+            return (
+                session.execute(_GET_PROGRESS_SQL, {"job_id": job_id}).scalar() or None
+            )
 
         finally:
             session.close()
@@ -228,10 +548,7 @@ def clear_progress(job_id: str) -> bool:
     try:
         session = SessionLocal()
         try:
-            session.execute(
-                text(f"DELETE FROM {get_progress_table_name()} WHERE job_id = :job_id"),
-                {"job_id": job_id},
-            )
+            session.execute(_CLEAR_PROGRESS_SQL, {"job_id": job_id})
             session.commit()
             return True
 
@@ -246,6 +563,158 @@ def clear_progress(job_id: str) -> bool:
         return False
 
 
+class ProgressAggregator:
+    """
+    Coalesce frequent progress updates into at most one write per interval.
+
+    Jobs can submit progress after every batch or image; only the latest
+    update is kept and handed to the publish callback, either immediately
+    when the interval has passed or from a timer once it does. An update
+    whose current count reaches its total is published right away.
+
+    Call close() (or use as a context manager) before the job writes its
+    final status so no delayed write lands after it.
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[Dict[str, Any]], Any],
+        interval: float = 0.5,
+    ):
+        """
+        Initialize aggregator.
+
+        Args:
+            publish: Called with each progress dict that gets written
+            interval: Minimum seconds between writes
+        """
+        self._publish = publish
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._publish_lock = threading.Lock()
+        self._pending: Optional[Dict[str, Any]] = None
+        self._timer: Optional[threading.Timer] = None
+        self._last_flush = -interval
+
+    def __enter__(self) -> "ProgressAggregator":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def submit(self, progress: Dict[str, Any]) -> None:
+        """
+        Record the latest progress, publishing it now or within the interval.
+
+        Args:
+            progress: Progress dict (as stored on the job)
+        """
+        total = progress.get("total") or 0
+        done = bool(total) and progress.get("current", 0) >= total
+        with self._lock:
+            self._pending = progress
+            delay = self._last_flush + self.interval - time.monotonic()
+            if not done and (self._timer is not None or delay > 0):
+                if self._timer is None:
+                    self._timer = threading.Timer(delay, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        """Publish the pending update, if any."""
+        with self._publish_lock:
+            with self._lock:
+                progress, self._pending = self._pending, None
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                self._last_flush = time.monotonic()
+            if progress is None:
+                return
+            try:
+                self._publish(progress)
+            except Exception as e:
+                logger.warning(f"Failed to publish aggregated progress: {e}")
+
+    def close(self) -> None:
+        """Cancel any pending timer and publish the last update."""
+        self.flush()
+
+
+class ProgressBuffer:
+    """
+    Buffer progress updates and publish them with publish_progress_batch().
+
+    For workers that report many updates (possibly for several jobs) in a
+    tight loop: updates are queued and written once max_entries are
+    buffered or the oldest is max_age seconds old. Call close() (or use as
+    a context manager) to write what is left.
+    """
+
+    def __init__(self, max_entries: int = 100, max_age: float = 0.5):
+        """
+        Initialize buffer.
+
+        Args:
+            max_entries: Buffered updates that trigger a write
+            max_age: Seconds after the first buffered update that trigger a write
+        """
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._entries: Deque[Dict[str, Any]] = deque()
+        self._first_at = 0.0
+
+    def __enter__(self) -> "ProgressBuffer":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def add(
+        self,
+        job_id: str,
+        state: str,
+        current: int = 0,
+        total: int = 0,
+        message: str = "",
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Queue an update (same arguments as publish_progress())."""
+        with self._lock:
+            if not self._entries:
+                self._first_at = time.monotonic()
+            self._entries.append(
+                {
+                    "job_id": job_id,
+                    "state": state,
+                    "current": current,
+                    "total": total,
+                    "message": message,
+                    "extra": extra,
+                }
+            )
+            due = (
+                len(self._entries) >= self.max_entries
+                or time.monotonic() - self._first_at >= self.max_age
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> bool:
+        """Write buffered updates; returns False if the write failed."""
+        with self._lock:
+            entries = list(self._entries)
+            self._entries.clear()
+        return publish_progress_batch(entries)
+
+    def close(self) -> None:
+        """Write whatever is still buffered."""
+        self.flush()
+
+
 class ProgressSubscriber:
     """
     PostgreSQL LISTEN/NOTIFY subscriber for real-time job progress.
@@ -266,15 +735,18 @@ class ProgressSubscriber:
         self.timeout = timeout
         self._session: Optional[Session] = None
         self._connection: Optional[Connection] = None
+        self._pending: Deque[Dict[str, Any]] = deque()
 
     def __enter__(self) -> "ProgressSubscriber":
         """Start subscription."""
         try:
             self._session = SessionLocal()
-            self._connection = self._session.connection()
-            self._connection.execute(
-                text(f"LISTEN {get_progress_channel(self.job_id)}")
+            # Notifications are only delivered outside a transaction, and
+            # LISTEN itself only takes effect once committed
+            self._connection = self._session.connection(
+                execution_options={"isolation_level": "AUTOCOMMIT"}
             )
+            self._connection.execute(text(f"LISTEN {PROGRESS_CHANNEL}"))
             return self
 
         except Exception as e:
@@ -292,9 +764,7 @@ class ProgressSubscriber:
         """Clean up database connection."""
         try:
             if self._connection:
-                self._connection.execute(
-                    text(f"UNLISTEN {get_progress_channel(self.job_id)}")
-                )
+                self._connection.execute(text(f"UNLISTEN {PROGRESS_CHANNEL}"))
                 self._connection.close()
                 self._connection = None
             if self._session:
@@ -303,6 +773,61 @@ class ProgressSubscriber:
         except Exception:
             pass  # Ignore cleanup errors
 
+    @staticmethod
+    def _wait_for_payloads(dbapi_conn: Any, timeout: float) -> List[str]:
+        """Wait up to timeout seconds and return any notification payloads."""
+        if hasattr(dbapi_conn, "poll"):
+            # psycopg2: wait on the socket, then read what arrived
+            if select.select([dbapi_conn], [], [], timeout)[0]:
+                dbapi_conn.poll()
+            payloads = [notify.payload for notify in dbapi_conn.notifies]
+            dbapi_conn.notifies.clear()
+            return payloads
+        # psycopg 3: the generator does the waiting
+        return [
+            notify.payload
+            for notify in dbapi_conn.notifies(timeout=timeout, stop_after=1)
+        ]
+
+    def get_messages(self) -> List[Dict[str, Any]]:
+        """
+        Get every message for this job that arrives within the timeout.
+
+        Returns as soon as at least one message for this job is available;
+        notifications for other jobs on the shared channel are discarded.
+
+        Returns:
+            Progress dicts in arrival order (empty on timeout or error)
+        """
+        if self._pending:
+            messages = list(self._pending)
+            self._pending.clear()
+            return messages
+        if not self._connection:
+            return []
+
+        try:
+            dbapi_conn = self._connection.connection.driver_connection
+            deadline = time.monotonic() + self.timeout
+            while True:
+                remaining = max(deadline - time.monotonic(), 0)
+                payloads = self._wait_for_payloads(dbapi_conn, remaining)
+                messages = [
+                    (
+                        get_last_progress(self.job_id) or message
+                        if message.get("truncated")
+                        else message
+                    )
+                    for message in map(_loads, payloads)
+                    if message.get("job_id") == self.job_id
+                ]
+                if messages or time.monotonic() >= deadline:
+                    return messages
+
+        except Exception as e:
+            logger.warning(f"Database error getting message for job {self.job_id}: {e}")
+            return []
+
     def get_message(self) -> Optional[Dict[str, Any]]:
         """
         Get the next message from subscription (non-blocking with timeout).
@@ -310,29 +835,161 @@ class ProgressSubscriber:
         Returns:
             Progress dict if available, None if no message or timeout
         """
-        if not self._connection:
-            return None
+        if not self._pending:
+            self._pending.extend(self.get_messages())
+        return self._pending.popleft() if self._pending else None
+
+
+class AsyncProgressListener:
+    """
+    One asyncpg LISTEN connection per process, fanned out to asyncio queues.
+
+    asyncpg delivers notifications through a callback on the event loop, so
+    async consumers (WebSocket/SSE handlers) await a queue instead of each
+    holding a connection and polling it. Requires the optional asyncpg
+    dependency: pip install -e ".[realtime]".
+    """
+
+    def __init__(self, dsn: Optional[str] = None, max_queue: int = 100):
+        """
+        Initialize listener.
 
+        Args:
+            dsn: PostgreSQL DSN (defaults to the configured database)
+            max_queue: Messages buffered per subscriber; the oldest is
+                dropped when a slow subscriber's queue is full
+        """
+        self._dsn = dsn
+        self.max_queue = max_queue
+        self._connection: Any = None
+        self._start_lock = asyncio.Lock()
+        self._queues: Dict[str, List["asyncio.Queue[Dict[str, Any]]"]] = {}
+
+    async def start(self) -> None:
+        """Open the connection and LISTEN, unless already started."""
+        async with self._start_lock:
+            if self._connection is not None:
+                return
+            import asyncpg
+
+            from ..db.config import settings
+
+            connection = await asyncpg.connect(self._dsn or settings.database_url)
+            await connection.add_listener(PROGRESS_CHANNEL, self._on_notify)
+            self._connection = connection
+
+    async def stop(self) -> None:
+        """Stop listening and close the connection."""
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            await connection.remove_listener(PROGRESS_CHANNEL, self._on_notify)
+            await connection.close()
+
+    def subscribe(self, job_id: str) -> "asyncio.Queue[Dict[str, Any]]":
+        """Register a queue that receives the job's messages."""
+        queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(self.max_queue)
+        self._queues.setdefault(job_id, []).append(queue)
+        return queue
+
+    def unsubscribe(self, job_id: str, queue: "asyncio.Queue[Dict[str, Any]]") -> None:
+        """Remove a queue registered with subscribe()."""
+        queues = self._queues.get(job_id, [])
+        if queue in queues:
+            queues.remove(queue)
+        if not queues:
+            self._queues.pop(job_id, None)
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        """asyncpg listener callback: route a notification to its job's queues."""
         try:
-            # Use connection.poll() with timeout
-            self._connection.connection.poll(timeout=self.timeout)
+            message = _loads(payload)
+        except ValueError:
+            logger.warning(f"Ignoring malformed progress notification: {payload[:80]}")
+            return
+        for queue in self._queues.get(message.get("job_id"), []):
+            if queue.full():
+                queue.get_nowait()  # progress is latest-wins
+            queue.put_nowait(message)
 
-            # Check if we have any notifications
-            if self._connection.connection.notifies:
-                notify = self._connection.connection.notifies.pop(0)
-                return json.loads(notify.payload)
 
-            return None
+_async_listener: Optional[AsyncProgressListener] = None
 
-        except Exception as e:
-            logger.warning(f"Database error getting message for job {self.job_id}: {e}")
+
+def get_async_listener() -> AsyncProgressListener:
+    """Get the process-wide AsyncProgressListener."""
+    global _async_listener
+    if _async_listener is None:
+        _async_listener = AsyncProgressListener()
+    return _async_listener
+
+
+class AsyncProgressSubscriber:
+    """
+    Async counterpart of ProgressSubscriber backed by AsyncProgressListener.
+
+    Usage:
+        async with AsyncProgressSubscriber(job_id) as subscriber:
+            while (message := await subscriber.get_message(timeout=30)):
+                await websocket.send_json(message)
+    """
+
+    def __init__(self, job_id: str, listener: Optional[AsyncProgressListener] = None):
+        """
+        Initialize subscriber.
+
+        Args:
+            job_id: The job ID to subscribe to
+            listener: Listener to use (defaults to the process-wide one)
+        """
+        self.job_id = job_id
+        self._listener = listener
+        self._queue: Optional["asyncio.Queue[Dict[str, Any]]"] = None
+
+    async def __aenter__(self) -> "AsyncProgressSubscriber":
+        """Start subscription."""
+        if self._listener is None:
+            self._listener = get_async_listener()
+        await self._listener.start()
+        self._queue = self._listener.subscribe(self.job_id)
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Stop subscription."""
+        if self._listener is not None and self._queue is not None:
+            self._listener.unsubscribe(self.job_id, self._queue)
+            self._queue = None
+
+    async def get_message(
+        self, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Wait for the next message for this job.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            Progress dict, or None on timeout
+        """
+        if self._queue is None:
+            return None
+        try:
+            message = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
             return None
+        if message.get("truncated"):
+            stored = await asyncio.to_thread(get_last_progress, self.job_id)
+            return stored or message
+        return message
 
 
 def cleanup_old_progress(max_age_hours: int = 24) -> int:
     """
     Clean up old progress data to prevent table bloat.
 
+    Rows are deleted CLEANUP_BATCH_SIZE at a time, committing after each
+    batch.
+
     Args:
         max_age_hours: Maximum age in hours for progress data
 
@@ -342,16 +999,17 @@ def cleanup_old_progress(max_age_hours: int = 24) -> int:
     try:
         session = SessionLocal()
         try:
-            result = session.execute(
-                text(
-                    f"""
-                    DELETE FROM {get_progress_table_name()}
-                    WHERE updated_at < NOW() - INTERVAL '{max_age_hours} hours'
-                    """
+            cleaned = 0
+            while True:
+                result = session.execute(
+                    _CLEANUP_PROGRESS_SQL,
+                    {"hours": max_age_hours, "batch_size": CLEANUP_BATCH_SIZE},
                 )
-            )
-            session.commit()
-            cleaned = result.rowcount  # type: ignore[attr-defined]
+                session.commit()
+                deleted = result.rowcount  # type: ignore[attr-defined]
+                cleaned += deleted
+                if deleted < CLEANUP_BATCH_SIZE:
+                    break
             if cleaned > 0:
                 logger.info(f"Cleaned up {cleaned} old progress records")
             return cleaned
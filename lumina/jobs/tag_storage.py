@@ -5,7 +5,9 @@ This module is separate from tasks.py to avoid Celery dependencies.
 """
 
 import logging
-from typing import List
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from sqlalchemy import text
 
@@ -13,6 +15,124 @@ from ..db import CatalogDB as CatalogDatabase
 
 logger = logging.getLogger(__name__)
 
+# Inserting with DO NOTHING leaves existing tags untouched (no dead tuple
+# per lookup); names that already existed are fetched by the select.
+_INSERT_TAG_NAMES_SQL = text(
+    """
+    INSERT INTO tags (catalog_id, name, category, created_at)
+    SELECT :catalog_id, t.name, t.category, NOW()
+    FROM unnest(CAST(:names AS text[]), CAST(:categories AS text[]))
+        AS t(name, category)
+    ON CONFLICT (catalog_id, name) DO NOTHING
+    RETURNING id, name
+"""
+)
+
+_SELECT_TAG_IDS_SQL = text(
+    """
+    SELECT id, name FROM tags
+    WHERE catalog_id = :catalog_id AND name = ANY(CAST(:names AS text[]))
+"""
+)
+
+# Process-local (catalog_id, tag name) -> tags.id map. The pair is unique in
+# the tags table, so an entry only goes stale if the tag is deleted or the
+# transaction that created it rolls back; that is handled by
+# clear_tag_id_cache() and by retrying a failed write uncached.
+TAG_ID_CACHE_SIZE = 200_000
+_tag_id_cache: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+_tag_id_cache_lock = threading.Lock()
+
+_UPSERT_IMAGE_TAGS_SQL = text(
+    """
+    INSERT INTO image_tags (image_id, tag_id, confidence, source,
+                           openclip_confidence, ollama_confidence, created_at)
+    SELECT t.image_id, t.tag_id, t.confidence, t.source,
+           t.openclip_confidence, t.ollama_confidence, NOW()
+    FROM unnest(
+        CAST(:image_ids AS text[]),
+        CAST(:tag_ids AS integer[]),
+        CAST(:confidences AS real[]),
+        CAST(:sources AS text[]),
+        CAST(:openclip_confidences AS real[]),
+        CAST(:ollama_confidences AS real[])
+    ) AS t(image_id, tag_id, confidence, source,
+           openclip_confidence, ollama_confidence)
+    ON CONFLICT (image_id, tag_id) DO UPDATE SET
+        confidence = EXCLUDED.confidence,
+        source = EXCLUDED.source,
+        openclip_confidence = COALESCE(EXCLUDED.openclip_confidence, image_tags.openclip_confidence),
+        ollama_confidence = COALESCE(EXCLUDED.ollama_confidence, image_tags.ollama_confidence)
+"""
+)
+
+
+def _tag_category(tag: Any) -> Optional[str]:
+    """Get a tag's category as a string (handles enum or string)."""
+    category = getattr(tag, "category", None)
+    if category is not None and hasattr(category, "value"):
+        category = category.value  # Convert enum to string
+    return category
+
+
+def clear_tag_id_cache(catalog_id: Optional[str] = None) -> None:
+    """Forget cached tag IDs for one catalog, or for all catalogs."""
+    with _tag_id_cache_lock:
+        if catalog_id is None:
+            _tag_id_cache.clear()
+            return
+        for key in [key for key in _tag_id_cache if key[0] == catalog_id]:
+            del _tag_id_cache[key]
+
+
+def _resolve_tag_ids(
+    session: Any,
+    catalog_id: str,
+    categories: Dict[str, Optional[str]],
+    use_cache: bool,
+) -> Tuple[Dict[str, int], bool]:
+    """Map tag names to IDs, creating missing tags.
+
+    Returns:
+        Tuple of (name -> tag ID, whether any ID came from the cache)
+    """
+    tag_ids: Dict[str, int] = {}
+    if use_cache:
+        with _tag_id_cache_lock:
+            for name in categories:
+                tag_id = _tag_id_cache.get((catalog_id, name))
+                if tag_id is not None:
+                    _tag_id_cache.move_to_end((catalog_id, name))
+                    tag_ids[name] = tag_id
+
+    from_cache = bool(tag_ids)
+    missing = [name for name in categories if name not in tag_ids]
+    if missing:
+        result = session.execute(
+            _INSERT_TAG_NAMES_SQL,
+            {
+                "catalog_id": catalog_id,
+                "names": missing,
+                "categories": [categories[name] for name in missing],
+            },
+        )
+        found = {name: tag_id for tag_id, name in result}
+        existing = [name for name in missing if name not in found]
+        if existing:
+            result = session.execute(
+                _SELECT_TAG_IDS_SQL, {"catalog_id": catalog_id, "names": existing}
+            )
+            found.update((name, tag_id) for tag_id, name in result)
+        tag_ids.update(found)
+
+        with _tag_id_cache_lock:
+            for name, tag_id in found.items():
+                _tag_id_cache[(catalog_id, name)] = tag_id
+            while len(_tag_id_cache) > TAG_ID_CACHE_SIZE:
+                _tag_id_cache.popitem(last=False)
+
+    return tag_ids, from_cache
+
 
 def store_image_tags(
     db: CatalogDatabase,
@@ -24,7 +144,8 @@ def store_image_tags(
     """Store tags for an image in the proper relational schema.
 
     Creates Tag entries if they don't exist, then creates ImageTag entries
-    linking the image to its tags.
+    linking the image to its tags. This is store_image_tags_bulk() for a
+    single image, so it costs two statements regardless of the tag count.
 
     Args:
         db: CatalogDatabase session
@@ -37,69 +158,104 @@ def store_image_tags(
     Returns:
         Number of tags stored
     """
-    if not tags:
-        return 0
+    stored = store_image_tags_bulk(db, catalog_id, [(image_id, tags)], source)
+    return stored.get(image_id, 0)
+
 
-    stored_count = 0
+def store_image_tags_bulk(
+    db: CatalogDatabase,
+    catalog_id: str,
+    image_tags: Iterable[Tuple[str, List]],
+    source: str,
+) -> Dict[str, int]:
+    """Store tags for many images with a fixed number of statements.
 
-    for tag in tags:
+    Tag names are resolved through a process-local cache; only unseen
+    names touch the tags table. All image/tag links are then written in a
+    single statement by unnesting parallel arrays. Everything runs inside
+    a savepoint so a failure leaves the caller's transaction usable; if the
+    batch fails, each tag is retried in its own savepoint and only the
+    failing rows are skipped.
+
+    Args:
+        db: CatalogDatabase session
+        catalog_id: The catalog UUID
+        image_tags: (image_id, tags) pairs; tags are TagResult objects as
+            accepted by store_image_tags()
+        source: The tagging source ('openclip', 'ollama', or 'combined')
+
+    Returns:
+        Number of tags stored per image, for images with at least one
+    """
+    pairs = [(image_id, tags) for image_id, tags in image_tags if tags]
+    if not pairs:
+        return {}
+
+    categories: Dict[str, Optional[str]] = {}
+    for _, tags in pairs:
+        for tag in tags:
+            categories.setdefault(tag.tag_name, _tag_category(tag))
+
+    session = db.require_session()
+    use_cache = True
+    while True:
+        from_cache = False
         try:
-            # Get category as string (handle enum or string)
-            category = getattr(tag, "category", None)
-            if category is not None and hasattr(category, "value"):
-                category = category.value  # Convert enum to string
-
-            # Get or create tag in the tags table
-            assert db.session is not None
-            result = db.session.execute(
-                text(
-                    """
-                    INSERT INTO tags (catalog_id, name, category, created_at)
-                    VALUES (:catalog_id, :name, :category, NOW())
-                    ON CONFLICT (catalog_id, name) DO UPDATE SET catalog_id = tags.catalog_id
-                    RETURNING id
-                """
-                ),
-                {
-                    "catalog_id": catalog_id,
-                    "name": tag.tag_name,
-                    "category": category,
-                },
-            )
-            tag_id = result.scalar()
-
-            # Insert or update image_tag relationship
-            assert db.session is not None
-            db.session.execute(
-                text(
-                    """
-                    INSERT INTO image_tags (image_id, tag_id, confidence, source,
-                                           openclip_confidence, ollama_confidence, created_at)
-                    VALUES (:image_id, :tag_id, :confidence, :source,
-                            :openclip_confidence, :ollama_confidence, NOW())
-                    ON CONFLICT (image_id, tag_id) DO UPDATE SET
-                        confidence = :confidence,
-                        source = :source,
-                        openclip_confidence = COALESCE(:openclip_confidence, image_tags.openclip_confidence),
-                        ollama_confidence = COALESCE(:ollama_confidence, image_tags.ollama_confidence)
-                """
-                ),
-                {
-                    "image_id": image_id,
-                    "tag_id": tag_id,
-                    "confidence": tag.confidence,
-                    "source": getattr(tag, "source", source),
-                    "openclip_confidence": getattr(tag, "openclip_confidence", None),
-                    "ollama_confidence": getattr(tag, "ollama_confidence", None),
-                },
-            )
-            stored_count += 1
+            with session.begin_nested():
+                tag_ids, from_cache = _resolve_tag_ids(
+                    session, catalog_id, categories, use_cache
+                )
+
+                # A row may only be touched once per INSERT ... ON CONFLICT,
+                # so collapse repeated (image, tag) pairs keeping the last one.
+                rows: Dict[Tuple[str, int], Tuple] = {}
+                for image_id, tags in pairs:
+                    for tag in tags:
+                        tag_id = tag_ids[tag.tag_name]
+                        rows[(image_id, tag_id)] = (
+                            image_id,
+                            tag_id,
+                            tag.confidence,
+                            getattr(tag, "source", source),
+                            getattr(tag, "openclip_confidence", None),
+                            getattr(tag, "ollama_confidence", None),
+                        )
+                columns = list(zip(*rows.values()))
+                session.execute(
+                    _UPSERT_IMAGE_TAGS_SQL,
+                    {
+                        "image_ids": list(columns[0]),
+                        "tag_ids": list(columns[1]),
+                        "confidences": list(columns[2]),
+                        "sources": list(columns[3]),
+                        "openclip_confidences": list(columns[4]),
+                        "ollama_confidences": list(columns[5]),
+                    },
+                )
+            return dict(Counter(image_id for image_id, _ in rows))
         except Exception as e:
-            logger.warning(
-                f"Failed to store tag {tag.tag_name} for image {image_id}: {e}"
-            )
-            # Rollback to clear the failed transaction state
-            if db.session:
-                db.session.rollback()
+            if from_cache:
+                # A cached ID may point at a deleted tag; retry once uncached
+                clear_tag_id_cache(catalog_id)
+                use_cache = False
+                continue
+            error = e
+            break
+
+    singles = [(image_id, [tag]) for image_id, tags in pairs for tag in tags]
+    if len(singles) == 1:
+        image_id, (tag,) = singles[0]
+        logger.warning(
+            f"Failed to store tag {tag.tag_name} for image {image_id}: {error}"
+        )
+        return {}
 
-    return stored_count
+    # Store each (image, tag) row in its own savepoint so one bad row
+    # doesn't cost the rest of the batch
+    logger.warning(
+        f"Failed to store tags for {len(pairs)} images, retrying per tag: {error}"
+    )
+    stored: Counter[str] = Counter()
+    for single in singles:
+        stored.update(store_image_tags_bulk(db, catalog_id, [single], source))
+    return dict(stored)
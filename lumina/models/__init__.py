@@ -1,12 +1,60 @@
-"""Unified SQLModel definitions for Lumina."""
+"""Unified SQLModel definitions for Lumina.
+
+Only the base classes are imported eagerly; table models are loaded on
+first attribute access so importing this package does not register every
+table. Import lumina.models.all to load them all at once (e.g. before
+create_all() or schema autogeneration).
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
 
 from .base import BaseModel, TimestampMixin
-from .burst import Burst
-from .catalog import Catalog, CatalogCreate, CatalogRead
-from .duplicate import DuplicateGroup, DuplicateMember, SimilarityType
-from .image import FileType, Image, ImageRead, ProcessingStatus
-from .job import BatchStatus, Job, JobBatch, JobStatus
-from .tag import ImageTag, Tag, TagSource
+
+if TYPE_CHECKING:
+    from .burst import Burst
+    from .catalog import Catalog, CatalogCreate, CatalogRead
+    from .duplicate import DuplicateGroup, DuplicateMember, SimilarityType
+    from .image import FileType, Image, ImageRead, ProcessingStatus
+    from .job import BatchStatus, Job, JobBatch, JobStatus
+    from .tag import ImageTag, Tag, TagSource
+
+# Public name -> submodule that defines it
+_LAZY_MODELS = {
+    "BatchStatus": "job",
+    "Burst": "burst",
+    "Catalog": "catalog",
+    "CatalogCreate": "catalog",
+    "CatalogRead": "catalog",
+    "DuplicateGroup": "duplicate",
+    "DuplicateMember": "duplicate",
+    "FileType": "image",
+    "Image": "image",
+    "ImageRead": "image",
+    "ImageTag": "tag",
+    "Job": "job",
+    "JobBatch": "job",
+    "JobStatus": "job",
+    "ProcessingStatus": "image",
+    "SimilarityType": "duplicate",
+    "Tag": "tag",
+    "TagSource": "tag",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import model classes on first access."""
+    submodule = _LAZY_MODELS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_MODELS))
+
 
 __all__ = [
     "BaseModel",
@@ -0,0 +1,32 @@
+"""Eagerly import every SQLModel table so its metadata is registered."""
+
+from .base import BaseModel, TimestampMixin
+from .burst import Burst
+from .catalog import Catalog, CatalogCreate, CatalogRead
+from .duplicate import DuplicateGroup, DuplicateMember, SimilarityType
+from .image import FileType, Image, ImageRead, ProcessingStatus
+from .job import BatchStatus, Job, JobBatch, JobStatus
+from .tag import ImageTag, Tag, TagSource
+
+__all__ = [
+    "BaseModel",
+    "BatchStatus",
+    "Burst",
+    "Catalog",
+    "CatalogCreate",
+    "CatalogRead",
+    "DuplicateGroup",
+    "DuplicateMember",
+    "FileType",
+    "Image",
+    "ImageRead",
+    "ImageTag",
+    "Job",
+    "JobBatch",
+    "JobStatus",
+    "ProcessingStatus",
+    "SimilarityType",
+    "Tag",
+    "TagSource",
+    "TimestampMixin",
+]
@@ -1,19 +1,44 @@
 """Base model and mixins for SQLModel."""
 
 from datetime import datetime
+from typing import Any, Optional
 
+from pydantic import ConfigDict
+from sqlalchemy import func
 from sqlmodel import Field, SQLModel
 
+# Timestamps are filled in by PostgreSQL. timezone('utc', now()) keeps the
+# naive-UTC values the columns held when Python set them with utcnow().
+UTC_NOW = func.timezone("utc", func.now())
+
+
+def created_at_field() -> Any:
+    """Field for a creation timestamp set by the database on INSERT."""
+    return Field(
+        default=None, sa_column_kwargs={"server_default": UTC_NOW, "nullable": False}
+    )
+
+
+def updated_at_field() -> Any:
+    """Field for a modification timestamp set by the database on INSERT/UPDATE."""
+    return Field(
+        default=None,
+        sa_column_kwargs={
+            "server_default": UTC_NOW,
+            "onupdate": UTC_NOW,
+            "nullable": False,
+        },
+    )
+
 
 class TimestampMixin(SQLModel):
     """Mixin for created_at/updated_at timestamps."""
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = created_at_field()
+    updated_at: Optional[datetime] = updated_at_field()
 
 
 class BaseModel(SQLModel):
     """Base for all Lumina models with common config."""
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
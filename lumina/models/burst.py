@@ -8,6 +8,8 @@ from sqlalchemy import Column, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlmodel import Field, SQLModel
 
+from .base import created_at_field
+
 
 class Burst(SQLModel, table=True):
     """Burst database model - tracks groups of burst-mode images."""
@@ -33,4 +35,4 @@ class Burst(SQLModel, table=True):
     camera_model: Optional[str] = Field(default=None, max_length=255)
     best_image_id: Optional[str] = None
     selection_method: str = Field(default="quality", max_length=50)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = created_at_field()
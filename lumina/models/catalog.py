@@ -8,6 +8,8 @@ from sqlalchemy import Text
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlmodel import Column, Field, SQLModel
 
+from .base import created_at_field, updated_at_field
+
 
 class CatalogBase(SQLModel):
     """Shared catalog fields."""
@@ -27,8 +29,8 @@ class Catalog(CatalogBase, table=True):
         primary_key=True,
     )
     schema_name: str = Field(max_length=255, unique=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = created_at_field()
+    updated_at: Optional[datetime] = updated_at_field()
 
 
 class CatalogCreate(CatalogBase):
@@ -3,11 +3,14 @@
 import uuid as uuid_module
 from datetime import datetime
 from enum import Enum
+from typing import Optional
 
 from sqlalchemy import Column, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlmodel import Field, SQLModel
 
+from .base import created_at_field
+
 
 class SimilarityType(str, Enum):
     """Type of similarity detection used."""
@@ -33,7 +36,7 @@ class DuplicateGroup(SQLModel, table=True):
     similarity_type: SimilarityType
     confidence: int  # 0-100
     reviewed: bool = False
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = created_at_field()
 
 
 class DuplicateMember(SQLModel, table=True):
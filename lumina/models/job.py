@@ -9,6 +9,8 @@ from sqlalchemy import Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Column, Field, SQLModel
 
+from .base import created_at_field, updated_at_field
+
 
 class JobStatus(str, Enum):
     """Status for jobs."""
@@ -49,8 +51,8 @@ class Job(SQLModel, table=True):
         default_factory=dict, sa_column=Column(JSONB, default={})
     )
     error: Optional[str] = Field(default=None, sa_column=Column(Text, nullable=True))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = created_at_field()
+    updated_at: Optional[datetime] = updated_at_field()
     completed_at: Optional[datetime] = None
 
 
@@ -83,4 +85,4 @@ class JobBatch(SQLModel, table=True):
     error_message: Optional[str] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: Optional[datetime] = updated_at_field()
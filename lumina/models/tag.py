@@ -9,6 +9,8 @@ from sqlalchemy import Column, ForeignKey, Text
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlmodel import Field, SQLModel
 
+from .base import created_at_field
+
 
 class TagSource(str, Enum):
     """Source of tag assignment."""
@@ -37,7 +39,7 @@ class Tag(SQLModel, table=True):
     parent_id: Optional[int] = Field(default=None, foreign_key="tags.id")
     synonyms: List[str] = Field(default_factory=list, sa_column=Column(ARRAY(Text)))
     description: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = created_at_field()
 
 
 class ImageTag(SQLModel, table=True):
@@ -51,4 +53,4 @@ class ImageTag(SQLModel, table=True):
     source: TagSource = TagSource.MANUAL
     openclip_confidence: Optional[float] = None
     ollama_confidence: Optional[float] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = created_at_field()
@@ -19,6 +19,7 @@ from .media_utils import (  # File type detection; File operations; Image operat
     setup_logging,
     verify_checksum,
 )
+from .parallel import pool_chunksize
 
 __all__ = [
     # Constants
@@ -35,4 +36,5 @@ __all__ = [
     "get_image_info",
     "collect_image_files",
     "setup_logging",
+    "pool_chunksize",
 ]
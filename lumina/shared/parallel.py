@@ -0,0 +1,28 @@
+"""
+Helpers for spreading work over multiprocessing pools.
+"""
+
+# Upper bound on items handed to a pool worker at once. Pool workers pull the
+# next chunk from a shared queue when they finish, so small chunks let fast
+# workers keep taking work while a slow one finishes its current chunk.
+MAX_POOL_CHUNKSIZE = 16
+
+
+def pool_chunksize(
+    total_items: int, workers: int, max_chunk: int = MAX_POOL_CHUNKSIZE
+) -> int:
+    """
+    Choose a chunksize for Pool.imap/imap_unordered.
+
+    Aims for about four chunks per worker, capped at max_chunk so that one
+    slow chunk (cold cache, large RAW file) cannot hold up the tail of a run.
+
+    Args:
+        total_items: Number of items to be processed
+        workers: Number of pool processes
+        max_chunk: Largest chunk to hand out
+
+    Returns:
+        Chunksize of at least 1
+    """
+    return max(1, min(max_chunk, total_items // (max(workers, 1) * 4)))
@@ -1,6 +1,6 @@
 """Tests for burst detection algorithm."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List
 from unittest.mock import MagicMock
 
@@ -24,6 +24,11 @@ class TestImageInfo:
         assert info.image_id == "img-001"
         assert info.camera_make == "Canon"
 
+    def test_image_info_slots(self):
+        """Test ImageInfo does not carry a per-instance __dict__."""
+        info = ImageInfo("img-001", datetime(2024, 1, 1), "Canon", "R5")
+        assert not hasattr(info, "__dict__")
+
 
 class TestBurstGroup:
     """Tests for BurstGroup dataclass."""
@@ -123,6 +128,83 @@ class TestBurstDetector:
         assert all(img.camera_make == "Canon" for img in bursts[0].images)
         assert all(img.camera_make == "Sony" for img in bursts[1].images)
 
+    def test_detect_bursts_presorted_matches_sorted(self):
+        """Test presorted input yields the same bursts as internal sorting."""
+        detector = BurstDetector(gap_threshold_seconds=2.0, min_burst_size=3)
+
+        base_time = datetime(2024, 1, 1, 12, 0, 0)
+        images = [
+            ImageInfo(
+                f"img-{i:03d}", base_time + timedelta(seconds=i), "Canon", "R5", 0.8
+            )
+            for i in range(5)
+        ]
+
+        expected = detector.detect_bursts(list(reversed(images)))
+        bursts = detector.detect_bursts(images, presorted=True)
+
+        assert [[img.image_id for img in b.images] for b in bursts] == [
+            [img.image_id for img in b.images] for b in expected
+        ]
+
+    def test_detect_bursts_presorted_multiple_cameras(self):
+        """Test presorted input is split into per-camera groups."""
+        detector = BurstDetector(gap_threshold_seconds=2.0, min_burst_size=3)
+
+        base_time = datetime(2024, 1, 1, 12, 0, 0)
+        images = [
+            ImageInfo(
+                f"{make}-{i:03d}", base_time + timedelta(seconds=i), make, "X", 0.8
+            )
+            for make in ("Canon", "Sony")
+            for i in range(3)
+        ]
+
+        bursts = detector.detect_bursts(images, presorted=True)
+
+        assert len(bursts) == 2
+        assert {b.camera_make for b in bursts} == {"Canon", "Sony"}
+        assert all(b.image_count == 3 for b in bursts)
+
+    def test_detect_bursts_ordered_across_cameras(self):
+        """Test bursts from different cameras are interleaved by start time."""
+        detector = BurstDetector(gap_threshold_seconds=2.0, min_burst_size=3)
+
+        base_time = datetime(2024, 1, 1, 12, 0, 0)
+        images = [
+            ImageInfo(
+                f"{make}-{start + i}",
+                base_time + timedelta(seconds=start + i),
+                make,
+                "X",
+                0.8,
+            )
+            for make, starts in (("Canon", (0, 20)), ("Sony", (10,)))
+            for start in starts
+            for i in range(3)
+        ]
+
+        bursts = detector.detect_bursts(images, presorted=True)
+
+        assert [b.camera_make for b in bursts] == ["Canon", "Sony", "Canon"]
+
+    def test_detect_bursts_timezone_aware_timestamps(self):
+        """Test gap detection works with timezone-aware timestamps."""
+        detector = BurstDetector(gap_threshold_seconds=2.0, min_burst_size=3)
+
+        base_time = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        images = [
+            ImageInfo(
+                f"img-{i:03d}", base_time + timedelta(seconds=i), "Canon", "R5", 0.8
+            )
+            for i in range(3)
+        ]
+
+        bursts = detector.detect_bursts(images)
+
+        assert len(bursts) == 1
+        assert bursts[0].image_count == 3
+
     def test_detect_bursts_ignores_small_sequences(self):
         """Test that sequences smaller than min_burst_size are ignored."""
         detector = BurstDetector(gap_threshold_seconds=2.0, min_burst_size=3)
@@ -1,6 +1,6 @@
 """Tests for pure burst detection functions."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from lumina.analysis.bursts import detect_bursts, select_best_in_burst
 
@@ -113,6 +113,44 @@ def test_detect_bursts_duration_info():
     assert bursts[0]["camera"] == "Canon"
 
 
+def test_detect_bursts_consecutive_runs():
+    """Should split one camera's stream into separate bursts at each gap."""
+    base_time = datetime(2024, 1, 1, 12, 0, 0)
+    offsets = [0, 0.5, 1.0, 10.0, 10.5, 11.0, 11.5]
+    images = [
+        {
+            "id": str(i),
+            "timestamp": base_time + timedelta(seconds=offset),
+            "camera": "Canon",
+        }
+        for i, offset in enumerate(offsets)
+    ]
+
+    bursts = detect_bursts(images, gap_threshold=1.0, min_size=3)
+
+    assert [b["image_ids"] for b in bursts] == [["0", "1", "2"], ["3", "4", "5", "6"]]
+    assert bursts[1]["end_time"] == base_time + timedelta(seconds=11.5)
+
+
+def test_detect_bursts_missing_timestamp_and_metadata_split():
+    """Should break runs at missing timestamps and metadata changes."""
+    base_time = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    images = [
+        {
+            "id": str(i),
+            "timestamp": base_time + timedelta(seconds=i * 0.5),
+            "camera": "Canon",
+            "iso": 100 if i < 3 else 400,
+        }
+        for i in range(6)
+    ]
+    images.append({"id": "none", "timestamp": None, "camera": "Canon"})
+
+    bursts = detect_bursts(images, gap_threshold=1.0, min_size=3)
+
+    assert [b["image_ids"] for b in bursts] == [["0", "1", "2"], ["3", "4", "5"]]
+
+
 def test_select_best_in_burst_quality():
     """Should select highest quality image."""
     images = [
@@ -154,3 +192,14 @@ def test_select_best_in_burst_empty():
 
     with pytest.raises(ValueError):
         select_best_in_burst([])
+
+
+def test_select_best_in_burst_missing_scores():
+    """Should treat missing or None quality scores as zero."""
+    images = [
+        {"id": "1"},
+        {"id": "2", "quality_score": None},
+        {"id": "3", "quality_score": 0.2},
+    ]
+
+    assert select_best_in_burst(images, method="quality") == "3"
@@ -1,11 +1,16 @@
 """Tests for pure duplicate detection functions."""
 
+import itertools
+import random
+from unittest.mock import patch
+
 from lumina.analysis.duplicates import (
     find_similar_hashes,
     group_by_exact_match,
     group_by_similarity,
     select_primary_image,
 )
+from lumina.analysis.hashing import hamming_distance
 
 
 def test_group_by_exact_match():
@@ -24,6 +29,7 @@ def test_group_by_exact_match():
     group_ids = [sorted(g["image_ids"]) for g in groups]
     assert ["1", "3"] in group_ids
     assert ["2", "4"] in group_ids
+    assert [g["checksum"] for g in groups] == ["abc", "def"]
 
 
 def test_group_by_exact_match_no_duplicates():
@@ -125,9 +131,150 @@ def test_select_primary_image_by_size():
     assert primary == "2"  # Largest size
 
 
+def test_select_primary_image_missing_fields():
+    """Should treat missing or None quality and size as zero."""
+    images = [
+        {"id": "1", "quality_score": None, "size_bytes": 1000},
+        {"id": "2", "size_bytes": None},
+        {"id": "3", "quality_score": 0.5},
+    ]
+
+    assert select_primary_image(images) == "3"
+
+
 def test_select_primary_image_empty():
     """Should raise on empty list."""
     import pytest
 
     with pytest.raises(ValueError):
         select_primary_image([])
+
+
+def test_find_similar_hashes_wide_hashes():
+    """Should fall back to per-pair comparison for hashes over 64 bits."""
+    hashes = {
+        "img1": "0" * 32,
+        "img2": "0" * 31 + "1",
+        "img3": "f" * 32,
+    }
+
+    similar = find_similar_hashes(hashes, threshold=5)
+
+    assert similar == [{"img1", "img2"}]
+
+
+def test_group_by_similarity_average_distance():
+    """Confidence should reflect the mean pairwise distance."""
+    images = [
+        {"id": "1", "dhash": "0000000000000000"},
+        {"id": "2", "dhash": "0000000000000001"},
+        {"id": "3", "dhash": "0000000000000003"},
+    ]
+
+    groups = group_by_similarity(images, hash_key="dhash", threshold=5)
+
+    # Pair distances are 1, 2 and 1 -> mean 4/3 bits of 64
+    assert groups[0]["confidence"] == int(100 * (1 - (4 / 3) / 64))
+
+
+def test_find_similar_hashes_matches_pairwise_scan():
+    """Multi-index candidates should find every pair a full scan finds."""
+    rng = random.Random(7)
+    bases = [rng.getrandbits(64) for _ in range(10)]
+    hashes = {}
+    for i in range(200):
+        value = bases[i % len(bases)]
+        for _ in range(rng.randint(0, 6)):
+            value ^= 1 << rng.randrange(64)
+        hashes[str(i)] = f"{value:016x}"
+
+    for threshold in (0, 3, 5, 8, 14, 16, 64):
+        expected = {
+            frozenset(g) for g in _pairwise_groups(hashes, threshold) if len(g) > 1
+        }
+        found = {frozenset(g) for g in find_similar_hashes(hashes, threshold)}
+        assert found == expected
+
+
+def test_find_similar_hashes_spread_differences():
+    """Pairs whose differing bits are spread across bytes are still found."""
+    hashes = {"a": "0000000000000000", "b": "0101010101010101"}
+
+    for threshold in (8, 11, 14, 16, 20):
+        assert [set(g) for g in find_similar_hashes(hashes, threshold)] == [{"a", "b"}]
+
+
+def _pairwise_groups(hashes, threshold):
+    """Reference grouping by comparing every pair."""
+    groups = [{image_id} for image_id in hashes]
+    for a, b in itertools.combinations(hashes, 2):
+        if hamming_distance(hashes[a], hashes[b]) <= threshold:
+            ga = next(g for g in groups if a in g)
+            gb = next(g for g in groups if b in g)
+            if ga is not gb:
+                ga |= gb
+                groups.remove(gb)
+    return groups
+
+
+def test_pairs_kernel_matches_numpy():
+    """The numba pair kernel's pure-Python form should agree with numpy."""
+    import numpy as np
+
+    from lumina.analysis.duplicates import _make_pairs_kernel, _popcount64
+
+    rng = np.random.default_rng(3)
+    values = rng.integers(0, 2**63, size=40, dtype=np.uint64)
+    values[5] = values[2] ^ np.uint64(0b101)
+    values[30] = values[2]
+
+    assert all(int(_popcount64(v)) == int(np.bitwise_count(v)) for v in values[:10])
+
+    rows, cols = _make_pairs_kernel(range, _popcount64)(values, np.uint64(3))
+
+    distances = np.bitwise_count(values[:, None] ^ values[None, :])
+    expected = np.argwhere(np.triu(distances <= 3, 1))
+    assert sorted(zip(rows.tolist(), cols.tolist())) == [
+        tuple(pair) for pair in expected.tolist()
+    ]
+
+
+def test_group_by_similarity_compares_copies_once():
+    """Byte-identical copies are collapsed before the hash comparison."""
+    images = [
+        {"id": "a1", "checksum": "same", "dhash": "0000000000000000"},
+        {"id": "a2", "checksum": "same", "dhash": "0000000000000000"},
+        {"id": "b", "checksum": "other", "dhash": "0000000000000001"},
+        {"id": "c1", "checksum": "solo", "dhash": "ffffffffffffffff"},
+        {"id": "c2", "checksum": "solo", "dhash": "ffffffffffffffff"},
+    ]
+
+    with patch(
+        "lumina.analysis.duplicates.find_similar_hashes",
+        wraps=find_similar_hashes,
+    ) as find:
+        groups = group_by_similarity(images, hash_key="dhash", threshold=5)
+
+    assert set(find.call_args.args[0]) == {"a1", "b", "c1"}
+    assert sorted(sorted(g["image_ids"]) for g in groups) == [
+        ["a1", "a2", "b"],
+        ["c1", "c2"],
+    ]
+
+
+def test_group_by_similarity_bigint_hashes_match_hex():
+    """Integer hashes from the dhash_bits column group like their hex form."""
+    hexes = ["ffffffffffffffff", "fffffffffffffffe", "0000000000000000"]
+    signed = [
+        int(h, 16) - (1 << 64) if h[0] in "89abcdef" else int(h, 16) for h in hexes
+    ]
+
+    from_hex = group_by_similarity(
+        [{"id": str(i), "dhash": h} for i, h in enumerate(hexes)], threshold=2
+    )
+    from_int = group_by_similarity(
+        [{"id": str(i), "dhash": h} for i, h in enumerate(signed)], threshold=2
+    )
+
+    assert from_int == from_hex
+    assert sorted(from_int[0]["image_ids"]) == ["0", "1"]
@@ -1,12 +1,15 @@
 """Tests for pure hashing functions."""
 
+import shutil
 from pathlib import Path
+from unittest.mock import patch
 
 import numpy as np
 import pytest
 from PIL import Image
 
 from lumina.analysis.hashing import (
+    clear_hash_cache,
     compute_ahash,
     compute_all_hashes,
     compute_dhash,
@@ -53,18 +56,10 @@ def test_similarity_score_different():
     assert similarity_score("0000000000000000", "ffffffffffffffff") == 0
 
 
-@pytest.fixture
-def sample_image(tmp_path):
-    """Create a sample image for testing."""
-    img_path = tmp_path / "test.png"
-    # Create a simple 64x64 gradient image
-    arr = np.zeros((64, 64, 3), dtype=np.uint8)
-    for i in range(64):
-        for j in range(64):
-            arr[i, j] = [i * 4, j * 4, (i + j) * 2]
-    img = Image.fromarray(arr)
-    img.save(img_path)
-    return img_path
+@pytest.fixture(scope="session")
+def sample_image(gradient_image_path):
+    """Provide the shared 64x64 gradient image (read-only)."""
+    return gradient_image_path
 
 
 def test_compute_dhash(sample_image):
@@ -97,6 +92,20 @@ def test_compute_all_hashes(sample_image):
     assert all(len(h) == 16 for h in hashes.values())
 
 
+def test_compute_all_hashes_decodes_once(sample_image):
+    """Should open the file once and match the individual hash functions."""
+    clear_hash_cache()
+    with patch("lumina.analysis.hashing.Image.open", wraps=Image.open) as opened:
+        hashes = compute_all_hashes(sample_image)
+
+    assert opened.call_count == 1
+    assert hashes == {
+        "dhash": compute_dhash(sample_image),
+        "ahash": compute_ahash(sample_image),
+        "whash": compute_whash(sample_image),
+    }
+
+
 def test_compute_all_hashes_v2_returns_multi_res(shared_test_images):
     from lumina.analysis.hashing import compute_all_hashes_v2
 
@@ -116,3 +125,39 @@ def test_dhash_multi_res_different_lengths(shared_test_images):
     # All three must be different lengths
     assert len(result["dhash_8"]) != len(result["dhash_16"])
     assert len(result["dhash_16"]) != len(result["dhash_32"])
+
+
+def test_similarity_score_scales_with_hash_length():
+    """Hash width is derived from the hex length when not given."""
+    assert similarity_score("00000000", "0000ffff") == 50
+
+
+def test_hamming_distance_accepts_bigint_hashes():
+    """Signed BIGINT hashes compare as their unsigned 64-bit pattern."""
+    assert hamming_distance(-1, "ffffffffffffffff") == 0
+    assert hamming_distance(0, -1) == 64
+    assert similarity_score(0, 0xFFFFFFFF) == 50
+
+
+def test_bits_to_hex_reads_bits_msb_first():
+    """Bit grids pack row-major into a zero-padded big-endian hex string."""
+    from lumina.analysis.hashing import _bits_to_hex
+
+    bits = np.zeros((8, 8), dtype=bool)
+    bits[0, 0] = bits[7, 7] = True
+    assert _bits_to_hex(bits) == "8000000000000001"
+    assert _bits_to_hex(np.ones((3, 3), dtype=bool)) == "1ff"
+
+
+def test_compute_all_hashes_memoized_until_file_changes(sample_image, tmp_path):
+    """Unchanged files are served from the memo; rewritten files rehash."""
+    clear_hash_cache()
+    sample_image = Path(shutil.copy(sample_image, tmp_path / "copy.png"))
+    first = compute_all_hashes(sample_image)
+    with patch("lumina.analysis.hashing.Image.open", wraps=Image.open) as opened:
+        assert compute_all_hashes(sample_image) == first
+        assert opened.call_count == 0
+
+        Image.new("RGB", (80, 64), color="blue").save(sample_image)
+        compute_all_hashes(sample_image)
+        assert opened.call_count == 1
@@ -24,8 +24,42 @@ def test_catalog_id(db_session) -> uuid.UUID:
 
 
 @pytest.fixture
-def client(db_session):
-    """Create a test client for the FastAPI application."""
+def make_catalog(db_session):
+    """Return a factory that creates a committed catalog with the given name."""
+
+    def _make(name: str) -> Catalog:
+        catalog_id = uuid.uuid4()
+        catalog = Catalog(
+            id=catalog_id,
+            name=name,
+            schema_name=f"catalog_{catalog_id.hex}",
+            source_directories=["/tmp/test"],
+        )
+        db_session.add(catalog)
+        db_session.commit()
+        return catalog
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    """Start the FastAPI application once for all API tests.
+
+    Entering TestClient runs the app's startup hooks (init_db, default
+    catalog, warehouse scheduler), which is far more expensive than any
+    single request, so the client is shared. Per-test isolation comes
+    from the function-scoped ``client`` fixture below.
+    """
+    from lumina.api.app import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def client(app_client, db_session):
+    """Provide the shared test client bound to this test's database session."""
     from lumina.api.app import app
     from lumina.db import get_db
 
@@ -38,8 +72,7 @@ def client(db_session):
 
     app.dependency_overrides[get_db] = override_get_db
 
-    with TestClient(app) as test_client:
-        yield test_client
+    yield app_client
 
     # Cleanup
     app.dependency_overrides.clear()
@@ -14,38 +14,44 @@ from lumina.db.models import Catalog
 pytestmark = pytest.mark.integration
 
 
-def _create_test_image(
-    db_session, catalog_id, burst_id=None, sequence=None, status="active"
-):
-    """Helper to create a test image with required fields."""
-    img_id = str(uuid.uuid4())
-    db_session.execute(
-        text(
-            """
-            INSERT INTO images (
-                id, catalog_id, source_path, file_type, checksum,
-                burst_id, burst_sequence, quality_score, status_id,
-                dates, metadata, created_at
-            ) VALUES (
-                :id, :catalog_id, :path, :file_type, :checksum,
-                :burst_id, :seq, 0.8, :status,
-                '{"selected_date": "2024-01-01T12:00:00"}'::jsonb,
-                '{}'::jsonb, NOW()
-            )
-            """
-        ),
-        {
-            "id": img_id,
-            "catalog_id": str(catalog_id),
-            "path": f"/tmp/img_{img_id}.jpg",
-            "file_type": "image",
-            "checksum": img_id,  # Use id as checksum for simplicity
-            "burst_id": burst_id,
-            "seq": sequence,
-            "status": status,
-        },
+_INSERT_IMAGE_SQL = text(
+    """
+    INSERT INTO images (
+        id, catalog_id, source_path, file_type, checksum,
+        burst_id, burst_sequence, quality_score, status_id,
+        dates, metadata, created_at
+    ) VALUES (
+        :id, :catalog_id, :path, :file_type, :checksum,
+        :burst_id, :seq, 0.8, :status,
+        '{"selected_date": "2024-01-01T12:00:00"}'::jsonb,
+        '{}'::jsonb, NOW()
     )
-    return img_id
+    """
+)
+
+
+def _create_burst_images(db_session, catalog_id, burst_id, statuses, ids=None):
+    """Insert one image per status (sequence = position) in a single executemany.
+
+    ``ids`` optionally maps a sequence number to a fixed image ID.
+    """
+    rows = []
+    for seq, status in enumerate(statuses):
+        img_id = (ids or {}).get(seq) or str(uuid.uuid4())
+        rows.append(
+            {
+                "id": img_id,
+                "catalog_id": str(catalog_id),
+                "path": f"/tmp/img_{img_id}.jpg",
+                "file_type": "image",
+                "checksum": img_id,  # Use id as checksum for simplicity
+                "burst_id": burst_id,
+                "seq": seq,
+                "status": status,
+            }
+        )
+    db_session.execute(_INSERT_IMAGE_SQL, rows)
+    return [row["id"] for row in rows]
 
 
 class TestBurstManagementAPI:
@@ -86,8 +92,7 @@ class TestBurstManagementAPI:
         )
 
         # Add 3 rejected images for burst 1
-        for i in range(3):
-            _create_test_image(db_session, catalog_id, burst_id_1, i, "rejected")
+        _create_burst_images(db_session, catalog_id, burst_id_1, ["rejected"] * 3)
 
         # Create a burst with mixed status images (some active, some rejected)
         burst_id_2 = str(uuid.uuid4())
@@ -111,9 +116,9 @@ class TestBurstManagementAPI:
         )
 
         # Add 2 active and 1 rejected image for burst 2
-        for i in range(3):
-            status = "rejected" if i == 2 else "active"
-            _create_test_image(db_session, catalog_id, burst_id_2, i, status)
+        _create_burst_images(
+            db_session, catalog_id, burst_id_2, ["active", "active", "rejected"]
+        )
 
         db_session.commit()
 
@@ -165,8 +170,7 @@ class TestBurstManagementAPI:
         )
 
         # Add 3 rejected images for burst 1
-        for i in range(3):
-            _create_test_image(db_session, catalog_id, burst_id_1, i, "rejected")
+        _create_burst_images(db_session, catalog_id, burst_id_1, ["rejected"] * 3)
 
         db_session.commit()
 
@@ -225,8 +229,9 @@ class TestBurstManagementAPI:
             )
 
             # Add active images to each burst
-            for j in range(image_count):
-                _create_test_image(db_session, catalog_id, burst_id, j, "active")
+            _create_burst_images(
+                db_session, catalog_id, burst_id, ["active"] * image_count
+            )
 
         db_session.commit()
 
@@ -293,8 +298,7 @@ class TestBurstManagementAPI:
             )
 
             # Add active images to each burst
-            for j in range(3):
-                _create_test_image(db_session, catalog_id, burst_id, j, "active")
+            _create_burst_images(db_session, catalog_id, burst_id, ["active"] * 3)
 
         db_session.commit()
 
@@ -590,10 +594,9 @@ class TestApplySelectionEndpoint:
         )
 
         # Create 4 active images in the burst
-        image_ids = []
-        for i in range(4):
-            img_id = _create_test_image(db_session, catalog_id, burst_id, i, "active")
-            image_ids.append(img_id)
+        image_ids = _create_burst_images(
+            db_session, catalog_id, burst_id, ["active"] * 4
+        )
 
         db_session.commit()
 
@@ -694,8 +697,7 @@ class TestApplySelectionEndpoint:
         )
 
         # Create 3 images in the burst
-        for i in range(3):
-            _create_test_image(db_session, catalog_id, burst_id, i, "active")
+        _create_burst_images(db_session, catalog_id, burst_id, ["active"] * 3)
 
         db_session.commit()
 
@@ -756,22 +758,9 @@ class TestBatchApplyEndpoint:
         )
 
         # Create 4 images for burst 1, one is the best image
-        for i in range(4):
-            img_id = best_image_id_1 if i == 1 else str(uuid.uuid4())
-            _create_test_image(db_session, catalog_id, burst_id_1, i, "active")
-            # Update the image ID for the best image
-            if i == 1:
-                db_session.execute(
-                    text(
-                        "UPDATE images SET id = :new_id WHERE catalog_id = :catalog_id AND burst_id = :burst_id AND burst_sequence = :seq"
-                    ),
-                    {
-                        "new_id": best_image_id_1,
-                        "catalog_id": str(catalog_id),
-                        "burst_id": burst_id_1,
-                        "seq": i,
-                    },
-                )
+        _create_burst_images(
+            db_session, catalog_id, burst_id_1, ["active"] * 4, ids={1: best_image_id_1}
+        )
 
         # Burst 2 with best_image_id
         burst_id_2 = str(uuid.uuid4())
@@ -796,22 +785,9 @@ class TestBatchApplyEndpoint:
         )
 
         # Create 3 images for burst 2
-        for i in range(3):
-            img_id = best_image_id_2 if i == 0 else str(uuid.uuid4())
-            _create_test_image(db_session, catalog_id, burst_id_2, i, "active")
-            # Update the image ID for the best image
-            if i == 0:
-                db_session.execute(
-                    text(
-                        "UPDATE images SET id = :new_id WHERE catalog_id = :catalog_id AND burst_id = :burst_id AND burst_sequence = :seq"
-                    ),
-                    {
-                        "new_id": best_image_id_2,
-                        "catalog_id": str(catalog_id),
-                        "burst_id": burst_id_2,
-                        "seq": i,
-                    },
-                )
+        _create_burst_images(
+            db_session, catalog_id, burst_id_2, ["active"] * 3, ids={0: best_image_id_2}
+        )
 
         # Burst 3 without best_image_id (NULL)
         burst_id_3 = str(uuid.uuid4())
@@ -834,8 +810,7 @@ class TestBatchApplyEndpoint:
         )
 
         # Create 3 images for burst 3
-        for i in range(3):
-            _create_test_image(db_session, catalog_id, burst_id_3, i, "active")
+        _create_burst_images(db_session, catalog_id, burst_id_3, ["active"] * 3)
 
         db_session.commit()
 
@@ -928,22 +903,9 @@ class TestBatchApplyEndpoint:
         )
 
         # Create 3 images for the burst
-        for i in range(3):
-            img_id = best_image_id if i == 0 else str(uuid.uuid4())
-            _create_test_image(db_session, catalog_id, burst_id, i, "active")
-            # Update the image ID for the best image
-            if i == 0:
-                db_session.execute(
-                    text(
-                        "UPDATE images SET id = :new_id WHERE catalog_id = :catalog_id AND burst_id = :burst_id AND burst_sequence = :seq"
-                    ),
-                    {
-                        "new_id": best_image_id,
-                        "catalog_id": str(catalog_id),
-                        "burst_id": burst_id,
-                        "seq": i,
-                    },
-                )
+        _create_burst_images(
+            db_session, catalog_id, burst_id, ["active"] * 3, ids={0: best_image_id}
+        )
 
         db_session.commit()
 
@@ -8,8 +8,6 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from lumina.db.models import Catalog
-
 pytestmark = pytest.mark.integration
 
 
@@ -17,18 +15,9 @@ class TestAutoTagEndpoint:
     """Tests for POST /api/catalogs/{catalog_id}/auto-tag endpoint."""
 
     @patch("lumina.jobs.background_jobs.run_job_in_background")
-    def test_start_auto_tag_success(self, mock_run_job, client, db_session):
+    def test_start_auto_tag_success(self, mock_run_job, client, make_catalog):
         """Test starting an auto-tag job successfully."""
-        # Create a real catalog in the test database
-        catalog_id = uuid.uuid4()
-        catalog = Catalog(
-            id=catalog_id,
-            name="Test Catalog",
-            schema_name=f"catalog_{str(catalog_id).replace('-', '_')}",
-            source_directories=["/tmp/test"],
-        )
-        db_session.add(catalog)
-        db_session.commit()
+        catalog = make_catalog("Test Catalog")
 
         # Mock run_job_in_background to do nothing
         mock_run_job.return_value = None
@@ -48,18 +37,9 @@ class TestAutoTagEndpoint:
         assert mock_run_job.called
 
     @patch("lumina.jobs.background_jobs.run_job_in_background")
-    def test_start_auto_tag_with_ollama(self, mock_run_job, client, db_session):
+    def test_start_auto_tag_with_ollama(self, mock_run_job, client, make_catalog):
         """Test starting an auto-tag job with Ollama backend."""
-        # Create a real catalog in the test database
-        catalog_id = uuid.uuid4()
-        catalog = Catalog(
-            id=catalog_id,
-            name="Ollama Test Catalog",
-            schema_name=f"catalog_{str(catalog_id).replace('-', '_')}",
-            source_directories=["/tmp/test"],
-        )
-        db_session.add(catalog)
-        db_session.commit()
+        catalog = make_catalog("Ollama Test Catalog")
 
         # Mock run_job_in_background
         mock_run_job.return_value = None
@@ -81,19 +61,10 @@ class TestAutoTagEndpoint:
 
     @patch("lumina.jobs.background_jobs.run_job_in_background")
     def test_start_auto_tag_with_continue_pipeline(
-        self, mock_run_job, client, db_session
+        self, mock_run_job, client, make_catalog
     ):
         """Test starting auto-tag with continue_pipeline flag."""
-        # Create a real catalog in the test database
-        catalog_id = uuid.uuid4()
-        catalog = Catalog(
-            id=catalog_id,
-            name="Pipeline Test Catalog",
-            schema_name=f"catalog_{str(catalog_id).replace('-', '_')}",
-            source_directories=["/tmp/test"],
-        )
-        db_session.add(catalog)
-        db_session.commit()
+        catalog = make_catalog("Pipeline Test Catalog")
 
         # Mock run_job_in_background
         mock_run_job.return_value = None
@@ -121,18 +92,9 @@ class TestAutoTagEndpoint:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    def test_start_auto_tag_invalid_backend(self, client, db_session):
+    def test_start_auto_tag_invalid_backend(self, client, make_catalog):
         """Test auto-tag with invalid backend returns 400."""
-        # Create a real catalog in the test database
-        catalog_id = uuid.uuid4()
-        catalog = Catalog(
-            id=catalog_id,
-            name="Invalid Backend Test",
-            schema_name=f"catalog_{str(catalog_id).replace('-', '_')}",
-            source_directories=["/tmp/test"],
-        )
-        db_session.add(catalog)
-        db_session.commit()
+        catalog = make_catalog("Invalid Backend Test")
 
         response = client.post(
             f"/api/catalogs/{catalog.id}/auto-tag",
@@ -144,19 +106,10 @@ class TestAutoTagEndpoint:
 
     @patch("lumina.jobs.background_jobs.run_job_in_background")
     def test_start_auto_tag_with_custom_threshold(
-        self, mock_run_job, client, db_session
+        self, mock_run_job, client, make_catalog
     ):
         """Test starting auto-tag with custom threshold."""
-        # Create a real catalog in the test database
-        catalog_id = uuid.uuid4()
-        catalog = Catalog(
-            id=catalog_id,
-            name="Threshold Test Catalog",
-            schema_name=f"catalog_{str(catalog_id).replace('-', '_')}",
-            source_directories=["/tmp/test"],
-        )
-        db_session.add(catalog)
-        db_session.commit()
+        catalog = make_catalog("Threshold Test Catalog")
 
         # Mock run_job_in_background
         mock_run_job.return_value = None
@@ -174,18 +127,9 @@ class TestAutoTagEndpoint:
         assert call_kwargs["threshold"] == 0.5
         assert call_kwargs["max_tags"] == 5
 
-    def test_start_auto_tag_threshold_validation(self, client, db_session):
+    def test_start_auto_tag_threshold_validation(self, client, make_catalog):
         """Test auto-tag threshold validation (must be 0.0-1.0)."""
-        # Create a real catalog in the test database
-        catalog_id = uuid.uuid4()
-        catalog = Catalog(
-            id=catalog_id,
-            name="Validation Test Catalog",
-            schema_name=f"catalog_{str(catalog_id).replace('-', '_')}",
-            source_directories=["/tmp/test"],
-        )
-        db_session.add(catalog)
-        db_session.commit()
+        catalog = make_catalog("Validation Test Catalog")
 
         # Threshold > 1.0 should fail
         response = client.post(
@@ -195,18 +139,9 @@ class TestAutoTagEndpoint:
 
         assert response.status_code == 422  # Validation error
 
-    def test_start_auto_tag_max_tags_validation(self, client, db_session):
+    def test_start_auto_tag_max_tags_validation(self, client, make_catalog):
         """Test auto-tag max_tags validation (must be 1-50)."""
-        # Create a real catalog in the test database
-        catalog_id = uuid.uuid4()
-        catalog = Catalog(
-            id=catalog_id,
-            name="Max Tags Validation Test",
-            schema_name=f"catalog_{str(catalog_id).replace('-', '_')}",
-            source_directories=["/tmp/test"],
-        )
-        db_session.add(catalog)
-        db_session.commit()
+        catalog = make_catalog("Max Tags Validation Test")
 
         # max_tags > 50 should fail
         response = client.post(
@@ -1,63 +1,18 @@
 """Tests for FastAPI endpoints.
 
-All tests require database connection.
+All tests require database connection. Requests go through the shared
+client from conftest.py, so the API uses each test's rolled-back session.
 """
 
 import uuid
 
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
-from lumina.api.app import create_app
-from lumina.db import get_db
 from lumina.db.catalog_schema import schema_exists
-from lumina.db.config import settings
-from lumina.db.models import Base
 
 pytestmark = pytest.mark.integration
 
 
-@pytest.fixture
-def test_db():
-    """Create a test database."""
-    # Use the already-patched settings and engine from conftest.py
-    # conftest.py ensures settings.database_url points to test database
-    engine = create_engine(settings.database_url)
-    Base.metadata.create_all(engine)
-
-    TestSessionLocal = sessionmaker(bind=engine)
-
-    def override_get_db():
-        db = TestSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-
-    yield override_get_db
-
-    # Clean up catalogs created during tests
-    from sqlalchemy import text
-
-    with engine.connect() as conn:
-        conn.execute(text("DELETE FROM catalogs"))
-        conn.commit()
-
-    # Dispose the engine to close all connections
-    engine.dispose()
-
-
-@pytest.fixture
-def client(test_db):
-    """Create a test client."""
-    app = create_app()
-    app.dependency_overrides[get_db] = test_db
-    with TestClient(app) as client:
-        yield client
-
-
 def test_health_check(client):
     """Test health check endpoint."""
     response = client.get("/health")
@@ -3,8 +3,9 @@
 All tests require database connection.
 """
 
-import uuid
-from unittest.mock import patch
+import itertools
+import os
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -13,10 +14,30 @@ from lumina.db.models import Job
 
 pytestmark = pytest.mark.integration
 
+# Rows are rolled back after each test, so a per-process counter is unique
+_ID_COUNTER = itertools.count()
+
 
 def unique_job_id(prefix: str = "test-job") -> str:
     """Generate a unique job ID for test isolation."""
-    return f"{prefix}-{uuid.uuid4().hex[:8]}"
+    return f"{prefix}-{os.getpid():x}-{next(_ID_COUNTER):08x}"
+
+
+def _create_test_jobs(db_session, specs: list) -> list:
+    """Create several test jobs with a single commit.
+
+    Args:
+        db_session: Database session
+        specs: One dict of Job fields per job; id is required and
+            status defaults to PENDING
+    """
+    jobs = [
+        Job(**{"job_type": "scan", "parameters": {}, "status": "PENDING", **spec})
+        for spec in specs
+    ]
+    db_session.add_all(jobs)
+    db_session.commit()
+    return jobs
 
 
 def _create_test_job(
@@ -28,17 +49,18 @@ def _create_test_job(
     error: str = None,
 ):
     """Create a test job in the database."""
-    job = Job(
-        id=job_id,
-        job_type="scan",
-        status=status,
-        parameters={},
-        progress=progress,
-        result=result,
-        error=error,
+    [job] = _create_test_jobs(
+        db_session,
+        [
+            {
+                "id": job_id,
+                "status": status,
+                "progress": progress,
+                "result": result,
+                "error": error,
+            }
+        ],
     )
-    db_session.add(job)
-    db_session.commit()
     return job
 
 
@@ -51,69 +73,76 @@ def test_health_endpoint(client: TestClient):
     assert data["backend"] == "threading"
 
 
-def test_get_job_success(client: TestClient, db_session):
-    """Test getting a completed job."""
-    job_id = unique_job_id("success")
-    _create_test_job(
-        db_session,
-        job_id,
-        status="SUCCESS",
-        result={"files_processed": 100, "files_added": 50},
-    )
+@pytest.mark.parametrize(
+    "status, fields, api_status",
+    [
+        ("SUCCESS", {"result": {"files_processed": 100, "files_added": 50}}, "success"),
+        (
+            "PROGRESS",
+            {"progress": {"current": 50, "total": 100, "percent": 50}},
+            "running",
+        ),
+        ("FAILURE", {"error": "Task failed due to error"}, "failure"),
+    ],
+    ids=["success", "progress", "failure"],
+)
+def test_get_job(client: TestClient, db_session, status, fields, api_status):
+    """Test getting a job reports its status and stored details."""
+    job_id = unique_job_id(status.lower())
+    _create_test_job(db_session, job_id, status=status, **fields)
 
     response = client.get(f"/api/jobs/{job_id}")
 
     assert response.status_code == 200
     data = response.json()
     assert data["id"] == job_id
-    assert data["status"] == "success"
-    assert data["result"]["files_processed"] == 100
-    assert data["result"]["files_added"] == 50
-
+    assert data["status"] == api_status
+    for key, value in fields.items():
+        assert data[key] == value
 
-def test_get_job_progress(client: TestClient, db_session):
-    """Test getting an in-progress job."""
-    job_id = unique_job_id("progress")
-    _create_test_job(
-        db_session,
-        job_id,
-        status="PROGRESS",
-        progress={"current": 50, "total": 100, "percent": 50},
-    )
 
-    response = client.get(f"/api/jobs/{job_id}")
-
-    assert response.status_code == 200
+def test_get_job_not_found(client: TestClient):
+    """Test getting a non-existent job."""
+    response = client.get("/api/jobs/nonexistent-job-id")
+    assert response.status_code == 404
     data = response.json()
-    assert data["id"] == job_id
-    assert data["status"] == "running"
-    assert data["progress"]["current"] == 50
-    assert data["progress"]["total"] == 100
-    assert data["progress"]["percent"] == 50
+    assert "not found" in data["detail"].lower()
 
 
-def test_get_job_failure(client: TestClient, db_session):
-    """Test getting a failed job."""
-    job_id = unique_job_id("failure")
-    _create_test_job(
-        db_session, job_id, status="FAILURE", error="Task failed due to error"
-    )
+def test_get_job_wait_blocks_until_finished(client: TestClient, db_session):
+    """Test wait=true holds an unfinished job and returns its final status."""
+    job_id = unique_job_id("wait")
+    job = _create_test_job(db_session, job_id, status="PROGRESS")
 
-    response = client.get(f"/api/jobs/{job_id}")
+    def finish(job_id, timeout):
+        job.status = "SUCCESS"
+        db_session.commit()
+        return True
+
+    with patch(
+        "lumina.api.routers.jobs_new.wait_for_job",
+        new_callable=AsyncMock,
+        side_effect=finish,
+    ) as wait_for_job:
+        response = client.get(f"/api/jobs/{job_id}?wait=true&timeout=5")
 
     assert response.status_code == 200
-    data = response.json()
-    assert data["id"] == job_id
-    assert data["status"] == "failure"
-    assert data["error"] == "Task failed due to error"
+    assert response.json()["status"] == "success"
+    wait_for_job.assert_awaited_once_with(job_id, 5.0)
 
 
-def test_get_job_not_found(client: TestClient):
-    """Test getting a non-existent job."""
-    response = client.get("/api/jobs/nonexistent-job-id")
-    assert response.status_code == 404
-    data = response.json()
-    assert "not found" in data["detail"].lower()
+def test_get_job_wait_skips_finished_job(client: TestClient, db_session):
+    """Test wait=true returns a terminal job without waiting."""
+    job_id = unique_job_id("done")
+    _create_test_job(db_session, job_id, status="FAILURE", error="boom")
+
+    with patch(
+        "lumina.api.routers.jobs_new.wait_for_job", new_callable=AsyncMock
+    ) as wait_for_job:
+        response = client.get(f"/api/jobs/{job_id}?wait=true")
+
+    assert response.json()["status"] == "failure"
+    wait_for_job.assert_not_awaited()
 
 
 def test_list_jobs_empty(client: TestClient):
@@ -130,8 +159,13 @@ def test_list_jobs_with_jobs(client: TestClient, db_session):
     job_id1 = unique_job_id("list1")
     job_id2 = unique_job_id("list2")
 
-    _create_test_job(db_session, job_id1, status="SUCCESS")
-    _create_test_job(db_session, job_id2, status="PROGRESS")
+    _create_test_jobs(
+        db_session,
+        [
+            {"id": job_id1, "status": "SUCCESS"},
+            {"id": job_id2, "status": "PROGRESS"},
+        ],
+    )
 
     response = client.get("/api/jobs/")
     assert response.status_code == 200
@@ -1,26 +1,47 @@
 """
 Tests for web CLI.
 
-All tests require database connection.
+CatalogDB and uvicorn are mocked, so these run without a database.
 """
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, create_autospec, patch
 
 import pytest
 from click.testing import CliRunner
+from sqlalchemy.orm import Session
 
 from lumina.cli.web import web
+from lumina.db.catalog_db import CatalogDB
 
-pytestmark = pytest.mark.integration
+
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """Share one Click runner across the module."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="module")
+def catalog_db() -> MagicMock:
+    """Build a CatalogDB stand-in whose catalog lookup finds a catalog.
+
+    Specced from the real classes, so a renamed method or attribute fails
+    here instead of being silently auto-created.
+    """
+    mock_db = create_autospec(CatalogDB, instance=True)
+    mock_db.catalog_id = "00000000-0000-0000-0000-000000000001"
+    mock_db.session = create_autospec(Session, instance=True)
+    mock_db.session.query.return_value.filter_by.return_value.first.return_value = (
+        MagicMock()
+    )
+    return mock_db
 
 
 class TestWebCLI:
     """Tests for lumina-web CLI command."""
 
-    def test_web_catalog_not_found(self, tmp_path: Path) -> None:
+    def test_web_catalog_not_found(self, runner: CliRunner, tmp_path: Path) -> None:
         """Test error when catalog doesn't exist."""
-        runner = CliRunner()
         catalog_path = tmp_path / "nonexistent"
 
         result = runner.invoke(web, [str(catalog_path)])
@@ -29,9 +50,8 @@ class TestWebCLI:
         # Note: click.Path(exists=True) causes Click to fail early
         assert result.exit_code != 0
 
-    def test_web_catalog_file_missing(self, tmp_path: Path) -> None:
+    def test_web_catalog_file_missing(self, runner: CliRunner, tmp_path: Path) -> None:
         """Test error when catalog directory exists but catalog not in database."""
-        runner = CliRunner()
         catalog_path = tmp_path / "catalog"
         catalog_path.mkdir()
 
@@ -48,20 +68,18 @@ class TestWebCLI:
     @patch("lumina.cli.web.uvicorn.run")
     @patch("lumina.db.CatalogDB")
     def test_web_basic_launch(
-        self, mock_catalog_db: MagicMock, mock_run: MagicMock, tmp_path: Path
+        self,
+        mock_catalog_db: MagicMock,
+        mock_run: MagicMock,
+        runner: CliRunner,
+        catalog_db: MagicMock,
+        tmp_path: Path,
     ) -> None:
         """Test basic web server launch."""
-        runner = CliRunner()
         catalog_path = tmp_path / "catalog"
         catalog_path.mkdir()
 
-        # Mock the CatalogDB context manager and query
-        mock_db = MagicMock()
-        mock_catalog = MagicMock()
-        mock_db.session.query.return_value.filter_by.return_value.first.return_value = (
-            mock_catalog
-        )
-        mock_catalog_db.return_value.__enter__.return_value = mock_db
+        mock_catalog_db.return_value.__enter__.return_value = catalog_db
 
         # Launch web server
         result = runner.invoke(web, [str(catalog_path)])
@@ -74,20 +92,18 @@ class TestWebCLI:
     @patch("lumina.cli.web.uvicorn.run")
     @patch("lumina.db.CatalogDB")
     def test_web_custom_host_port(
-        self, mock_catalog_db: MagicMock, mock_run: MagicMock, tmp_path: Path
+        self,
+        mock_catalog_db: MagicMock,
+        mock_run: MagicMock,
+        runner: CliRunner,
+        catalog_db: MagicMock,
+        tmp_path: Path,
     ) -> None:
         """Test custom host and port."""
-        runner = CliRunner()
         catalog_path = tmp_path / "catalog"
         catalog_path.mkdir()
 
-        # Mock the CatalogDB context manager and query
-        mock_db = MagicMock()
-        mock_catalog = MagicMock()
-        mock_db.session.query.return_value.filter_by.return_value.first.return_value = (
-            mock_catalog
-        )
-        mock_catalog_db.return_value.__enter__.return_value = mock_db
+        mock_catalog_db.return_value.__enter__.return_value = catalog_db
 
         # Launch with custom host and port
         result = runner.invoke(
@@ -104,20 +120,18 @@ class TestWebCLI:
     @patch("lumina.cli.web.uvicorn.run")
     @patch("lumina.db.CatalogDB")
     def test_web_reload_mode(
-        self, mock_catalog_db: MagicMock, mock_run: MagicMock, tmp_path: Path
+        self,
+        mock_catalog_db: MagicMock,
+        mock_run: MagicMock,
+        runner: CliRunner,
+        catalog_db: MagicMock,
+        tmp_path: Path,
     ) -> None:
         """Test reload mode for development."""
-        runner = CliRunner()
         catalog_path = tmp_path / "catalog"
         catalog_path.mkdir()
 
-        # Mock the CatalogDB context manager and query
-        mock_db = MagicMock()
-        mock_catalog = MagicMock()
-        mock_db.session.query.return_value.filter_by.return_value.first.return_value = (
-            mock_catalog
-        )
-        mock_catalog_db.return_value.__enter__.return_value = mock_db
+        mock_catalog_db.return_value.__enter__.return_value = catalog_db
 
         # Launch with reload
         result = runner.invoke(web, [str(catalog_path), "--reload"])
@@ -130,20 +144,18 @@ class TestWebCLI:
     @patch("lumina.cli.web.uvicorn.run")
     @patch("lumina.db.CatalogDB")
     def test_web_default_settings(
-        self, mock_catalog_db: MagicMock, mock_run: MagicMock, tmp_path: Path
+        self,
+        mock_catalog_db: MagicMock,
+        mock_run: MagicMock,
+        runner: CliRunner,
+        catalog_db: MagicMock,
+        tmp_path: Path,
     ) -> None:
         """Test default host, port, and settings."""
-        runner = CliRunner()
         catalog_path = tmp_path / "catalog"
         catalog_path.mkdir()
 
-        # Mock the CatalogDB context manager and query
-        mock_db = MagicMock()
-        mock_catalog = MagicMock()
-        mock_db.session.query.return_value.filter_by.return_value.first.return_value = (
-            mock_catalog
-        )
-        mock_catalog_db.return_value.__enter__.return_value = mock_db
+        mock_catalog_db.return_value.__enter__.return_value = catalog_db
 
         # Launch with defaults
         result = runner.invoke(web, [str(catalog_path)])
@@ -23,15 +23,18 @@ modules_to_remove = [name for name in sys.modules if name.startswith("lumina")]
 for module_name in modules_to_remove:
     del sys.modules[module_name]
 
+import hashlib  # noqa: E402
 import tempfile  # noqa: E402
 import uuid  # noqa: E402
 from pathlib import Path  # noqa: E402
 from typing import Generator  # noqa: E402
 
+import numpy as np  # noqa: E402
 import pytest  # noqa: E402
 from PIL import Image, ImageDraw  # noqa: E402
 from sqlalchemy import create_engine, event, text  # noqa: E402
 from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+from sqlalchemy.schema import CreateIndex, CreateTable  # noqa: E402
 
 # Now import lumina with test environment variable set
 from lumina.db.config import Settings  # noqa: E402
@@ -43,6 +46,34 @@ assert test_settings.postgres_db == test_db_name, (
     f"Tests would write to production database!"
 )
 
+
+def _ensure_test_database() -> None:
+    """Create this worker's test database if it does not exist yet.
+
+    Each xdist worker gets its own database, so ``pytest -n N`` needs one
+    database per worker. Connects to the ``postgres`` maintenance database
+    to create it; if the server is unreachable the error is left for the
+    database fixtures to report.
+    """
+    admin_url = test_settings.database_url.rsplit("/", 1)[0] + "/postgres"
+    admin_engine = create_engine(admin_url, isolation_level="AUTOCOMMIT")
+    try:
+        with admin_engine.connect() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                {"name": test_db_name},
+            ).scalar()
+            if not exists:
+                conn.execute(text(f'CREATE DATABASE "{test_db_name}"'))
+    except Exception:
+        # No server, no CREATEDB privilege, or another run created it first
+        pass
+    finally:
+        admin_engine.dispose()
+
+
+_ensure_test_database()
+
 # ==============================================================================
 # Database setup WITHOUT global patching
 # ==============================================================================
@@ -92,18 +123,57 @@ def engine():
     return _test_engine
 
 
+def _schema_fingerprint(engine) -> str:
+    """Hash the DDL of every ORM table and index."""
+    ddl = []
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=engine.dialect)))
+        ddl.extend(
+            str(CreateIndex(index).compile(dialect=engine.dialect))
+            for index in sorted(table.indexes, key=lambda i: i.name or "")
+        )
+    return hashlib.sha256("\n".join(ddl).encode()).hexdigest()
+
+
+def _schema_is_current(engine, fingerprint: str) -> bool:
+    """Check whether the database was built from this exact schema."""
+    with engine.connect() as conn:
+        conn.execute(
+            text("CREATE TABLE IF NOT EXISTS _schema_marker (hash TEXT PRIMARY KEY)")
+        )
+        conn.commit()
+        return (
+            conn.execute(
+                text("SELECT 1 FROM _schema_marker WHERE hash = :hash"),
+                {"hash": fingerprint},
+            ).scalar()
+            is not None
+        )
+
+
 @pytest.fixture(scope="session")
 def tables_created(engine):
     """
     Create all tables once for the test session.
 
-    This creates tables in the current worker's database.
-    Note: standalone_catalog_db creates its own connections and needs
-    to ensure tables exist independently.
+    This creates tables in the current worker's database. Worker databases
+    persist between runs, so the DDL fingerprint is stored in
+    _schema_marker and the setup below is skipped when the models have
+    not changed since the last run.
     """
-    # Create pgvector extension before creating tables
+    fingerprint = _schema_fingerprint(engine)
+    if _schema_is_current(engine, fingerprint):
+        yield
+        return
+
+    # Create pgvector extension before creating tables; a read-only probe
+    # avoids a write transaction when it is already installed
     with engine.connect() as conn:
-        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+        installed = conn.execute(
+            text("SELECT 1 FROM pg_extension WHERE extname = 'vector'")
+        ).scalar()
+        if not installed:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
         conn.commit()
 
     Base.metadata.create_all(bind=engine)
@@ -176,6 +246,14 @@ def tables_created(engine):
             )
         conn.commit()
 
+    with engine.connect() as conn:
+        conn.execute(text("DELETE FROM _schema_marker"))
+        conn.execute(
+            text("INSERT INTO _schema_marker (hash) VALUES (:hash)"),
+            {"hash": fingerprint},
+        )
+        conn.commit()
+
     yield
     # Tables persist for the entire test session
     # Optionally drop them here if needed:
@@ -192,36 +270,21 @@ def db_session(engine, tables_created):
     """
     Provide a transactional database session for tests.
 
-    Each test gets its own SAVEPOINT that's rolled back after the test.
-    This ensures complete isolation between tests and works with pytest-xdist.
+    The session joins an outer transaction that is rolled back after the
+    test, so nothing a test writes is ever durably committed. This ensures
+    complete isolation between tests and works with pytest-xdist.
 
-    Uses SAVEPOINT (nested transactions) instead of full transaction rollback
-    to avoid connection pool issues with parallel test execution.
+    With join_transaction_mode="create_savepoint", application code that
+    calls session.commit() or session.rollback() only releases or rolls
+    back a SAVEPOINT inside the outer transaction.
     """
     connection = engine.connect()
     transaction = connection.begin()
-
-    # Create a session bound to this specific transaction
-    TestSession = sessionmaker(bind=connection, autoflush=False, autocommit=False)
-    session = TestSession()
-
-    # Create a SAVEPOINT for test isolation
-    nested = connection.begin_nested()
-
-    # If the application code calls session.commit(), it will only commit
-    # the SAVEPOINT, not the outer transaction
-    @event.listens_for(session, "after_transaction_end")
-    def restart_savepoint(session, transaction):
-        if transaction.nested and not transaction._parent.nested:
-            # Restart the SAVEPOINT after each commit
-            session.begin_nested()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
 
     yield session
 
-    # Rollback the SAVEPOINT and outer transaction to undo all changes
     session.close()
-    if nested.is_active:
-        nested.rollback()
     transaction.rollback()
     connection.close()
 
@@ -245,7 +308,7 @@ def test_catalog_db(db_session):
 
 
 @pytest.fixture
-def standalone_catalog_db(engine):
+def standalone_catalog_db(tables_created):
     """
     Create a CatalogDB instance with its own connection.
 
@@ -253,13 +316,8 @@ def standalone_catalog_db(engine):
     These tests won't have transactional rollback, but will have test isolation
     through unique catalog IDs.
 
-    Note: Ensures tables exist in the test database before creating CatalogDB.
+    Note: Depends on tables_created so tables exist before creating CatalogDB.
     """
-    # Create pgvector extension and ensure tables exist in this worker's database
-    with engine.connect() as conn:
-        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
-        conn.commit()
-    Base.metadata.create_all(bind=engine)
 
     def _create_catalog_db(catalog_path: Path):
         """Factory function to create standalone CatalogDB."""
@@ -292,6 +350,20 @@ def sample_image(temp_dir: Path) -> Path:
     return image_path
 
 
+@pytest.fixture(scope="session")
+def gradient_image_path(tmp_path_factory) -> Path:
+    """Create a 64x64 RGB gradient PNG once per session (treat as read-only)."""
+    image_path = tmp_path_factory.mktemp("gradient") / "gradient.png"
+    i = np.arange(64, dtype=np.uint8)[:, None]
+    j = np.arange(64, dtype=np.uint8)[None, :]
+    arr = np.empty((64, 64, 3), dtype=np.uint8)
+    arr[..., 0] = i * 4
+    arr[..., 1] = j * 4
+    arr[..., 2] = (i + j) * 2
+    Image.fromarray(arr).save(image_path)
+    return image_path
+
+
 @pytest.fixture
 def sample_images(temp_dir: Path) -> list[Path]:
     """Create multiple test images with different colors."""
@@ -1,15 +1,25 @@
 """Tests for base repository pattern."""
 
-import uuid
+import itertools
+import os
 from typing import Optional
 
 import pytest
-from sqlalchemy import text
 from sqlmodel import Field, Session, SQLModel
 
+from lumina.db.repositories.base import BaseRepository
+
 # Mark all tests in this module as integration tests (require database)
 pytestmark = pytest.mark.integration
 
+# Rows are rolled back after each test, so a per-process counter is unique
+_ID_COUNTER = itertools.count()
+
+
+def unique_id(prefix: str) -> str:
+    """Generate a unique entity ID for test isolation."""
+    return f"{prefix}-{os.getpid():x}-{next(_ID_COUNTER):08x}"
+
 
 # Model for repository tests - registered with SQLModel's metadata
 # The table is created by conftest.py's SQLModel.metadata.create_all()
@@ -33,21 +43,21 @@ def mock_table_created(engine):  # type: ignore[no-untyped-def]
 
 @pytest.fixture
 def session(engine, mock_table_created):  # type: ignore[no-untyped-def]
-    """Create database session with cleanup."""
-    with Session(engine) as db_session:
-        # Clean up any existing test data before each test
-        db_session.exec(text("DELETE FROM test_base_mock_entities"))  # type: ignore[call-overload]
-        db_session.commit()
+    """Create a database session whose commits are rolled back after the test."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    with Session(
+        bind=connection, join_transaction_mode="create_savepoint"
+    ) as db_session:
         yield db_session
-        db_session.rollback()
+    transaction.rollback()
+    connection.close()
 
 
 def test_repository_add(session: Session) -> None:
     """Should add entity to database."""
-    from lumina.db.repositories.base import BaseRepository
-
     repo = BaseRepository(session, MockEntity)
-    entity = MockEntity(id=f"add-{uuid.uuid4().hex[:8]}", name="Test")
+    entity = MockEntity(id=unique_id("add"), name="Test")
 
     result = repo.add(entity)
     repo.commit()
@@ -57,10 +67,8 @@ def test_repository_add(session: Session) -> None:
 
 def test_repository_get(session: Session) -> None:
     """Should retrieve entity by ID."""
-    from lumina.db.repositories.base import BaseRepository
-
     repo = BaseRepository(session, MockEntity)
-    test_id = f"get-{uuid.uuid4().hex[:8]}"
+    test_id = unique_id("get")
     entity = MockEntity(id=test_id, name="Test")
     repo.add(entity)
     repo.commit()
@@ -74,8 +82,6 @@ def test_repository_get(session: Session) -> None:
 
 def test_repository_get_not_found(session: Session) -> None:
     """Should return None for non-existent ID."""
-    from lumina.db.repositories.base import BaseRepository
-
     repo = BaseRepository(session, MockEntity)
 
     result = repo.get("nonexistent")
@@ -85,11 +91,12 @@ def test_repository_get_not_found(session: Session) -> None:
 
 def test_repository_list(session: Session) -> None:
     """Should list entities with pagination."""
-    from lumina.db.repositories.base import BaseRepository
-
     repo = BaseRepository(session, MockEntity)
-    for i in range(5):
-        repo.add(MockEntity(id=f"list-{uuid.uuid4().hex[:8]}-{i}", name=f"Test {i}"))
+    # Setup rows go straight through a Core executemany, skipping the ORM
+    session.execute(
+        MockEntity.__table__.insert(),  # type: ignore[attr-defined]
+        [{"id": unique_id("list"), "name": f"Test {i}"} for i in range(5)],
+    )
     repo.commit()
 
     # Get first page
@@ -107,10 +114,8 @@ def test_repository_list(session: Session) -> None:
 
 def test_repository_update(session: Session) -> None:
     """Should update existing entity."""
-    from lumina.db.repositories.base import BaseRepository
-
     repo = BaseRepository(session, MockEntity)
-    test_id = f"update-{uuid.uuid4().hex[:8]}"
+    test_id = unique_id("update")
     entity = MockEntity(id=test_id, name="Original")
     repo.add(entity)
     repo.commit()
@@ -127,10 +132,8 @@ def test_repository_update(session: Session) -> None:
 
 def test_repository_delete(session: Session) -> None:
     """Should delete entity."""
-    from lumina.db.repositories.base import BaseRepository
-
     repo = BaseRepository(session, MockEntity)
-    test_id = f"delete-{uuid.uuid4().hex[:8]}"
+    test_id = unique_id("delete")
     entity = MockEntity(id=test_id, name="Test")
     repo.add(entity)
     repo.commit()
@@ -144,10 +147,8 @@ def test_repository_delete(session: Session) -> None:
 
 def test_repository_rollback(session: Session) -> None:
     """Should rollback uncommitted changes."""
-    from lumina.db.repositories.base import BaseRepository
-
     repo = BaseRepository(session, MockEntity)
-    test_id = f"rollback-{uuid.uuid4().hex[:8]}"
+    test_id = unique_id("rollback")
     entity = MockEntity(id=test_id, name="Test")
     repo.add(entity)
 
@@ -0,0 +1,45 @@
+"""Tests for COPY-based bulk loading helpers."""
+
+from unittest.mock import MagicMock
+
+from lumina.db.bulk import _format_copy_value, copy_rows
+
+
+def _session_with_cursor(cursor):
+    """Build a mock session whose driver connection yields the given cursor."""
+    session = MagicMock()
+    dbapi_conn = session.connection.return_value.connection.driver_connection
+    dbapi_conn.cursor.return_value.__enter__.return_value = cursor
+    return session
+
+
+def test_format_copy_value_escapes_text_format():
+    """Test NULLs and special characters use COPY text-format escapes."""
+    assert _format_copy_value(None) == "\\N"
+    assert _format_copy_value(3) == "3"
+    assert _format_copy_value("a\tb\nc\\d") == "a\\tb\\nc\\\\d"
+
+
+def test_copy_rows_psycopg3_writes_rows():
+    """Test psycopg 3 cursors stream rows through cursor.copy()."""
+    cursor = MagicMock()
+    copy = cursor.copy.return_value.__enter__.return_value
+
+    copy_rows(_session_with_cursor(cursor), "tmp", ("a", "b"), [(1, "x"), (2, None)])
+
+    cursor.copy.assert_called_once_with("COPY tmp (a, b) FROM STDIN")
+    assert [c.args[0] for c in copy.write_row.call_args_list] == [
+        (1, "x"),
+        (2, None),
+    ]
+
+
+def test_copy_rows_psycopg2_uses_copy_expert():
+    """Test psycopg2 cursors receive a text-format buffer via copy_expert()."""
+    cursor = MagicMock(spec=["copy_expert"])
+
+    copy_rows(_session_with_cursor(cursor), "tmp", ("a", "b"), [(1, "x"), (2, None)])
+
+    sql, buffer = cursor.copy_expert.call_args.args
+    assert sql == "COPY tmp (a, b) FROM STDIN"
+    assert buffer.getvalue() == "1\tx\n2\t\\N\n"
@@ -22,13 +22,16 @@ from lumina.db.models import Catalog
 pytestmark = pytest.mark.integration
 
 
-@pytest.fixture
-def test_catalog_id():
-    """Generate a test catalog ID and create catalog record."""
-    # Ensure schema exists
+@pytest.fixture(scope="module")
+def catalog_schema():
+    """Ensure the schema exists once for the module."""
     if not schema_exists():
         create_schema()
 
+
+@pytest.fixture
+def test_catalog_id(catalog_schema):
+    """Generate a test catalog ID and create catalog record."""
     catalog_id = uuid.uuid4()
 
     # Create catalog record in database
@@ -0,0 +1,49 @@
+"""Shared fixtures for end-to-end tests against a running API server."""
+
+import socket
+import uuid
+
+import pytest
+
+# Where docker-compose publishes the API server
+API_HOST = "localhost"
+API_PORT = 8765
+
+
+@pytest.fixture(scope="module", autouse=True)
+def api_server() -> None:
+    """Skip the module when nothing is listening on the API port.
+
+    One short TCP connect replaces a connection timeout in every test
+    when the Docker stack is not running.
+    """
+    try:
+        socket.create_connection((API_HOST, API_PORT), timeout=0.1).close()
+    except OSError:
+        pytest.skip(f"API server not reachable on {API_HOST}:{API_PORT}")
+
+
+@pytest.fixture(scope="module")
+def http():
+    """Share one keep-alive HTTP session across a test module.
+
+    Module-level requests.get/post open a new connection per call; a
+    Session reuses pooled connections to the server instead.
+    """
+    requests = pytest.importorskip("requests")
+    from requests.adapters import HTTPAdapter
+
+    with requests.Session() as session:
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=16))
+        yield session
+
+
+@pytest.fixture
+def catalog_id() -> str:
+    """Return a fresh catalog ID so tests never see each other's data.
+
+    The server stores catalog IDs as UUIDs, so this stays a real UUID
+    rather than a cheaper counter, which would also collide across xdist
+    workers and repeated runs against the same stack.
+    """
+    return str(uuid.uuid4())
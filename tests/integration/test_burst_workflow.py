@@ -27,7 +27,7 @@ class TestBurstWorkflowIntegration:
 
     BASE_URL = "http://localhost:8765"
 
-    def test_complete_burst_review_workflow(self, tmp_path):
+    def test_complete_burst_review_workflow(self, http, catalog_id, tmp_path):
         """Test complete burst review workflow: list → detail → apply → verify.
 
         This test verifies the full user workflow:
@@ -38,14 +38,13 @@ class TestBurstWorkflowIntegration:
         5. Verify the selection was applied correctly
         """
         # Create a test catalog
-        catalog_id = str(uuid.uuid4())
 
         # Step 1: Create catalog with burst-like images
         # In a real scenario, this would be done through the catalog creation API
         # For this test, we'll trigger burst detection on an existing catalog
 
         # Step 2: Start burst detection job
-        detect_response = requests.post(
+        detect_response = http.post(
             f"{self.BASE_URL}/api/catalogs/{catalog_id}/detect-bursts",
             params={
                 "gap_threshold": 2.0,
@@ -69,7 +68,7 @@ class TestBurstWorkflowIntegration:
         detection_complete = False
 
         while time.time() - start_time < max_wait:
-            status_response = requests.get(f"{self.BASE_URL}/api/jobs/{job_id}")
+            status_response = http.get(f"{self.BASE_URL}/api/jobs/{job_id}")
             if status_response.status_code == 200:
                 status = status_response.json()["status"]
                 if status in ["SUCCESS", "FAILURE"]:
@@ -82,7 +81,7 @@ class TestBurstWorkflowIntegration:
             return
 
         # Step 3: List bursts
-        list_response = requests.get(
+        list_response = http.get(
             f"{self.BASE_URL}/api/catalogs/{catalog_id}/bursts",
             params={"limit": 100, "offset": 0},
         )
@@ -101,7 +100,7 @@ class TestBurstWorkflowIntegration:
 
         # Step 4: Get details for first burst
         first_burst_id = burst_list["bursts"][0]["id"]
-        detail_response = requests.get(
+        detail_response = http.get(
             f"{self.BASE_URL}/api/catalogs/{catalog_id}/bursts/{first_burst_id}"
         )
 
@@ -122,7 +121,7 @@ class TestBurstWorkflowIntegration:
             # If no best_image_id, use the first image
             best_image_id = burst_detail["images"][0]["id"]
 
-        apply_response = requests.post(
+        apply_response = http.post(
             f"{self.BASE_URL}/api/catalogs/{catalog_id}/bursts/{first_burst_id}/apply-selection",
             json={"selected_image_id": best_image_id},
         )
@@ -139,7 +138,7 @@ class TestBurstWorkflowIntegration:
         # Step 6: Verify the selection was applied
         # Get image details to verify status changes
         for image in burst_detail["images"]:
-            image_response = requests.get(
+            image_response = http.get(
                 f"{self.BASE_URL}/api/catalogs/{catalog_id}/images/{image['id']}"
             )
 
@@ -150,7 +149,7 @@ class TestBurstWorkflowIntegration:
                 else:
                     assert image_data.get("status_id") == "rejected"
 
-    def test_batch_apply_burst_workflow(self, tmp_path):
+    def test_batch_apply_burst_workflow(self, http, catalog_id, tmp_path):
         """Test batch apply workflow: batch apply → verify all bursts processed.
 
         This test verifies:
@@ -160,10 +159,9 @@ class TestBurstWorkflowIntegration:
         4. Verify images were correctly marked as active/rejected
         """
         # Create a test catalog
-        catalog_id = str(uuid.uuid4())
 
         # Step 1: Start burst detection
-        detect_response = requests.post(
+        detect_response = http.post(
             f"{self.BASE_URL}/api/catalogs/{catalog_id}/detect-bursts",
             params={
                 "gap_threshold": 2.0,
@@ -184,7 +182,7 @@ class TestBurstWorkflowIntegration:
         detection_complete = False
 
         while time.time() - start_time < max_wait:
-            status_response = requests.get(f"{self.BASE_URL}/api/jobs/{job_id}")
+            status_response = http.get(f"{self.BASE_URL}/api/jobs/{job_id}")
             if status_response.status_code == 200:
                 status = status_response.json()["status"]
                 if status in ["SUCCESS", "FAILURE"]:
@@ -197,9 +195,7 @@ class TestBurstWorkflowIntegration:
             return
 
         # Step 2: Get burst count before batch apply
-        list_response = requests.get(
-            f"{self.BASE_URL}/api/catalogs/{catalog_id}/bursts"
-        )
+        list_response = http.get(f"{self.BASE_URL}/api/catalogs/{catalog_id}/bursts")
 
         assert list_response.status_code == 200
         burst_list = list_response.json()
@@ -213,7 +209,7 @@ class TestBurstWorkflowIntegration:
         )
 
         # Step 3: Batch apply burst selections
-        batch_apply_response = requests.post(
+        batch_apply_response = http.post(
             f"{self.BASE_URL}/api/catalogs/{catalog_id}/bursts/batch-apply",
             json={"use_recommendations": True},
         )
@@ -237,7 +233,7 @@ class TestBurstWorkflowIntegration:
         # Step 6: Verify individual burst states
         for burst in burst_list["bursts"]:
             if burst.get("best_image_id"):
-                burst_detail = requests.get(
+                burst_detail = http.get(
                     f"{self.BASE_URL}/api/catalogs/{catalog_id}/bursts/{burst['id']}"
                 )
 
@@ -246,7 +242,7 @@ class TestBurstWorkflowIntegration:
 
                     # Check each image in the burst
                     for image in detail["images"]:
-                        image_response = requests.get(
+                        image_response = http.get(
                             f"{self.BASE_URL}/api/catalogs/{catalog_id}/images/{image['id']}"
                         )
 
@@ -257,7 +253,7 @@ class TestBurstWorkflowIntegration:
                             else:
                                 assert image_data.get("status_id") == "rejected"
 
-    def test_rejected_images_hidden_from_list(self, tmp_path):
+    def test_rejected_images_hidden_from_list(self, http, catalog_id, tmp_path):
         """Test rejected images are hidden from list by default.
 
         This test verifies:
@@ -268,10 +264,9 @@ class TestBurstWorkflowIntegration:
         5. Verify counts are correct
         """
         # Create a test catalog
-        catalog_id = str(uuid.uuid4())
 
         # Step 1: Detect bursts and apply selections
-        detect_response = requests.post(
+        detect_response = http.post(
             f"{self.BASE_URL}/api/catalogs/{catalog_id}/detect-bursts",
             params={
                 "gap_threshold": 2.0,
@@ -292,7 +287,7 @@ class TestBurstWorkflowIntegration:
         detection_complete = False
 
         while time.time() - start_time < max_wait:
-            status_response = requests.get(f"{self.BASE_URL}/api/jobs/{job_id}")
+            status_response = http.get(f"{self.BASE_URL}/api/jobs/{job_id}")
             if status_response.status_code == 200:
                 status = status_response.json()["status"]
                 if status in ["SUCCESS", "FAILURE"]:
@@ -305,7 +300,7 @@ class TestBurstWorkflowIntegration:
             return
 
         # Get total image count before applying selections
-        all_images_response = requests.get(
+        all_images_response = http.get(
             f"{self.BASE_URL}/api/catalogs/{catalog_id}/images",
             params={"limit": 1000},
         )
@@ -318,7 +313,7 @@ class TestBurstWorkflowIntegration:
         initial_total = all_images.get("total", len(all_images.get("images", [])))
 
         # Step 2: Batch apply burst selections
-        batch_apply_response = requests.post(
+        batch_apply_response = http.post(
             f"{self.BASE_URL}/api/catalogs/{catalog_id}/bursts/batch-apply",
             json={"use_recommendations": True},
         )
@@ -335,7 +330,7 @@ class TestBurstWorkflowIntegration:
             return
 
         # Step 3: List images without status filter (should exclude rejected by default)
-        default_list_response = requests.get(
+        default_list_response = http.get(
             f"{self.BASE_URL}/api/catalogs/{catalog_id}/images",
             params={"limit": 1000},
         )
@@ -349,7 +344,7 @@ class TestBurstWorkflowIntegration:
             assert image.get("status_id") != "rejected"
 
         # Step 4: List images with status_id=rejected filter
-        rejected_list_response = requests.get(
+        rejected_list_response = http.get(
             f"{self.BASE_URL}/api/catalogs/{catalog_id}/images",
             params={"limit": 1000, "status_id": "rejected"},
         )
@@ -366,7 +361,7 @@ class TestBurstWorkflowIntegration:
         assert len(rejected_images) == expected_rejected
 
         # Step 5: List images with status_id=active filter
-        active_list_response = requests.get(
+        active_list_response = http.get(
             f"{self.BASE_URL}/api/catalogs/{catalog_id}/images",
             params={"limit": 1000, "status_id": "active"},
         )
@@ -394,44 +389,40 @@ class TestBurstAPIHealth:
 
     BASE_URL = "http://localhost:8765"
 
-    def test_burst_endpoints_available(self):
+    def test_burst_endpoints_available(self, http, catalog_id):
         """Test that burst API endpoints are accessible."""
         # Create a test catalog ID (doesn't need to exist)
-        catalog_id = str(uuid.uuid4())
 
         # Test list bursts endpoint (should return 200 or 404)
-        list_response = requests.get(
-            f"{self.BASE_URL}/api/catalogs/{catalog_id}/bursts"
-        )
+        list_response = http.get(f"{self.BASE_URL}/api/catalogs/{catalog_id}/bursts")
         assert list_response.status_code in [200, 404]
 
         # Test detect bursts endpoint (should accept request)
-        detect_response = requests.post(
+        detect_response = http.post(
             f"{self.BASE_URL}/api/catalogs/{catalog_id}/detect-bursts"
         )
         assert detect_response.status_code in [200, 202, 404]
 
         # Test batch apply endpoint (should return 404 for non-existent catalog)
-        batch_response = requests.post(
+        batch_response = http.post(
             f"{self.BASE_URL}/api/catalogs/{catalog_id}/bursts/batch-apply",
             json={"use_recommendations": True},
         )
         assert batch_response.status_code in [200, 404]
 
-    def test_burst_api_error_handling(self):
+    def test_burst_api_error_handling(self, http, catalog_id):
         """Test burst API error handling for invalid inputs."""
         # Test with invalid catalog ID format
         invalid_id = "not-a-uuid"
 
-        response = requests.get(f"{self.BASE_URL}/api/catalogs/{invalid_id}/bursts")
+        response = http.get(f"{self.BASE_URL}/api/catalogs/{invalid_id}/bursts")
         # Should return 422 (validation error) or handle gracefully
         assert response.status_code in [422, 400, 404, 500]
 
         # Test with non-existent burst ID
-        catalog_id = str(uuid.uuid4())
         burst_id = str(uuid.uuid4())
 
-        response = requests.get(
+        response = http.get(
             f"{self.BASE_URL}/api/catalogs/{catalog_id}/bursts/{burst_id}"
         )
         assert response.status_code in [404, 422]
@@ -9,6 +9,7 @@ Run with: docker-compose up && pytest -m e2e
 
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -18,17 +19,99 @@ requests = pytest.importorskip("requests")
 # Mark as both integration and e2e - these need full Docker stack
 pytestmark = [pytest.mark.integration, pytest.mark.e2e]
 
+TERMINAL_STATUSES = ("SUCCESS", "FAILURE")
+
+
+def _poll(fetch, is_done, timeout: float, initial: float = 0.05, cap: float = 0.5):
+    """Call fetch() until is_done(result) or the timeout passes.
+
+    The poll interval starts at ``initial`` seconds and doubles up to
+    ``cap``, so fast jobs return almost immediately.
+
+    Returns:
+        The last fetched result
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial
+    while True:
+        result = fetch()
+        remaining = deadline - time.monotonic()
+        if is_done(result) or remaining <= 0:
+            return result
+        time.sleep(min(delay, remaining))
+        delay = min(cap, delay * 2)
+
+
+def wait_for_terminal(http, base_url: str, job_id: str, timeout: float = 10.0) -> dict:
+    """Wait for a job to reach a terminal status or the timeout to pass.
+
+    Asks the server to hold the request until the job finishes, then falls
+    back to polling if the job is still running (e.g. it was picked up by
+    another server process).
+
+    Returns:
+        The last job status payload
+    """
+    deadline = time.monotonic() + timeout
+    response = http.get(
+        f"{base_url}/api/jobs/{job_id}",
+        params={"wait": "true", "timeout": timeout},
+        timeout=timeout + 2,
+    )
+    assert response.status_code == 200
+    job = response.json()
+    remaining = deadline - time.monotonic()
+    if job["status"] in TERMINAL_STATUSES or remaining <= 0:
+        return job
+
+    def fetch() -> dict:
+        response = http.get(f"{base_url}/api/jobs/{job_id}")
+        assert response.status_code == 200
+        return response.json()
+
+    return _poll(fetch, lambda job: job["status"] in TERMINAL_STATUSES, remaining)
+
+
+def wait_for_all_terminal(
+    http, base_url: str, job_ids: list, timeout: float = 10.0
+) -> dict:
+    """Poll the job list until every job is terminal or the timeout passes.
+
+    One list request per poll covers all jobs, instead of one GET each.
+    The list only holds the most recent jobs, so any job pushed out of it
+    (e.g. by warehouse jobs) is fetched on its own.
+
+    Returns:
+        Mapping of every job ID to its last status payload
+    """
+
+    def fetch() -> dict:
+        response = http.get(f"{base_url}/api/jobs/")
+        assert response.status_code == 200
+        jobs = {job["id"]: job for job in response.json() if job["id"] in job_ids}
+        for job_id in job_ids:
+            if job_id not in jobs:
+                response = http.get(f"{base_url}/api/jobs/{job_id}")
+                assert response.status_code == 200
+                jobs[job_id] = response.json()
+        return jobs
+
+    return _poll(
+        fetch,
+        lambda jobs: all(job["status"] in TERMINAL_STATUSES for job in jobs.values()),
+        timeout,
+    )
+
 
 class TestJobWorkflowIntegration:
     """End-to-end tests for job workflows."""
 
     BASE_URL = "http://localhost:8765"
 
-    def test_scan_job_end_to_end(self, tmp_path):
+    def test_scan_job_end_to_end(self, http, catalog_id, tmp_path):
         """Test complete scan workflow from submission to completion."""
         # Submit scan job
-        catalog_id = str(uuid.uuid4())
-        response = requests.post(
+        response = http.post(
             f"{self.BASE_URL}/api/jobs/submit",
             json={
                 "catalog_id": catalog_id,
@@ -50,29 +133,15 @@ class TestJobWorkflowIntegration:
         assert job_data["status"] in ["PENDING", "PROGRESS"]
 
         # Poll for completion (with shorter timeout since paths may not exist)
-        max_wait = 10  # seconds
-        start_time = time.time()
-        final_status = None
-
-        while time.time() - start_time < max_wait:
-            status_response = requests.get(f"{self.BASE_URL}/api/jobs/{job_id}")
-            assert status_response.status_code == 200
-
-            status_data = status_response.json()
-            final_status = status_data["status"]
-
-            if final_status in ["SUCCESS", "FAILURE"]:
-                break
-
-            time.sleep(0.5)
+        status_data = wait_for_terminal(http, self.BASE_URL, job_id, timeout=10)
+        final_status = status_data["status"]
 
         # Verify job completed (may fail due to invalid paths)
         assert final_status in ["SUCCESS", "FAILURE", "PROGRESS"]
 
-    def test_detect_duplicates_job_workflow(self):
+    def test_detect_duplicates_job_workflow(self, http, catalog_id):
         """Test duplicate detection workflow."""
-        catalog_id = str(uuid.uuid4())
-        response = requests.post(
+        response = http.post(
             f"{self.BASE_URL}/api/jobs/submit",
             json={
                 "catalog_id": catalog_id,
@@ -91,16 +160,12 @@ class TestJobWorkflowIntegration:
         job_id = response.json()["id"]
 
         # Wait for completion
-        time.sleep(2)
-
-        status_response = requests.get(f"{self.BASE_URL}/api/jobs/{job_id}")
-        assert status_response.status_code == 200
-        assert status_response.json()["status"] in ["SUCCESS", "FAILURE", "PROGRESS"]
+        status_data = wait_for_terminal(http, self.BASE_URL, job_id, timeout=2)
+        assert status_data["status"] in ["SUCCESS", "FAILURE", "PROGRESS"]
 
-    def test_generate_thumbnails_workflow(self):
+    def test_generate_thumbnails_workflow(self, http, catalog_id):
         """Test thumbnail generation workflow."""
-        catalog_id = str(uuid.uuid4())
-        response = requests.post(
+        response = http.post(
             f"{self.BASE_URL}/api/jobs/submit",
             json={
                 "catalog_id": catalog_id,
@@ -118,22 +183,16 @@ class TestJobWorkflowIntegration:
         job_id = response.json()["id"]
 
         # Wait for completion
-        time.sleep(2)
+        status_data = wait_for_terminal(http, self.BASE_URL, job_id, timeout=2)
+        assert status_data["status"] in ["SUCCESS", "FAILURE", "PROGRESS"]
 
-        status_response = requests.get(f"{self.BASE_URL}/api/jobs/{job_id}")
-        assert status_response.status_code == 200
-        assert status_response.json()["status"] in ["SUCCESS", "FAILURE", "PROGRESS"]
-
-    def test_concurrent_jobs(self):
+    def test_concurrent_jobs(self, http):
         """Test multiple jobs running concurrently."""
-        job_ids = []
-
-        # Submit multiple jobs
+        payloads = []
         for i in range(3):
             catalog_id = str(uuid.uuid4())
-            response = requests.post(
-                f"{self.BASE_URL}/api/jobs/submit",
-                json={
+            payloads.append(
+                {
                     "catalog_id": catalog_id,
                     "job_type": "scan",
                     "parameters": {
@@ -141,32 +200,37 @@ class TestJobWorkflowIntegration:
                         "source_paths": [f"/app/photos{i}"],
                         "workers": 1,
                     },
-                },
+                }
             )
-            if response.status_code == 200:
-                job_ids.append(response.json()["id"])
+
+        # Submit all jobs at once so the server actually runs them together
+        with ThreadPoolExecutor(max_workers=len(payloads)) as executor:
+            responses = list(
+                executor.map(
+                    lambda payload: http.post(
+                        f"{self.BASE_URL}/api/jobs/submit", json=payload
+                    ),
+                    payloads,
+                )
+            )
+        job_ids = [r.json()["id"] for r in responses if r.status_code == 200]
 
         if not job_ids:
             pytest.skip("No jobs could be submitted")
 
-        # Wait for processing
-        time.sleep(5)
-
-        # Check all jobs
+        # One list request per poll covers every submitted job
+        jobs = wait_for_all_terminal(http, self.BASE_URL, job_ids, timeout=5)
         for job_id in job_ids:
-            response = requests.get(f"{self.BASE_URL}/api/jobs/{job_id}")
-            assert response.status_code == 200
-            assert response.json()["status"] in [
+            assert jobs[job_id]["status"] in [
                 "SUCCESS",
                 "FAILURE",
                 "PROGRESS",
                 "PENDING",
             ]
 
-    def test_job_cancellation(self):
+    def test_job_cancellation(self, http, catalog_id):
         """Test job can be cancelled."""
-        catalog_id = str(uuid.uuid4())
-        response = requests.post(
+        response = http.post(
             f"{self.BASE_URL}/api/jobs/submit",
             json={
                 "catalog_id": catalog_id,
@@ -185,20 +249,20 @@ class TestJobWorkflowIntegration:
         job_id = response.json()["id"]
 
         # Try to cancel
-        cancel_response = requests.delete(f"{self.BASE_URL}/api/jobs/{job_id}")
+        cancel_response = http.delete(f"{self.BASE_URL}/api/jobs/{job_id}")
         assert cancel_response.status_code in [200, 400, 404]
 
         # If cancelled successfully, verify status
         if cancel_response.status_code == 200:
-            status_response = requests.get(f"{self.BASE_URL}/api/jobs/{job_id}")
+            status_response = http.get(f"{self.BASE_URL}/api/jobs/{job_id}")
             if status_response.status_code == 200:
                 status = status_response.json()["status"]
                 assert status in ["FAILURE", "SUCCESS", "PROGRESS"]
 
-    def test_job_error_handling(self):
+    def test_job_error_handling(self, http):
         """Test job failure is handled correctly."""
         # Submit job with invalid catalog ID
-        response = requests.post(
+        response = http.post(
             f"{self.BASE_URL}/api/jobs/submit",
             json={
                 "catalog_id": "invalid-catalog-id",
@@ -219,25 +283,20 @@ class TestJobWorkflowIntegration:
         job_id = response.json()["id"]
 
         # Wait for processing
-        time.sleep(3)
-
-        status_response = requests.get(f"{self.BASE_URL}/api/jobs/{job_id}")
-        assert status_response.status_code == 200
-
-        status_data = status_response.json()
+        status_data = wait_for_terminal(http, self.BASE_URL, job_id, timeout=3)
         # Should fail due to invalid path
         assert status_data["status"] in ["FAILURE", "PROGRESS", "PENDING"]
 
-    def test_list_jobs(self):
+    def test_list_jobs(self, http):
         """Test listing jobs."""
-        response = requests.get(f"{self.BASE_URL}/api/jobs/")
+        response = http.get(f"{self.BASE_URL}/api/jobs/")
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
 
-    def test_invalid_job_type(self):
+    def test_invalid_job_type(self, http):
         """Test submitting invalid job type."""
-        response = requests.post(
+        response = http.post(
             f"{self.BASE_URL}/api/jobs/submit",
             json={
                 "catalog_id": str(uuid.uuid4()),
@@ -254,25 +313,24 @@ class TestServiceHealth:
 
     BASE_URL = "http://localhost:8765"
 
-    def test_api_health(self):
+    def test_api_health(self, http):
         """Test main API health endpoint."""
-        response = requests.get(f"{self.BASE_URL}/health")
+        response = http.get(f"{self.BASE_URL}/health")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
 
-    def test_jobs_health(self):
+    def test_jobs_health(self, http):
         """Test jobs API health endpoint."""
-        response = requests.get(f"{self.BASE_URL}/api/jobs/health")
+        response = http.get(f"{self.BASE_URL}/api/jobs/health")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
         assert data["backend"] == "threading"
 
-    def test_jobs_system_working(self):
+    def test_jobs_system_working(self, http, catalog_id):
         """Test job system is working by submitting and checking a job."""
-        catalog_id = str(uuid.uuid4())
-        response = requests.post(
+        response = http.post(
             f"{self.BASE_URL}/api/jobs/submit",
             json={
                 "catalog_id": catalog_id,
@@ -292,6 +350,6 @@ class TestServiceHealth:
             job_id = response.json()["id"]
 
             # Should be able to query job status
-            status_response = requests.get(f"{self.BASE_URL}/api/jobs/{job_id}")
+            status_response = http.get(f"{self.BASE_URL}/api/jobs/{job_id}")
             assert status_response.status_code == 200
             assert "status" in status_response.json()
@@ -1,9 +1,10 @@
 """Tests for bursts job definition."""
 
 from datetime import datetime, timedelta
-from pathlib import Path
 from typing import Any, Dict, List
 
+import pytest
+
 from lumina.jobs.definitions.bursts import (
     bursts_job,
     detect_catalog_bursts,
@@ -11,6 +12,36 @@ from lumina.jobs.definitions.bursts import (
 )
 from lumina.jobs.framework import REGISTRY
 
+# Shared, read-only image fixtures (detect_catalog_bursts does not mutate them)
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+# Three Canon shots 0.5s apart; "2" has the best quality
+BURST_IMAGES: List[Dict[str, Any]] = [
+    {"id": "1", "timestamp": BASE_TIME, "camera": "Canon", "quality_score": 70},
+    {
+        "id": "2",
+        "timestamp": BASE_TIME + timedelta(seconds=0.5),
+        "camera": "Canon",
+        "quality_score": 95,
+    },
+    {
+        "id": "3",
+        "timestamp": BASE_TIME + timedelta(seconds=1.0),
+        "camera": "Canon",
+        "quality_score": 80,
+    },
+]
+
+# Three Canon shots five minutes apart
+NO_BURST_IMAGES: List[Dict[str, Any]] = [
+    {
+        "id": str(i + 1),
+        "timestamp": BASE_TIME + timedelta(minutes=5 * i),
+        "camera": "Canon",
+    }
+    for i in range(3)
+]
+
 
 def test_bursts_job_registered() -> None:
     """Bursts job should be in global registry."""
@@ -26,116 +57,55 @@ def test_bursts_job_configuration() -> None:
 
 def test_discover_with_provider() -> None:
     """Should use provider function when given."""
-    base_time = datetime(2024, 1, 1, 12, 0, 0)
 
     def provider(catalog_id: str) -> List[Dict[str, Any]]:
-        return [
-            {"id": "1", "timestamp": base_time, "camera": "Canon"},
-            {
-                "id": "2",
-                "timestamp": base_time + timedelta(seconds=0.5),
-                "camera": "Canon",
-            },
-        ]
+        return BURST_IMAGES[:2]
 
     result = discover_images_for_bursts("catalog-123", images_provider=provider)
     assert len(result) == 2
     assert result[0]["id"] == "1"
 
 
-def test_detect_catalog_bursts_finds_burst() -> None:
-    """Should detect images taken in rapid succession."""
-    base_time = datetime(2024, 1, 1, 12, 0, 0)
-
-    images = [
-        {"id": "1", "timestamp": base_time, "camera": "Canon", "quality_score": 70},
-        {
-            "id": "2",
-            "timestamp": base_time + timedelta(seconds=0.5),
-            "camera": "Canon",
-            "quality_score": 95,
-        },
-        {
-            "id": "3",
-            "timestamp": base_time + timedelta(seconds=1.0),
-            "camera": "Canon",
-            "quality_score": 80,
-        },
-        {
-            "id": "4",
-            "timestamp": base_time + timedelta(hours=1),
-            "camera": "Canon",
-            "quality_score": 60,
-        },
-    ]
-
-    result = detect_catalog_bursts(
-        images,
-        "catalog-123",
-        gap_threshold=2.0,
-        min_size=3,
-    )
+# One shot an hour after BURST_IMAGES; never part of a burst
+LATE_IMAGE: Dict[str, Any] = {
+    "id": "4",
+    "timestamp": BASE_TIME + timedelta(hours=1),
+    "camera": "Canon",
+    "quality_score": 60,
+}
 
-    assert result["bursts_detected"] == 1
-    assert result["images_in_bursts"] == 3
-
-
-def test_detect_catalog_bursts_no_bursts() -> None:
-    """Should handle no bursts case."""
-    base_time = datetime(2024, 1, 1, 12, 0, 0)
-
-    images = [
-        {"id": "1", "timestamp": base_time, "camera": "Canon"},
-        {
-            "id": "2",
-            "timestamp": base_time + timedelta(minutes=5),
-            "camera": "Canon",
-        },
-        {
-            "id": "3",
-            "timestamp": base_time + timedelta(minutes=10),
-            "camera": "Canon",
-        },
-    ]
 
-    result = detect_catalog_bursts(
-        images,
-        "catalog-123",
-        gap_threshold=2.0,
-        min_size=3,
-    )
+@pytest.mark.parametrize(
+    "images, kwargs, bursts_detected, images_in_bursts",
+    [
+        (BURST_IMAGES + [LATE_IMAGE], {"gap_threshold": 2.0, "min_size": 3}, 1, 3),
+        (NO_BURST_IMAGES, {"gap_threshold": 2.0, "min_size": 3}, 0, 0),
+        ([], {}, 0, 0),
+    ],
+    ids=["finds_burst", "no_bursts", "empty"],
+)
+def test_detect_catalog_bursts_counts(
+    images: List[Dict[str, Any]],
+    kwargs: Dict[str, Any],
+    bursts_detected: int,
+    images_in_bursts: int,
+) -> None:
+    """Should count bursts and the images in them."""
+    result = detect_catalog_bursts(images, "catalog-123", **kwargs)
 
-    assert result["bursts_detected"] == 0
-    assert result["images_in_bursts"] == 0
+    assert result["bursts_detected"] == bursts_detected
+    assert result["images_in_bursts"] == images_in_bursts
 
 
 def test_detect_catalog_bursts_selects_best() -> None:
     """Should select best image in each burst by quality."""
-    base_time = datetime(2024, 1, 1, 12, 0, 0)
-
-    images = [
-        {"id": "1", "timestamp": base_time, "camera": "Canon", "quality_score": 70},
-        {
-            "id": "2",
-            "timestamp": base_time + timedelta(seconds=0.5),
-            "camera": "Canon",
-            "quality_score": 95,  # Best quality
-        },
-        {
-            "id": "3",
-            "timestamp": base_time + timedelta(seconds=1.0),
-            "camera": "Canon",
-            "quality_score": 80,
-        },
-    ]
-
     bursts_found: List[Dict[str, Any]] = []
 
     def save_bursts(catalog_id: str, bursts: List[Dict[str, Any]]) -> None:
         bursts_found.extend(bursts)
 
     result = detect_catalog_bursts(
-        images,
+        BURST_IMAGES,
         "catalog-123",
         gap_threshold=2.0,
         min_size=3,
@@ -145,11 +115,3 @@ def test_detect_catalog_bursts_selects_best() -> None:
     assert result["bursts_detected"] == 1
     assert len(bursts_found) == 1
     assert bursts_found[0]["best_image_id"] == "2"  # Highest quality
-
-
-def test_detect_catalog_bursts_empty() -> None:
-    """Should handle empty image list."""
-    result = detect_catalog_bursts([], "catalog-123")
-
-    assert result["bursts_detected"] == 0
-    assert result["images_in_bursts"] == 0
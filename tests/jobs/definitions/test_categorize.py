@@ -1,6 +1,8 @@
 """Tests for categorize job definition."""
 
+from contextlib import nullcontext
 from datetime import date, datetime
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -87,17 +89,17 @@ def test_trip_name_location_none_omitted():
 
 
 def make_db_ctx(fetchall_return=None, fetchone_return=None):
-    """Build a mock context manager that yields a mock db session."""
+    """Build a context manager that yields a mock db session.
+
+    Only the session is a MagicMock (tests inspect its execute calls); the
+    result and context manager are plain objects.
+    """
+    rows = fetchall_return or []
     mock_db = MagicMock()
-    execute_result = MagicMock()
-    execute_result.fetchall.return_value = fetchall_return or []
-    execute_result.fetchone.return_value = fetchone_return
-    mock_db.execute.return_value = execute_result
-
-    mock_ctx = MagicMock()
-    mock_ctx.__enter__ = MagicMock(return_value=mock_db)
-    mock_ctx.__exit__ = MagicMock(return_value=False)
-    return mock_ctx, mock_db
+    mock_db.execute.return_value = SimpleNamespace(
+        fetchall=lambda: rows, fetchone=lambda: fetchone_return
+    )
+    return nullcontext(mock_db), mock_db
 
 
 # ─────────────────────────── _categorize_archival ───────────────────────────
@@ -34,22 +34,11 @@ def test_discover_with_provider() -> None:
     assert result == ["img-1", "img-2", "img-3"]
 
 
-def test_compute_image_hashes_success(tmp_path: Path) -> None:
+def test_compute_image_hashes_success(gradient_image_path: Path) -> None:
     """Should compute all hash types for an image."""
-    import numpy as np
-    from PIL import Image
-
-    # Create a test image
-    img_path = tmp_path / "test.png"
-    arr = np.zeros((64, 64, 3), dtype=np.uint8)
-    for i in range(64):
-        for j in range(64):
-            arr[i, j] = [i * 4, j * 4, (i + j) * 2]
-    img = Image.fromarray(arr)
-    img.save(img_path)
 
     def path_provider(catalog_id: str, image_id: str) -> str:
-        return str(img_path)
+        return str(gradient_image_path)
 
     result = compute_image_hashes(
         "img-1",
@@ -0,0 +1,49 @@
+"""Tests for background job executors and waiting on jobs."""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from lumina.jobs import background_jobs
+from lumina.jobs.background_jobs import get_gpu_worker_count, wait_for_job
+
+
+def test_wait_for_job_returns_when_future_completes():
+    """Test a job finished from another thread wakes the waiter."""
+    future: Future = Future()
+    threading.Timer(0.05, future.set_result, (None,)).start()
+
+    with patch.dict("lumina.jobs.background_jobs._active_jobs", {"job-1": future}):
+        assert asyncio.run(wait_for_job("job-1", timeout=5))
+
+
+def test_wait_for_job_times_out_without_touching_job():
+    """Test a timeout returns False and leaves the job's future alone."""
+    future: Future = Future()
+
+    with patch.dict("lumina.jobs.background_jobs._active_jobs", {"job-1": future}):
+        assert not asyncio.run(wait_for_job("job-1", timeout=0.01))
+
+    assert not future.cancelled()
+
+
+def test_wait_for_job_unknown_job():
+    """Test jobs not running in this process are not waited on."""
+    assert asyncio.run(wait_for_job("missing", timeout=5))
+
+
+def test_gpu_worker_count_matches_pool():
+    """Test the GPU pool size is reported without reading pool internals."""
+    torch = SimpleNamespace(cuda=SimpleNamespace(device_count=lambda: 2))
+    with (
+        patch.dict("sys.modules", {"torch": torch}),
+        patch.object(background_jobs, "_gpu_executor", None),
+        patch.object(background_jobs, "_gpu_executor_checked", False),
+        patch.object(background_jobs, "_gpu_worker_count", 0),
+        patch.object(background_jobs.multiprocessing, "get_context"),
+        patch.object(background_jobs, "ProcessPoolExecutor") as pool,
+    ):
+        assert get_gpu_worker_count() == 2
+        assert pool.call_args.kwargs["max_workers"] == 2
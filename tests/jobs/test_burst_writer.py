@@ -0,0 +1,70 @@
+"""Tests for the burst detection job's background writer."""
+
+import queue
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from lumina.analysis.burst_detector import BurstGroup, ImageInfo
+from lumina.jobs.job_implementations import _write_bursts
+
+
+def _burst(prefix: str) -> BurstGroup:
+    base_time = datetime(2024, 1, 1, 12, 0, 0)
+    images = [
+        ImageInfo(f"{prefix}-{i}", base_time + timedelta(seconds=i), "Canon", "R5")
+        for i in range(3)
+    ]
+    return BurstGroup(images=images, best_image_id=f"{prefix}-0")
+
+
+def _run_writer(batches, result=None):
+    """Run the writer over the given batches with a mocked database."""
+    burst_batches: queue.Queue = queue.Queue()
+    for batch in batches:
+        burst_batches.put(batch)
+    burst_batches.put(None)
+    result = {} if result is None else result
+
+    db = MagicMock()
+    with (
+        patch("lumina.jobs.job_implementations.CatalogDatabase") as catalog_db,
+        patch("lumina.db.bulk.copy_rows") as copy_rows,
+    ):
+        catalog_db.return_value.__enter__.return_value = db
+        _write_bursts("cat-1", burst_batches, result)
+
+    return result, db.session, copy_rows
+
+
+def test_writes_batches_in_one_transaction():
+    """Test every batch is written and committed once at the end."""
+    result, session, copy_rows = _run_writer([[_burst("a")], [], [_burst("b")]])
+
+    assert result == {"bursts": 2, "images": 6}
+    assert copy_rows.call_count == 2
+    session.commit.assert_called_once()
+    session.rollback.assert_not_called()
+
+
+def test_abort_rolls_back():
+    """Test an aborted run discards everything written so far."""
+    result, session, _ = _run_writer([[_burst("a")]], {"abort": True})
+
+    assert "bursts" not in result
+    session.rollback.assert_called_once()
+    session.commit.assert_not_called()
+
+
+def test_error_is_reported_and_queue_drained():
+    """Test write failures are captured and remaining batches consumed."""
+    burst_batches: queue.Queue = queue.Queue()
+    for batch in ([_burst("a")], [_burst("b")], None):
+        burst_batches.put(batch)
+    result: dict = {}
+
+    with patch("lumina.jobs.job_implementations.CatalogDatabase") as catalog_db:
+        catalog_db.side_effect = RuntimeError("db down")
+        _write_bursts("cat-1", burst_batches, result)
+
+    assert isinstance(result["error"], RuntimeError)
+    assert burst_batches.empty()
@@ -0,0 +1,218 @@
+"""Tests for the parallel job coordinator's BatchManager."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from lumina.jobs.coordinator import BatchManager, BatchResult
+
+
+def _mock_db():
+    """Build a mock CatalogDatabase whose session returns no rows."""
+    db = MagicMock()
+    db.session.execute.return_value.fetchone.return_value = None
+    return db
+
+
+class TestBatchManagerSessions:
+    """Tests for how BatchManager obtains database sessions."""
+
+    def test_bound_db_reused_across_calls(self) -> None:
+        """Test a bound db serves claim and complete without new connections."""
+        db = _mock_db()
+        manager = BatchManager("cat-1", "job-1", "test", db=db)
+
+        with patch("lumina.jobs.coordinator.CatalogDatabase") as catalog_db:
+            manager.claim_batch("batch-1", "worker-1")
+            manager.complete_batch("batch-1", BatchResult("batch-1", 0))
+
+        catalog_db.assert_not_called()
+        assert db.session.execute.call_count == 2
+
+    def test_explicit_db_overrides_bound_db(self) -> None:
+        """Test a per-call db takes precedence over the bound one."""
+        bound, explicit = _mock_db(), _mock_db()
+        manager = BatchManager("cat-1", "job-1", "test", db=bound)
+
+        manager.fail_batch("batch-1", "boom", db=explicit)
+
+        explicit.session.execute.assert_called_once()
+        bound.session.execute.assert_not_called()
+
+    def test_opens_connection_without_db(self) -> None:
+        """Test a fresh connection is opened when no db is available."""
+        db = _mock_db()
+        manager = BatchManager("cat-1", "job-1", "test")
+
+        with patch("lumina.jobs.coordinator.CatalogDatabase") as catalog_db:
+            catalog_db.return_value.__enter__.return_value = db
+            manager.reset_batch("batch-1")
+
+        catalog_db.assert_called_once_with("cat-1")
+        db.session.execute.assert_called_once()
+
+    def test_bound_db_not_shared_with_other_threads(self) -> None:
+        """Test threads sharing a manager don't use the bound session."""
+        bound, own = _mock_db(), _mock_db()
+        manager = BatchManager("cat-1", "job-1", "test", db=bound)
+
+        with patch("lumina.jobs.coordinator.CatalogDatabase") as catalog_db:
+            catalog_db.return_value.__enter__.return_value = own
+            worker = threading.Thread(
+                target=manager.fail_batch, args=("batch-1", "boom")
+            )
+            worker.start()
+            worker.join()
+            manager.fail_batch("batch-2", "boom")
+
+        catalog_db.assert_called_once_with("cat-1")
+        own.session.execute.assert_called_once()
+        bound.session.execute.assert_called_once()
+
+
+class TestBatchManagerLocalCache:
+    """Tests for serving claimed work items from the local cache."""
+
+    def test_claim_uses_cached_items(self) -> None:
+        """Test batches created in-process skip the work_items round-trip."""
+        db = _mock_db()
+        manager = BatchManager("cat-1", "job-1", "test", db=db)
+        with patch("lumina.jobs.coordinator.copy_rows"):
+            [batch_id] = manager.create_batches(["a", "b"], batch_size=10)
+        db.session.execute.return_value.fetchone.return_value = (batch_id, 0, 1, 2)
+
+        batch = manager.claim_batch(batch_id, "worker-1")
+
+        assert batch is not None
+        assert batch["work_items"] == ["a", "b"]
+        assert batch["items_count"] == 2
+        claim_sql = str(db.session.execute.call_args.args[0])
+        assert "work_items" not in claim_sql.split("RETURNING")[1]
+        assert batch_id not in manager._local_cache
+
+    def test_claim_of_taken_batch_drops_cached_items(self) -> None:
+        """Test a batch claimed elsewhere no longer holds its cached items."""
+        db = _mock_db()
+        manager = BatchManager("cat-1", "job-1", "test", db=db)
+        with patch("lumina.jobs.coordinator.copy_rows"):
+            [batch_id] = manager.create_batches(["a", "b"], batch_size=10)
+
+        assert manager.claim_batch(batch_id, "worker-1") is None
+        assert manager._local_cache == {}
+
+    def test_cleanup_clears_cached_items(self) -> None:
+        """Test cleanup_batches() forgets items of batches never claimed here."""
+        db = _mock_db()
+        manager = BatchManager("cat-1", "job-1", "test", db=db)
+        with patch("lumina.jobs.coordinator.copy_rows"):
+            manager.create_batches(list(range(25)), batch_size=10)
+
+        manager.cleanup_batches()
+
+        assert manager._local_cache == {}
+
+    def test_create_batches_stores_compact_json(self) -> None:
+        """Test work items are serialized without padding whitespace."""
+        db = _mock_db()
+        manager = BatchManager("cat-1", "job-1", "test", db=db)
+
+        with patch("lumina.jobs.coordinator.copy_rows") as copy_rows:
+            manager.create_batches(["a", "b"], batch_size=10)
+
+        _, table, columns, rows = copy_rows.call_args.args
+        assert table == "job_batches"
+        assert dict(zip(columns, rows[0]))["work_items"] == '["a","b"]'
+
+    def test_claim_falls_back_to_database(self) -> None:
+        """Test unknown batches decode work_items from the claim row."""
+        db = _mock_db()
+        db.session.execute.return_value.fetchone.return_value = (
+            "batch-1",
+            0,
+            1,
+            1,
+            '["x"]',
+        )
+        manager = BatchManager("cat-1", "job-1", "test", db=db)
+
+        batch = manager.claim_batch("batch-1", "worker-1")
+
+        assert batch is not None
+        assert batch["work_items"] == ["x"]
+
+    def test_create_batches_copies_all_rows_once(self) -> None:
+        """Test every batch row goes through a single COPY and commit."""
+        db = _mock_db()
+        manager = BatchManager("cat-1", "job-1", "test", db=db)
+
+        with patch("lumina.jobs.coordinator.copy_rows") as copy_rows:
+            batch_ids = manager.create_batches(list(range(25)), batch_size=10)
+
+        copy_rows.assert_called_once()
+        rows = copy_rows.call_args.args[3]
+        assert [row[0] for row in rows] == batch_ids
+        assert [row[7] for row in rows] == [10, 10, 5]
+        db.session.execute.assert_not_called()
+        db.session.commit.assert_called_once()
+
+
+class TestBatchManagerCancellation:
+    """Tests for BatchManager.is_cancelled."""
+
+    def test_stop_flag_short_circuits_database(self) -> None:
+        """Test an in-process stop request is seen without a query."""
+        db = _mock_db()
+        manager = BatchManager("cat-1", "job-1", "test", db=db)
+
+        with patch("lumina.jobs.coordinator.should_stop_job", return_value=True):
+            assert manager.is_cancelled("batch-1")
+
+        db.session.execute.assert_not_called()
+
+    def test_parent_status_polled_at_most_once_per_interval(self) -> None:
+        """Test repeated parent-job checks reuse the last database read."""
+        db = _mock_db()
+        manager = BatchManager("cat-1", "job-1", "test", db=db)
+
+        assert not manager.is_cancelled()
+        assert not manager.is_cancelled()
+
+        db.session.execute.assert_called_once()
+
+    def test_cancellation_is_remembered(self) -> None:
+        """Test a cancelled parent job is not queried again."""
+        db = _mock_db()
+        db.session.execute.return_value.fetchone.return_value = ("CANCELLED",)
+        manager = BatchManager("cat-1", "job-1", "test", db=db)
+
+        assert manager.is_cancelled()
+        assert manager.is_cancelled("batch-1")
+
+        db.session.execute.assert_called_once()
+
+
+class TestBatchManagerProgress:
+    """Tests for BatchManager.get_progress caching."""
+
+    def test_progress_reused_within_max_age(self) -> None:
+        """Test back-to-back progress reads share one aggregate query."""
+        db = _mock_db()
+        row = (2, 1, 1, 0, 0, 10, 5, 5, 0)
+        db.session.execute.return_value.fetchone.return_value = row
+        manager = BatchManager("cat-1", "job-1", "test", db=db)
+
+        first = manager.get_progress()
+        second = manager.get_progress()
+
+        assert second is first
+        db.session.execute.assert_called_once()
+
+    def test_zero_max_age_rereads(self) -> None:
+        """Test max_age=0 always queries the database."""
+        db = _mock_db()
+        db.session.execute.return_value.fetchone.return_value = (1,) + (0,) * 8
+        manager = BatchManager("cat-1", "job-1", "test", db=db)
+
+        manager.get_progress()
+        manager.get_progress(max_age=0)
+
+        assert db.session.execute.call_count == 2
@@ -83,3 +83,19 @@ def test_executor_empty_items():
 
     assert result["total_items"] == 0
     assert result["success_count"] == 0
+
+
+def test_executor_skips_results_without_finalize():
+    """Executor should not retain per-item results when nothing consumes them."""
+    job = ParallelJob(
+        name="no_finalize",
+        discover=lambda catalog_id: ["a", "b"],
+        process=lambda item, **kwargs: {"item": item},
+    )
+
+    batch_result = JobExecutor(job)._process_batch(
+        ["a", "b"], "cat-1", {}, keep_results=False
+    )
+
+    assert batch_result["results"] == []
+    assert batch_result["success_count"] == 2
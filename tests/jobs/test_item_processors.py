@@ -0,0 +1,28 @@
+"""Tests for the generic job item processors."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from lumina.jobs.item_processors import process_auto_tag_item
+
+
+def test_auto_tag_looks_up_existing_tag(tmp_path):
+    """Test a conflicting tag insert falls back to a plain SELECT."""
+    image = tmp_path / "a.jpg"
+    image.write_bytes(b"")
+    db = MagicMock()
+    db.session.execute.return_value.fetchone.return_value = (str(image),)
+    db.session.execute.return_value.scalar.side_effect = [None, 42]
+    tagger = MagicMock()
+    tagger.tag_image.return_value = [
+        SimpleNamespace(tag_name="dog", confidence=0.9, category=None)
+    ]
+
+    result = process_auto_tag_item("cat-1", "img-1", db=db, tagger=tagger)
+
+    assert result["tags_applied"] == 1
+    statements = [str(c.args[0]) for c in db.session.execute.call_args_list]
+    assert "DO NOTHING" in statements[1]
+    assert statements[2].startswith("SELECT id FROM tags")
+    assert db.session.execute.call_args.args[1]["tag_id"] == 42
+    assert all("DO UPDATE SET catalog_id" not in sql for sql in statements)
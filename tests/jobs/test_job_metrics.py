@@ -339,3 +339,17 @@ class TestGPUFunctions:
             with patch("lumina.jobs.job_metrics.get_gpu_info") as mock_info:
                 mock_info.return_value = None
                 assert mock_info() is None
+
+    def test_check_gpu_available_cached(self):
+        """Test the GPU probe runs once per process."""
+        from lumina.jobs.job_metrics import check_gpu_available
+
+        check_gpu_available.cache_clear()
+        try:
+            with patch.dict("sys.modules", {"torch": None}):
+                assert check_gpu_available() is False
+            # A second call must not re-import torch
+            with patch.dict("sys.modules", {"torch": object()}):
+                assert check_gpu_available() is False
+        finally:
+            check_gpu_available.cache_clear()
@@ -0,0 +1,165 @@
+"""Tests for in-memory progress tracking."""
+
+import time
+
+import pytest
+
+from lumina.jobs import memory_progress
+from lumina.jobs.memory_progress import (
+    ProgressEntry,
+    ProgressManager,
+    cleanup_old_in_memory,
+    get_in_memory_stats,
+    get_last_progress,
+    get_recent_jobs_in_memory,
+    track_job_in_memory,
+    update_progress,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_storage():
+    """Reset the module-level progress storage around each test."""
+    for shard in memory_progress._shards:
+        shard.clear()
+    yield
+    for shard in memory_progress._shards:
+        shard.clear()
+
+
+def _entry(job_id: str) -> ProgressEntry:
+    return memory_progress._shard_of(job_id)[job_id]
+
+
+class TestProgressEntry:
+    """Tests for the ProgressEntry dataclass."""
+
+    def test_slots(self) -> None:
+        """Test entries do not carry a per-instance __dict__."""
+        entry = ProgressEntry(job_id="job-1")
+        assert not hasattr(entry, "__dict__")
+
+    def test_as_dict_merges_extra(self) -> None:
+        """Test extra metadata is merged into the progress block."""
+        entry = ProgressEntry(job_id="job-1", current=1, total=2, extra={"phase": "x"})
+        data = entry.as_dict()
+        assert data["progress"]["current"] == 1
+        assert data["progress"]["phase"] == "x"
+
+
+class TestMemoryProgress:
+    """Tests for module-level progress functions."""
+
+    def test_update_and_get_progress(self) -> None:
+        """Test progress round-trips through memory storage."""
+        assert update_progress("job-1", "PROGRESS", 25, 100, "Working")
+
+        progress = get_last_progress("job-1")
+        assert progress is not None
+        assert progress["status"] == "PROGRESS"
+        assert progress["progress"]["percent"] == 25
+        assert progress["progress"]["message"] == "Working"
+
+    def test_get_progress_is_read_only_snapshot(self) -> None:
+        """Test progress reads share one immutable view until the next update."""
+        update_progress("job-1", "PROGRESS", 1, 10)
+
+        first = get_last_progress("job-1")
+        assert first is get_last_progress("job-1")
+        with pytest.raises(TypeError):
+            first["status"] = "SUCCESS"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            first["progress"]["current"] = 5  # type: ignore[index]
+
+        update_progress("job-1", "PROGRESS", 2, 10)
+        second = get_last_progress("job-1")
+        assert second is not first
+        assert second["progress"]["current"] == 2
+        assert first["progress"]["current"] == 1
+
+    def test_update_rejects_non_integer_counts(self) -> None:
+        """Test invalid counts are rejected without storing anything."""
+        assert not update_progress("job-1", "PROGRESS", "1", 10)  # type: ignore[arg-type]
+        assert get_last_progress("job-1") is None
+
+    def test_get_progress_missing_job(self) -> None:
+        """Test unknown jobs return None."""
+        assert get_last_progress("missing") is None
+
+    def test_update_preserves_tracked_job(self) -> None:
+        """Test progress updates keep the tracked job metadata."""
+        track_job_in_memory("job-1", "scan", {"path": "/photos"}, "cat-1")
+        update_progress("job-1", "PROGRESS", 1, 4)
+
+        progress = get_last_progress("job-1")
+        assert progress is not None
+        assert progress["type"] == "scan"
+        assert progress["catalog_id"] == "cat-1"
+        assert progress["progress"]["percent"] == 25
+
+    def test_recent_jobs_newest_first(self) -> None:
+        """Test recent jobs are ordered by creation time."""
+        track_job_in_memory("old", "scan", {})
+        track_job_in_memory("new", "scan", {})
+        _entry("old").created_ts -= 10
+
+        jobs = get_recent_jobs_in_memory(limit=1)
+        assert [job["job_id"] for job in jobs] == ["new"]
+
+    def test_cleanup_old_jobs(self) -> None:
+        """Test cleanup removes only expired jobs."""
+        track_job_in_memory("old", "scan", {})
+        track_job_in_memory("new", "scan", {})
+        _entry("old").created_ts = time.time() - 7200
+
+        assert cleanup_old_in_memory(max_age_hours=1) == 1
+        assert get_last_progress("old") is None
+        assert get_last_progress("new") is not None
+
+    def test_cleanup_nothing_expired(self) -> None:
+        """Test cleanup leaves fresh jobs untouched."""
+        track_job_in_memory("new", "scan", {})
+
+        assert cleanup_old_in_memory(max_age_hours=1) == 0
+        assert get_last_progress("new") is not None
+
+    def test_in_memory_stats(self) -> None:
+        """Test stats count tracked jobs by type."""
+        track_job_in_memory("a", "scan", {})
+        track_job_in_memory("b", "scan", {})
+        track_job_in_memory("c", "hash", {})
+
+        assert get_in_memory_stats() == {"scan": 2, "hash": 1}
+
+    def test_entries_survive_concurrent_tracking(self) -> None:
+        """Test iterating entries is not broken by jobs tracked meanwhile."""
+        track_job_in_memory("a", "scan", {})
+        entries = memory_progress._iter_entries()
+        next(entries)
+
+        for i in range(100):
+            track_job_in_memory(f"job-{i}", "scan", {})
+
+        list(entries)  # Must not raise "dictionary changed size"
+
+
+class TestProgressManager:
+    """Tests for ProgressManager backend dispatch."""
+
+    def test_in_memory_backend(self) -> None:
+        """Test in-memory mode binds the module-level functions."""
+        manager = ProgressManager(use_in_memory=True)
+        assert manager.update_progress is update_progress
+
+        manager.track_job("job-1", "scan", {})
+        assert manager.update_progress("job-1", "PROGRESS", 5, 10)
+        progress = manager.get_last_progress("job-1")
+        assert progress is not None
+        assert progress["progress"]["percent"] == 50
+        assert manager.get_in_memory_stats() == {"scan": 1}
+
+    def test_database_backend(self) -> None:
+        """Test database mode binds the database adapters."""
+        manager = ProgressManager(use_in_memory=False)
+        assert manager.update_progress is memory_progress._db_update_progress
+        assert manager.track_job is memory_progress._db_track_job
@@ -0,0 +1,385 @@
+"""Tests for publishing and coalescing job progress writes."""
+
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from lumina.jobs.progress_publisher import (
+    AsyncProgressListener,
+    AsyncProgressSubscriber,
+    ProgressAggregator,
+    ProgressBuffer,
+    ProgressSubscriber,
+    ProgressThrottle,
+    cleanup_old_progress,
+    get_last_progress,
+    publish_completion,
+    publish_progress,
+    publish_progress_batch,
+)
+
+
+def test_publish_progress_is_one_statement():
+    """Test the upsert and notify share one execute with a bound channel."""
+    with patch("lumina.jobs.progress_publisher.SessionLocal") as session_local:
+        assert publish_progress("job'1", "PROGRESS", 1, 4, "working")
+
+    session = session_local.return_value
+    session.execute.assert_called_once()
+    sql, params = session.execute.call_args.args
+    assert "pg_notify(" in str(sql)
+    assert params["channel"] == "job_progress"
+    assert json.loads(params["payload"])["job_id"] == "job'1"
+    assert json.loads(params["payload"])["progress"]["percent"] == 25
+    session.commit.assert_called_once()
+
+
+def test_progress_batch_copies_latest_per_job():
+    """Test a burst is staged with one COPY and merged in one transaction."""
+    with (
+        patch("lumina.jobs.progress_publisher.SessionLocal") as session_local,
+        patch("lumina.jobs.progress_publisher.copy_rows") as copy_rows,
+    ):
+        assert publish_progress_batch(
+            [
+                {"job_id": "a", "state": "PROGRESS", "current": 1, "total": 4},
+                {"job_id": "b", "state": "PROGRESS", "current": 1, "total": 2},
+                {"job_id": "a", "state": "PROGRESS", "current": 2, "total": 4},
+            ]
+        )
+
+    _, table, _, rows = copy_rows.call_args.args
+    assert table == "job_progress_stage"
+    rows = dict(rows)
+    assert json.loads(rows["a"])["progress"]["current"] == 2
+    assert set(rows) == {"a", "b"}
+    session = session_local.return_value
+    assert session.execute.call_count == 2
+    session.commit.assert_called_once()
+
+
+def test_progress_buffer_flushes_when_full():
+    """Test the buffer writes once max_entries updates are queued."""
+    with patch("lumina.jobs.progress_publisher.publish_progress_batch") as batch:
+        with ProgressBuffer(max_entries=3, max_age=60) as buffer:
+            for i in range(4):
+                buffer.add("job-1", "PROGRESS", i, 10)
+            assert batch.call_count == 1
+
+    assert [len(c.args[0]) for c in batch.call_args_list] == [3, 1]
+
+
+def test_last_progress_returns_decoded_jsonb():
+    """Test the JSONB column value is returned without re-parsing."""
+    stored = {"job_id": "job-1", "status": "PROGRESS"}
+    with patch("lumina.jobs.progress_publisher.SessionLocal") as session_local:
+        session_local.return_value.execute.return_value.scalar.return_value = stored
+
+        assert get_last_progress("job-1") is stored
+
+
+def test_cleanup_deletes_in_committed_batches():
+    """Test cleanup repeats full batches and stops after a short one."""
+    with (
+        patch("lumina.jobs.progress_publisher.SessionLocal") as session_local,
+        patch("lumina.jobs.progress_publisher.CLEANUP_BATCH_SIZE", 10),
+    ):
+        session = session_local.return_value
+        session.execute.side_effect = [
+            SimpleNamespace(rowcount=10),
+            SimpleNamespace(rowcount=10),
+            SimpleNamespace(rowcount=3),
+        ]
+
+        assert cleanup_old_progress(max_age_hours=1) == 23
+
+    assert session.commit.call_count == 3
+
+
+def test_publish_completion_reports_failure():
+    """Test a database error is swallowed and reported as False."""
+    with patch("lumina.jobs.progress_publisher.SessionLocal") as session_local:
+        session_local.return_value.execute.side_effect = RuntimeError("db down")
+
+        assert not publish_completion("job-1", "SUCCESS", {"ok": True})
+
+    session_local.return_value.close.assert_called_once()
+
+
+def test_throttle_skips_small_quick_updates():
+    """Test updates within one percent and the interval are skipped."""
+    throttle = ProgressThrottle(min_interval=60)
+
+    assert throttle.check("job-1", "PROGRESS", 10, 100) == 10
+    assert throttle.check("job-1", "PROGRESS", 10, 100) is None
+    assert throttle.check("job-1", "PROGRESS", 11, 100) == 11
+    assert throttle.check("job-2", "PROGRESS", 11, 100) == 11
+
+
+def test_throttle_percent_follows_total_changes():
+    """Test the percentage tracks a job's total when it changes."""
+    throttle = ProgressThrottle(min_interval=0)
+
+    assert throttle.check("job-1", "PROGRESS", 29, 100) == 29
+    assert throttle.check("job-1", "PROGRESS", 29, 58) == 50
+    assert throttle.check("job-1", "PROGRESS", 5, 0) == 0
+
+
+def test_throttle_finished_progress_reads_100():
+    """Test current == total always reports 100 and bypasses the throttle."""
+    throttle = ProgressThrottle(min_interval=60, min_step=50)
+
+    for total in range(1, 2000):
+        throttle.check("job-1", "PROGRESS", 0, total)
+        assert throttle.check("job-1", "PROGRESS", total, total) == 100
+
+
+def test_throttle_passes_state_changes_and_terminal_states():
+    """Test state transitions and final states are never skipped."""
+    throttle = ProgressThrottle(min_interval=60)
+    throttle.check("job-1", "PENDING", 0, 0)
+
+    assert throttle.check("job-1", "PROGRESS", 0, 0) == 0
+    assert throttle.check("job-1", "SUCCESS", 4, 4) == 100
+    assert throttle.check("job-1", "SUCCESS", 4, 4) == 100
+
+
+def test_throttle_passes_after_interval():
+    """Test an unchanged update is written once the interval elapses."""
+    throttle = ProgressThrottle(min_interval=0.01)
+    throttle.check("job-1", "PROGRESS", 5, 100)
+    time.sleep(0.02)
+
+    assert throttle.check("job-1", "PROGRESS", 5, 100) == 5
+
+
+def test_throttle_writes_last_skipped_update_after_interval():
+    """Test the latest skipped update is flushed once the job goes quiet."""
+    throttle = ProgressThrottle(min_interval=0.05)
+    write = MagicMock()
+    throttle.check("job-1", "PROGRESS", 5, 100)
+
+    assert throttle.check("job-1", "PROGRESS", 5, 100, write) is None
+    assert throttle.check("job-1", "PROGRESS", 5, 100, write) is None
+    time.sleep(0.2)
+
+    write.assert_called_once_with(5)
+
+
+def test_throttle_drops_skipped_update_superseded_or_forgotten():
+    """Test a skipped update is not flushed after a newer write or forget()."""
+    throttle = ProgressThrottle(min_interval=0.05)
+    write = MagicMock()
+    throttle.check("job-1", "PROGRESS", 5, 100)
+    throttle.check("job-1", "PROGRESS", 5, 100, write)
+    throttle.check("job-1", "PROGRESS", 50, 100)
+    throttle.check("job-2", "PROGRESS", 5, 100)
+    throttle.check("job-2", "PROGRESS", 5, 100, write)
+    throttle.forget("job-2")
+    time.sleep(0.2)
+
+    write.assert_not_called()
+
+
+def test_throttle_flush_write_does_not_block_other_jobs():
+    """Test a slow flushed write holds up only newer updates of its job."""
+    throttle = ProgressThrottle(min_interval=0.05)
+    started = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def slow_write(percent):
+        started.set()
+        release.wait(2)
+        order.append(("flush", percent))
+
+    throttle.check("job-1", "PROGRESS", 5, 100)
+    throttle.check("job-1", "PROGRESS", 5, 100, slow_write)
+    assert started.wait(2)
+
+    assert throttle.check("job-2", "PROGRESS", 5, 100) == 5
+
+    newer = threading.Thread(
+        target=lambda: order.append(
+            ("check", throttle.check("job-1", "PROGRESS", 50, 100))
+        )
+    )
+    newer.start()
+    newer.join(0.1)
+    assert newer.is_alive()
+
+    release.set()
+    newer.join(2)
+    assert order == [("flush", 5), ("check", 50)]
+
+
+def test_first_update_published_immediately():
+    """Test the first update is written without waiting for the interval."""
+    published = []
+    aggregator = ProgressAggregator(published.append, interval=60)
+
+    aggregator.submit({"current": 1, "total": 10})
+
+    assert published == [{"current": 1, "total": 10}]
+    aggregator.close()
+
+
+def test_updates_within_interval_are_coalesced():
+    """Test rapid updates collapse into the latest one on close."""
+    published = []
+    with ProgressAggregator(published.append, interval=60) as aggregator:
+        for i in range(1, 6):
+            aggregator.submit({"current": i, "total": 10})
+
+    assert [p["current"] for p in published] == [1, 5]
+
+
+def test_pending_update_flushed_by_timer():
+    """Test a delayed update is written once the interval elapses."""
+    published = []
+    aggregator = ProgressAggregator(published.append, interval=0.05)
+    aggregator.submit({"current": 1, "total": 10})
+    aggregator.submit({"current": 2, "total": 10})
+
+    deadline = time.monotonic() + 2
+    while len(published) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert [p["current"] for p in published] == [1, 2]
+    aggregator.close()
+    assert len(published) == 2
+
+
+def test_completed_update_not_delayed():
+    """Test an update reaching its total is written right away."""
+    published = []
+    aggregator = ProgressAggregator(published.append, interval=60)
+    aggregator.submit({"current": 1, "total": 2})
+    aggregator.submit({"current": 2, "total": 2})
+
+    assert [p["current"] for p in published] == [1, 2]
+    aggregator.close()
+
+
+def test_completed_update_skips_pending_timer():
+    """Test completion is written immediately even with a timer pending."""
+    published = []
+    aggregator = ProgressAggregator(published.append, interval=60)
+    aggregator.submit({"current": 1, "total": 3})
+    aggregator.submit({"current": 2, "total": 3})
+    aggregator.submit({"current": 3, "total": 3})
+
+    assert [p["current"] for p in published] == [1, 3]
+    aggregator.close()
+    assert len(published) == 2
+
+
+def test_subscriber_listens_on_shared_channel():
+    """Test every subscriber LISTENs on the one shared progress channel."""
+    with patch("lumina.jobs.progress_publisher.SessionLocal") as session_local:
+        with ProgressSubscriber("3f2a-B9"):
+            pass
+
+    connection = session_local.return_value.connection.return_value
+    statements = [str(c.args[0]) for c in connection.execute.call_args_list]
+    assert statements == ["LISTEN job_progress", "UNLISTEN job_progress"]
+
+
+def _notify(job_id: str, n: int) -> SimpleNamespace:
+    return SimpleNamespace(payload=json.dumps({"job_id": job_id, "n": n}))
+
+
+def test_subscriber_filters_other_jobs():
+    """Test notifications for other jobs are skipped."""
+    with (
+        patch("lumina.jobs.progress_publisher.SessionLocal") as session_local,
+        patch("lumina.jobs.progress_publisher.select.select") as select_,
+    ):
+        connection = session_local.return_value.connection.return_value
+        dbapi_conn = connection.connection.driver_connection
+        dbapi_conn.notifies = [_notify("other", 1), _notify("job-1", 2)]
+        select_.return_value = ([dbapi_conn], [], [])
+        with ProgressSubscriber("job-1", timeout=0) as subscriber:
+            assert subscriber.get_message() == {"job_id": "job-1", "n": 2}
+            assert subscriber.get_message() is None
+
+    assert session_local.return_value.connection.call_args.kwargs == {
+        "execution_options": {"isolation_level": "AUTOCOMMIT"}
+    }
+
+
+def test_subscriber_drains_all_messages_per_wake():
+    """Test one wait returns every queued message for the job."""
+    with (
+        patch("lumina.jobs.progress_publisher.SessionLocal") as session_local,
+        patch("lumina.jobs.progress_publisher.select.select") as select_,
+    ):
+        connection = session_local.return_value.connection.return_value
+        dbapi_conn = connection.connection.driver_connection
+        dbapi_conn.notifies = [_notify("job-1", 1), _notify("job-1", 2)]
+        select_.return_value = ([dbapi_conn], [], [])
+        with ProgressSubscriber("job-1", timeout=1) as subscriber:
+            assert [m["n"] for m in subscriber.get_messages()] == [1, 2]
+
+    dbapi_conn.poll.assert_called_once()
+
+
+def test_subscriber_reads_truncated_payload_from_table():
+    """Test an oversized notification stub is replaced by the stored row."""
+    stored = {"job_id": "job-1", "status": "PROGRESS", "progress": {"n": 9}}
+    with (
+        patch("lumina.jobs.progress_publisher.SessionLocal") as session_local,
+        patch("lumina.jobs.progress_publisher.select.select") as select_,
+        patch("lumina.jobs.progress_publisher.get_last_progress", return_value=stored),
+    ):
+        connection = session_local.return_value.connection.return_value
+        dbapi_conn = connection.connection.driver_connection
+        dbapi_conn.notifies = [
+            SimpleNamespace(payload=json.dumps({"job_id": "job-1", "truncated": True}))
+        ]
+        select_.return_value = ([dbapi_conn], [], [])
+        with ProgressSubscriber("job-1", timeout=0) as subscriber:
+            assert subscriber.get_message() is stored
+
+
+def test_async_listener_fans_out_by_job():
+    """Test one notification reaches every queue for its job only."""
+
+    async def run():
+        listener = AsyncProgressListener(max_queue=1)
+        first, second = listener.subscribe("job-1"), listener.subscribe("job-1")
+        other = listener.subscribe("job-2")
+
+        for n in (1, 2):
+            listener._on_notify(None, 0, "job_progress", _notify("job-1", n).payload)
+
+        return first.get_nowait(), second.get_nowait(), other.empty()
+
+    first, second, other_empty = asyncio.run(run())
+
+    assert first == second == {"job_id": "job-1", "n": 2}
+    assert other_empty
+
+
+def test_async_subscriber_waits_on_queue():
+    """Test the async subscriber returns queued messages and times out."""
+
+    async def run():
+        listener = AsyncProgressListener()
+        with patch.object(listener, "start"):
+            async with AsyncProgressSubscriber("job-1", listener) as subscriber:
+                listener._on_notify(
+                    None, 0, "job_progress", _notify("job-1", 1).payload
+                )
+                message = await subscriber.get_message(timeout=1)
+                missing = await subscriber.get_message(timeout=0.01)
+        return message, missing, listener._queues
+
+    message, missing, queues = asyncio.run(run())
+
+    assert message == {"job_id": "job-1", "n": 1}
+    assert missing is None
+    assert queues == {}
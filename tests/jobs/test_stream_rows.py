@@ -0,0 +1,30 @@
+"""Tests for streaming job query results on a dedicated connection."""
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from lumina.jobs.job_implementations import _stream_rows
+
+
+def test_streams_all_rows():
+    """Test every row is yielded across small fetch batches."""
+    engine = create_engine("sqlite://")
+    rows = _stream_rows(
+        engine,
+        text("SELECT :a UNION ALL SELECT :b UNION ALL SELECT :c"),
+        {"a": 1, "b": 2, "c": 3},
+        batch_size=1,
+    )
+
+    assert [row[0] for row in rows] == [1, 2, 3]
+
+
+def test_connection_released_when_closed():
+    """Test closing the stream early returns its connection to the pool."""
+    engine = create_engine("sqlite://", poolclass=QueuePool)
+    rows = _stream_rows(engine, text("SELECT 1 UNION ALL SELECT 2"), {})
+
+    next(rows)
+    assert engine.pool.checkedout() == 1
+    rows.close()
+    assert engine.pool.checkedout() == 0
@@ -0,0 +1,176 @@
+"""Tests for storing image tags."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from lumina.jobs.tag_storage import (
+    clear_tag_id_cache,
+    store_image_tags,
+    store_image_tags_bulk,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_tag_id_cache():
+    """Start every test without cached tag IDs."""
+    clear_tag_id_cache()
+    yield
+    clear_tag_id_cache()
+
+
+def _db() -> MagicMock:
+    """Build a mock CatalogDatabase whose require_session() is its session."""
+    db = MagicMock()
+    db.require_session.return_value = db.session
+    return db
+
+
+def _tag(name: str, confidence: float = 0.5) -> SimpleNamespace:
+    return SimpleNamespace(tag_name=name, confidence=confidence, category=None)
+
+
+def test_bulk_store_uses_two_statements():
+    """Test tags for a whole batch are written with two set-based upserts."""
+    db = _db()
+    db.session.execute.side_effect = [iter([(1, "dog"), (2, "cat")]), None]
+
+    stored = store_image_tags_bulk(
+        db,
+        "cat-1",
+        [("img-1", [_tag("dog"), _tag("cat")]), ("img-2", [_tag("dog")])],
+        "openclip",
+    )
+
+    assert stored == {"img-1": 2, "img-2": 1}
+    assert db.session.execute.call_count == 2
+    tag_params = db.session.execute.call_args_list[0].args[1]
+    assert tag_params["names"] == ["dog", "cat"]
+    link_params = db.session.execute.call_args_list[1].args[1]
+    assert link_params["image_ids"] == ["img-1", "img-1", "img-2"]
+    assert link_params["tag_ids"] == [1, 2, 1]
+
+
+def test_bulk_store_collapses_duplicate_links():
+    """Test a repeated (image, tag) pair is sent once with its last values."""
+    db = _db()
+    db.session.execute.side_effect = [iter([(1, "dog")]), None]
+
+    stored = store_image_tags_bulk(
+        db, "cat-1", [("img-1", [_tag("dog", 0.2), _tag("dog", 0.9)])], "openclip"
+    )
+
+    assert stored == {"img-1": 1}
+    link_params = db.session.execute.call_args_list[1].args[1]
+    assert link_params["confidences"] == [0.9]
+
+
+def test_single_image_store_delegates_to_bulk():
+    """Test store_image_tags() uses the same two statements."""
+    db = _db()
+    db.session.execute.side_effect = [iter([(1, "dog"), (2, "cat")]), None]
+
+    assert store_image_tags(db, "cat-1", "img-1", [_tag("dog"), _tag("cat")], "x") == 2
+    assert db.session.execute.call_count == 2
+
+
+def test_known_tags_skip_the_tags_table():
+    """Test a second batch with seen tag names only writes the links."""
+    db = _db()
+    db.session.execute.side_effect = [iter([(1, "dog")]), None, None]
+    store_image_tags_bulk(db, "cat-1", [("img-1", [_tag("dog")])], "openclip")
+
+    assert store_image_tags_bulk(db, "cat-1", [("img-2", [_tag("dog")])], "x") == {
+        "img-2": 1
+    }
+    assert db.session.execute.call_count == 3
+    assert db.session.execute.call_args.args[1]["tag_ids"] == [1]
+
+
+def test_existing_tags_are_selected():
+    """Test names the insert skipped are looked up by a follow-up select."""
+    db = _db()
+    db.session.execute.side_effect = [iter([(2, "cat")]), iter([(1, "dog")]), None]
+
+    stored = store_image_tags_bulk(
+        db, "cat-1", [("img-1", [_tag("dog"), _tag("cat")])], "openclip"
+    )
+
+    assert stored == {"img-1": 2}
+    assert db.session.execute.call_args_list[1].args[1]["names"] == ["dog"]
+    assert db.session.execute.call_args.args[1]["tag_ids"] == [1, 2]
+
+
+def test_stale_cached_id_is_retried_uncached():
+    """Test a failed write with cached IDs re-resolves the names once."""
+    db = _db()
+    db.session.execute.side_effect = [iter([(1, "dog")]), None]
+    store_image_tags_bulk(db, "cat-1", [("img-1", [_tag("dog")])], "x")
+    db.session.execute.side_effect = [RuntimeError("fk"), iter([(7, "dog")]), None]
+
+    assert store_image_tags_bulk(db, "cat-1", [("img-2", [_tag("dog")])], "x") == {
+        "img-2": 1
+    }
+    assert db.session.execute.call_args.args[1]["tag_ids"] == [7]
+
+
+def test_failed_batch_falls_back_to_per_tag_savepoints():
+    """Test a bad row only loses itself when the batch write fails."""
+    db = _db()
+    db.session.execute.side_effect = [
+        iter([(1, "dog"), (2, "cat")]),
+        RuntimeError("bad row"),  # whole batch
+        None,  # dog alone
+        RuntimeError("bad row"),  # cat alone, cached ID
+        iter([(2, "cat")]),
+        RuntimeError("bad row"),  # cat alone, re-resolved
+    ]
+
+    stored = store_image_tags_bulk(
+        db, "cat-1", [("img-1", [_tag("dog"), _tag("cat")])], "openclip"
+    )
+
+    assert stored == {"img-1": 1}
+    assert db.session.begin_nested.call_count == 4
+    db.session.rollback.assert_not_called()
+
+
+def test_failed_batch_reports_only_images_with_stored_tags():
+    """Test an image whose every tag failed is left out of the result."""
+    db = _db()
+    db.session.execute.side_effect = [
+        iter([(1, "dog"), (2, "cat")]),
+        RuntimeError("bad row"),  # whole batch
+        None,  # img-1 dog
+        RuntimeError("bad row"),  # img-2 cat, cached ID
+        iter([(2, "cat")]),
+        RuntimeError("bad row"),  # img-2 cat, re-resolved
+    ]
+
+    stored = store_image_tags_bulk(
+        db,
+        "cat-1",
+        [("img-1", [_tag("dog")]), ("img-2", [_tag("cat")])],
+        "openclip",
+    )
+
+    assert stored == {"img-1": 1}
+
+
+def test_bulk_store_skips_empty_batches():
+    """Test nothing is executed when no image has tags."""
+    db = _db()
+
+    assert store_image_tags_bulk(db, "cat-1", [("img-1", [])], "openclip") == {}
+    db.session.execute.assert_not_called()
+
+
+def test_bulk_store_rolls_back_to_savepoint_on_error():
+    """Test a failed write only unwinds its savepoint and reports nothing stored."""
+    db = _db()
+    db.session.execute.side_effect = RuntimeError("db down")
+
+    assert store_image_tags_bulk(db, "cat-1", [("img-1", [_tag("dog")])], "x") == {}
+    db.session.begin_nested.assert_called_once()
+    db.session.rollback.assert_not_called()
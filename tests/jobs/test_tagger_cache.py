@@ -0,0 +1,108 @@
+"""Tests for auto-tag tagger reuse and batch dispatch."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from lumina.jobs import job_implementations
+from lumina.jobs.job_implementations import (
+    _cleanup_cached_taggers,
+    _get_or_create_tagger,
+    _iter_tag_batches,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Give each test an empty per-thread cache and patched tagger classes."""
+    job_implementations._tagger_local = threading.local()
+    job_implementations._cached_taggers.clear()
+    with (
+        patch("lumina.analysis.image_tagger.ImageTagger") as image_tagger,
+        patch("lumina.analysis.image_tagger.CombinedTagger") as combined_tagger,
+    ):
+        image_tagger.side_effect = lambda **kwargs: object()
+        combined_tagger.side_effect = lambda **kwargs: object()
+        yield image_tagger, combined_tagger
+    job_implementations._cached_taggers.clear()
+
+
+def test_reused_within_thread(fresh_cache):
+    """Test the same configuration returns the same tagger."""
+    image_tagger, _ = fresh_cache
+
+    first = _get_or_create_tagger("openclip", None, "cpu")
+    second = _get_or_create_tagger("openclip", None, "cpu")
+
+    assert first is second
+    image_tagger.assert_called_once()
+
+
+def test_configuration_is_part_of_key():
+    """Test a different model gets its own tagger."""
+    assert _get_or_create_tagger("openclip", "ViT-B-32", "cpu") is not (
+        _get_or_create_tagger("openclip", "ViT-L-14", "cpu")
+    )
+
+
+def test_not_shared_between_threads():
+    """Test each thread builds its own tagger."""
+    main = _get_or_create_tagger("openclip", None, "cpu")
+    other = []
+    thread = threading.Thread(
+        target=lambda: other.append(_get_or_create_tagger("openclip", None, "cpu"))
+    )
+    thread.start()
+    thread.join()
+
+    assert other[0] is not main
+
+
+def test_cleanup_releases_every_tagger(fresh_cache):
+    """Test exit cleanup calls cleanup() on each cached tagger."""
+    _, combined_tagger = fresh_cache
+    combined_tagger.side_effect = None
+    tagger = _get_or_create_tagger("combined", None, "cpu")
+
+    _cleanup_cached_taggers()
+
+    tagger.cleanup.assert_called_once()
+    assert job_implementations._cached_taggers == []
+
+
+def test_iter_tag_batches_in_thread():
+    """Test rows are split into batches with running offsets."""
+    rows = iter([(str(i), f"/p/{i}.jpg") for i in range(5)])
+
+    batches = list(_iter_tag_batches(rows, 10, 2))
+
+    assert [(start, len(batch), fut) for start, batch, fut in batches] == [
+        (10, 2, None),
+        (12, 2, None),
+        (14, 1, None),
+    ]
+
+
+def test_iter_tag_batches_on_executor_keeps_order():
+    """Test pool-tagged batches are submitted ahead but yielded in order."""
+    rows = iter([(str(i), f"/p/{i}.jpg") for i in range(7)])
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with patch(
+            "lumina.jobs.job_implementations._tag_batch_in_process",
+            side_effect=lambda backend, model, paths, *args: paths,
+        ):
+            batches = [
+                (start, future.result())
+                for start, _, future in _iter_tag_batches(
+                    rows, 0, 3, executor, ("openclip", None, 0.25, 10)
+                )
+            ]
+
+    assert batches == [
+        (0, ["/p/0.jpg", "/p/1.jpg", "/p/2.jpg"]),
+        (3, ["/p/3.jpg", "/p/4.jpg", "/p/5.jpg"]),
+        (6, ["/p/6.jpg"]),
+    ]
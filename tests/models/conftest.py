@@ -0,0 +1,11 @@
+"""Shared fixtures for model tests."""
+
+import uuid
+
+import pytest
+
+
+@pytest.fixture
+def catalog_id() -> uuid.UUID:
+    """Fixed catalog ID; these models never touch the database."""
+    return uuid.UUID(int=1)
@@ -1,79 +1,73 @@
 """Tests for Duplicate SQLModels."""
 
-import uuid
-from datetime import datetime
-
 import pytest
 
 from lumina.models.duplicate import DuplicateGroup, DuplicateMember, SimilarityType
 
 
-class TestSimilarityType:
-    def test_similarity_type_enum(self):
-        assert SimilarityType.EXACT.value == "exact"
-        assert SimilarityType.PERCEPTUAL.value == "perceptual"
-
-    def test_similarity_type_members(self):
-        assert len(SimilarityType) == 2
-        assert SimilarityType.EXACT in SimilarityType
-        assert SimilarityType.PERCEPTUAL in SimilarityType
-
-
 class TestDuplicateGroup:
-    def test_duplicate_group_creation(self):
-        group = DuplicateGroup(
-            catalog_id=uuid.uuid4(),
-            primary_image_id="img-001",
-            similarity_type=SimilarityType.PERCEPTUAL,
-            confidence=95,
-        )
-        assert group.reviewed is False
-        assert group.confidence == 95
-        assert group.similarity_type == SimilarityType.PERCEPTUAL
-
-    def test_duplicate_group_defaults(self):
-        catalog_id = uuid.uuid4()
-        group = DuplicateGroup(
-            catalog_id=catalog_id,
-            primary_image_id="img-primary",
-            similarity_type=SimilarityType.EXACT,
-            confidence=100,
-        )
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            (
+                {
+                    "primary_image_id": "img-001",
+                    "similarity_type": SimilarityType.PERCEPTUAL,
+                    "confidence": 95,
+                },
+                {
+                    "reviewed": False,
+                    "confidence": 95,
+                    "similarity_type": SimilarityType.PERCEPTUAL,
+                },
+            ),
+            (
+                {
+                    "primary_image_id": "img-primary",
+                    "similarity_type": SimilarityType.EXACT,
+                    "confidence": 100,
+                },
+                {
+                    "primary_image_id": "img-primary",
+                    "reviewed": False,
+                    "id": None,  # Auto-increment, None until DB insert
+                },
+            ),
+            (
+                {
+                    "primary_image_id": "img-exact-001",
+                    "similarity_type": SimilarityType.EXACT,
+                    "confidence": 100,
+                },
+                {"similarity_type": SimilarityType.EXACT, "confidence": 100},
+            ),
+            (
+                {
+                    "primary_image_id": "img-reviewed",
+                    "similarity_type": SimilarityType.PERCEPTUAL,
+                    "confidence": 85,
+                    "reviewed": True,
+                },
+                {"reviewed": True},
+            ),
+        ],
+        ids=["creation", "defaults", "exact_match", "reviewed"],
+    )
+    def test_duplicate_group_fields(self, kwargs, expected, catalog_id):
+        group = DuplicateGroup(catalog_id=catalog_id, **kwargs)
         assert group.catalog_id == catalog_id
-        assert group.primary_image_id == "img-primary"
-        assert group.reviewed is False
-        assert group.id is None  # Auto-increment, None until DB insert
+        for name, value in expected.items():
+            assert getattr(group, name) == value
 
-    def test_duplicate_group_exact_match(self):
+    def test_duplicate_group_created_at_default(self, catalog_id):
         group = DuplicateGroup(
-            catalog_id=uuid.uuid4(),
-            primary_image_id="img-exact-001",
-            similarity_type=SimilarityType.EXACT,
-            confidence=100,
-        )
-        assert group.similarity_type == SimilarityType.EXACT
-        assert group.confidence == 100
-
-    def test_duplicate_group_reviewed(self):
-        group = DuplicateGroup(
-            catalog_id=uuid.uuid4(),
-            primary_image_id="img-reviewed",
-            similarity_type=SimilarityType.PERCEPTUAL,
-            confidence=85,
-            reviewed=True,
-        )
-        assert group.reviewed is True
-
-    def test_duplicate_group_created_at_default(self):
-        before = datetime.utcnow()
-        group = DuplicateGroup(
-            catalog_id=uuid.uuid4(),
+            catalog_id=catalog_id,
             primary_image_id="img-time",
             similarity_type=SimilarityType.PERCEPTUAL,
             confidence=90,
         )
-        after = datetime.utcnow()
-        assert before <= group.created_at <= after
+        assert group.created_at is None
+        assert DuplicateGroup.__table__.c.created_at.server_default is not None
 
 
 class TestDuplicateMember:
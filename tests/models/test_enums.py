@@ -0,0 +1,68 @@
+"""Tests for the model status and type enums."""
+
+import pytest
+
+from lumina.models.duplicate import SimilarityType
+from lumina.models.image import FileType, ProcessingStatus
+from lumina.models.job import BatchStatus, JobStatus
+from lumina.models.tag import TagSource
+
+
+@pytest.mark.parametrize(
+    "enum_cls, expected",
+    [
+        (SimilarityType, {"EXACT": "exact", "PERCEPTUAL": "perceptual"}),
+        (
+            ProcessingStatus,
+            {
+                "pending": "pending",
+                "scanning": "scanning",
+                "hashing": "hashing",
+                "tagging": "tagging",
+                "complete": "complete",
+                "failed": "failed",
+            },
+        ),
+        (FileType, {"image": "image", "video": "video"}),
+        (
+            JobStatus,
+            {
+                "PENDING": "pending",
+                "RUNNING": "running",
+                "SUCCESS": "success",
+                "FAILED": "failed",
+                "CANCELLED": "cancelled",
+            },
+        ),
+        (
+            BatchStatus,
+            {
+                "PENDING": "pending",
+                "RUNNING": "running",
+                "COMPLETED": "completed",
+                "FAILED": "failed",
+                "CANCELLED": "cancelled",
+            },
+        ),
+        (
+            TagSource,
+            {
+                "MANUAL": "manual",
+                "OPENCLIP": "openclip",
+                "OLLAMA": "ollama",
+                "COMBINED": "combined",
+            },
+        ),
+    ],
+    ids=[
+        "SimilarityType",
+        "ProcessingStatus",
+        "FileType",
+        "JobStatus",
+        "BatchStatus",
+        "TagSource",
+    ],
+)
+def test_enum_values(enum_cls, expected):
+    """Each enum should have exactly the expected members and values."""
+    assert {member.name: member.value for member in enum_cls} == expected
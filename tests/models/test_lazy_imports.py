@@ -0,0 +1,35 @@
+"""Tests for lazy model loading in lumina.models."""
+
+import subprocess
+import sys
+
+import pytest
+
+import lumina.models
+import lumina.models.all
+
+
+def test_package_import_skips_table_models():
+    """Test importing the package does not load the table modules."""
+    code = (
+        "import sys, lumina.models; "
+        "print(any(m in sys.modules for m in "
+        "('lumina.models.image', 'lumina.models.tag', 'lumina.models.job')))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
+
+
+def test_lazy_names_match_eager_module():
+    """Test every exported name resolves to the same object as models.all."""
+    assert set(lumina.models.__all__) == set(lumina.models.all.__all__)
+    for name in lumina.models.__all__:
+        assert getattr(lumina.models, name) is getattr(lumina.models.all, name)
+
+
+def test_unknown_attribute_raises():
+    """Test unknown names still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        lumina.models.NotAModel  # noqa: B018
@@ -0,0 +1,20 @@
+"""Tests for multiprocessing pool helpers."""
+
+from lumina.shared.parallel import MAX_POOL_CHUNKSIZE, pool_chunksize
+
+
+def test_pool_chunksize_small_inputs():
+    """Test small workloads are handed out one item at a time."""
+    assert pool_chunksize(0, 4) == 1
+    assert pool_chunksize(10, 4) == 1
+
+
+def test_pool_chunksize_scales_with_workers():
+    """Test mid-sized workloads get about four chunks per worker."""
+    assert pool_chunksize(160, 4) == 10
+
+
+def test_pool_chunksize_capped():
+    """Test large workloads never get chunks above the cap."""
+    assert pool_chunksize(1_000_000, 4) == MAX_POOL_CHUNKSIZE
+    assert pool_chunksize(1_000_000, 4, max_chunk=5) == 5